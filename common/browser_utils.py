@@ -2,9 +2,12 @@
 # -*- coding: utf-8 -*-
 import os
 import sys
+import time
 import atexit
 import shutil
 import tempfile
+import threading
+from contextlib import contextmanager
 
 from dotenv import load_dotenv
 from selenium import webdriver
@@ -12,6 +15,10 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 
+from common.timing import span
+from common.driver_cache import cached_driver_paths, invalidate as invalidate_driver_cache
+from common.driver_service import shared_driver_enabled, start_shared_session
+
 # .env varsa yükle, yoksa sorun etmeyelim
 load_dotenv(override=False)
 
@@ -23,12 +30,268 @@ def _truthy(env_val: str | None) -> bool:
         return False
     return str(env_val).strip().lower() in {"1", "true", "yes", "on"}
 
-def open_browser():
+# ---------- "lean" profil (BROWSER_PROFILE=lean): tek çekirdeğe daha çok tarayıcı ----------
+LEAN_WINDOW_SIZE = os.getenv("LEAN_WINDOW_SIZE", "960,600")
+LEAN_MAX_FPS     = int(os.getenv("LEAN_MAX_FPS", "30"))
+LEAN_JS_HEAP_MB  = int(os.getenv("LEAN_JS_HEAP_MB", "256"))
+
+# Üçüncü taraf izleyiciler (CDP Network.setBlockedURLs, * joker) → BLOCK_TRACKERS=1 ya da lean profil
+TRACKER_URLS = [
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*hotjar.com*", "*segment.io*", "*facebook.net*", "*clarity.ms*",
+]
+# Lobby'nin ihtiyaç duymadığı istekler (lean profil)
+LEAN_BLOCKED_URLS = ["*.woff", "*.woff2", "*.ttf", "*.otf"] + TRACKER_URLS
+# Görseller varsayılan olarak engellenmez: lobby kartları <img> tıklanarak açılır
+LEAN_IMAGE_URLS = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp"]
+
+# requestAnimationFrame'i LEAN_MAX_FPS'e kısar: izin verilen karedeki tüm callback'ler aynı timestamp'le
+# çalışır, arada kalan kareler bir sonrakine ertelenir (oyun döngüsü yarı hızda, CPU yarıya)
+FPS_CAP_JS = """
+(() => {
+  if (window.__FPS_CAP__) return;
+  window.__FPS_CAP__ = %d;
+  const raf = window.requestAnimationFrame.bind(window), minGap = 1000 / window.__FPS_CAP__ - 1;
+  let last = -Infinity;
+  window.requestAnimationFrame = (cb) => raf(function gate(t) {
+    if (t !== last && t - last < minGap) return raf(gate);
+    last = t;
+    cb(t);
+  });
+})();
+"""
+
+# ---------- Kalıcı asset cache (ASSET_CACHE=1) ----------
+# Chrome disk cache'i aynı anda tek süreç kullanabilir → paylaşılan "seed":
+#   açılışta seed profilin cache dizinine kopyalanır (destekleyen dosya sisteminde reflink/CoW, yoksa
+#   shutil.copy2). Kapanışta seed yoksa ya da damgası ASSET_CACHE_REFRESH_SEC'ten eskiyse, tek bir süreç
+#   (ASSET_CACHE_DIR.promoting talebi) bu profilin cache'ini yeni seed yapar; diğerleri kopyalamaz.
+#   Seed okuma (paylaşımlı) ile seed değiştirme (özel) ASSET_CACHE_DIR.lock üzerinde kilitlenir.
+# ASSET_CACHE_LINK=1 → kopya yerine hard-link (opt-in): Chrome'un simple cache'i entry dosyalarını
+#   yerinde yeniden yazar (ör. revalidation sonrası header güncellemesi), bu durumda seed ve seedi
+#   paylaşan diğer profiller de değişir. Yalnızca tek tarayıcılı / kısa ömürlü koşularda kullanın.
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+ASSET_CACHE_DIR = os.getenv("ASSET_CACHE_DIR") or os.path.join(ROOT, ".asset_cache")
+ASSET_CACHE_REFRESH_SEC = int(os.getenv("ASSET_CACHE_REFRESH_SEC", "86400"))
+_PROMOTE_CLAIM_STALE_SEC = 600          # çöken bir sürecin bıraktığı talep bu süreden sonra geçersiz
+_FICLONE = 0x40049409                   # Linux ioctl: reflink (btrfs, XFS, bcachefs …)
+
+def asset_cache_enabled() -> bool:
+    return _truthy(os.getenv("ASSET_CACHE"))
+
+def _seed_stamp() -> str:
+    """Seed'in yazılma zamanı dizin dışında tutulur: dizin mtime'ı içerik tazeliğini göstermez."""
+    return f"{ASSET_CACHE_DIR}.stamp"
+
+@contextmanager
+def _seed_lock(exclusive: bool):
+    """ASSET_CACHE_DIR.lock üzerinde flock; fcntl olmayan platformda kilitsiz (en iyi çaba)."""
+    try:
+        import fcntl
+    except ImportError:
+        yield
+        return
+    os.makedirs(os.path.dirname(os.path.abspath(ASSET_CACHE_DIR)), exist_ok=True)
+    with open(f"{ASSET_CACHE_DIR}.lock", "a") as fh:
+        fcntl.flock(fh, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(fh, fcntl.LOCK_UN)
+
+def _reflink_or_copy(src, dst):
+    """Bağımsız kopya: mümkünse reflink (blok paylaşır ama yazınca ayrışır), değilse copy2."""
+    try:
+        import fcntl
+        with open(src, "rb") as fs, open(dst, "wb") as fd:
+            fcntl.ioctl(fd.fileno(), _FICLONE, fs.fileno())
+        shutil.copystat(src, dst)
+    except (ImportError, OSError):
+        shutil.copy2(src, dst)
+
+def _link_or_copy(src, dst):
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+def _seed_fresh() -> bool:
+    try:
+        return os.path.isdir(ASSET_CACHE_DIR) and \
+            time.time() - os.path.getmtime(_seed_stamp()) < ASSET_CACHE_REFRESH_SEC
+    except OSError:
+        return False
+
+def seed_profile_cache(cache_dir):
+    """Seed varsa profilin cache dizinine kopyalar (ASSET_CACHE_LINK=1 → hard-link); yoksa ya da okunamazsa False."""
+    if not os.path.isdir(ASSET_CACHE_DIR):
+        return False
+    copy_fn = _link_or_copy if _truthy(os.getenv("ASSET_CACHE_LINK")) else _reflink_or_copy
+    with _seed_lock(exclusive=False):
+        try:
+            shutil.copytree(ASSET_CACHE_DIR, cache_dir, copy_function=copy_fn, dirs_exist_ok=True)
+            return True
+        except (OSError, shutil.Error):
+            shutil.rmtree(cache_dir, ignore_errors=True)    # yarım cache yerine boş (soğuk) cache
+            return False
+
+def _claim_promotion() -> str | None:
+    """Tazeleme hakkını tek sürece verir (O_EXCL talep dosyası); alınamazsa None."""
+    claim = f"{ASSET_CACHE_DIR}.promoting"
+    try:
+        if time.time() - os.path.getmtime(claim) > _PROMOTE_CLAIM_STALE_SEC:
+            os.remove(claim)
+    except OSError:
+        pass
+    try:
+        os.close(os.open(claim, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        return claim
+    except OSError:
+        return None
+
+def promote_profile_cache(cache_dir):
+    """
+    Tarayıcı kapandıktan sonra: yalnızca seed eksik/eskiyse ve tazeleme hakkını bu süreç aldıysa
+    cache'i yeni seed yapar. Diğer her durumda kopya yapılmaz.
+    """
+    if _seed_fresh() or not os.path.isdir(cache_dir) or not os.listdir(cache_dir):
+        return False
+    claim = _claim_promotion()
+    if claim is None:
+        return False                             # başka bir süreç tazeliyor
+    tag = f"{os.getpid()}.{threading.get_ident()}"
+    tmp, old = f"{ASSET_CACHE_DIR}.{tag}.tmp", f"{ASSET_CACHE_DIR}.{tag}.old"
+    try:
+        if _seed_fresh():
+            return False                         # talep alınırken başka bir süreç tazeledi
+        shutil.copytree(cache_dir, tmp, copy_function=_reflink_or_copy)
+        with _seed_lock(exclusive=True):
+            if os.path.isdir(ASSET_CACHE_DIR):
+                os.rename(ASSET_CACHE_DIR, old)
+            os.rename(tmp, ASSET_CACHE_DIR)
+            with open(_seed_stamp(), "w") as fh:
+                fh.write(time.strftime("%Y-%m-%dT%H:%M:%S"))
+        return True
+    except OSError:
+        return False
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+        shutil.rmtree(old, ignore_errors=True)
+        try:
+            os.remove(claim)
+        except OSError:
+            pass
+
+def add_disabled_features(opts, *features):
+    """
+    --disable-features listesine ekler. Chrome yalnızca SON --disable-features anahtarını uygular;
+    lean profil ile CDP yakalama gibi ayrı ayrı ekleyenlerin listeleri tek anahtarda birleştirilir.
+    """
+    prefix = "--disable-features="
+    merged = []
+    for arg in list(opts.arguments):
+        if arg.startswith(prefix):
+            merged += arg[len(prefix):].split(",")
+            opts.arguments.remove(arg)
+    merged = list(dict.fromkeys(f.strip() for f in merged + list(features) if f.strip()))
+    opts.add_argument(prefix + ",".join(merged))
+    return opts
+
+def disable_site_isolation(opts):
+    """Cross-origin oyun iframe'ini ayrı (OOPIF) renderer yerine sayfanın sürecinde tutar."""
+    add_disabled_features(opts, "IsolateOrigins", "site-per-process")
+    if "--disable-site-isolation-trials" not in opts.arguments:
+        opts.add_argument("--disable-site-isolation-trials")
+    return opts
+
+def lean_profile_enabled() -> bool:
+    return (os.getenv("BROWSER_PROFILE") or "").strip().lower() == "lean"
+
+def lean_options(opts):
+    """
+    Gereksiz alt sistemler kapalı, düşük çözünürlük, renderer başına JS heap sınırı.
+    Site isolation kapalı: oyun iframe'i sayfanın renderer'ında kalır → hem tarayıcı başına bir renderer
+    süreci eksik, hem de FPS_CAP_JS (Page.addScriptToEvaluateOnNewDocument, yalnızca üst hedefteki
+    frame'lere uygulanır) canvas'ın bulunduğu iframe'e de ulaşır.
+    """
+    for arg in (
+        "--force-device-scale-factor=1",
+        "--disable-extensions", "--disable-sync", "--disable-background-networking",
+        "--disable-component-update", "--disable-default-apps", "--disable-domain-reliability",
+        "--disable-client-side-phishing-detection", "--disable-breakpad", "--metrics-recording-only",
+        f"--js-flags=--max-old-space-size={LEAN_JS_HEAP_MB}",
+    ):
+        opts.add_argument(arg)
+    add_disabled_features(opts, "Translate", "OptimizationHints", "MediaRouter", "AutofillServerCommunication")
+    disable_site_isolation(opts)
+    opts.add_experimental_option("prefs", {"translate": {"enabled": False}})
+    return opts
+
+def blocked_url_patterns(lean: bool) -> list:
+    """Profil + env'e göre engellenecek URL desenleri (LEAN_BLOCK: virgülle ek desenler)."""
+    if lean:
+        blocked = LEAN_BLOCKED_URLS + (LEAN_IMAGE_URLS if _truthy(os.getenv("LEAN_BLOCK_IMAGES")) else [])
+    else:
+        blocked = list(TRACKER_URLS) if _truthy(os.getenv("BLOCK_TRACKERS")) else []
+    blocked += [u.strip() for u in (os.getenv("LEAN_BLOCK") or "").split(",") if u.strip()]
+    return blocked
+
+def apply_url_blocking(driver, patterns):
+    if not patterns:
+        return
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+    except Exception as e:
+        print(f"UYARI: URL engelleme uygulanamadı: {e}", file=sys.stderr)
+
+def apply_lean_runtime(driver):
+    """Driver açıldıktan sonra: FPS sınırı (her yeni dokümanda; site isolation kapalı → oyun iframe'i dahil)."""
+    try:
+        if LEAN_MAX_FPS > 0:
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": FPS_CAP_JS % LEAN_MAX_FPS})
+    except Exception as e:
+        print(f"UYARI: lean profil CDP ayarları uygulanamadı: {e}", file=sys.stderr)
+
+def _start_chrome(opts):
+    """SHARED_DRIVER/DRIVER_URL → paylaşılan servis; değilse önbellekteki yollar, olmazsa eski zincir."""
+    if shared_driver_enabled():
+        return start_shared_session(opts)
+    paths = cached_driver_paths()
+    if paths:
+        if paths.get("browser_path"):
+            opts.binary_location = paths["browser_path"]
+        try:
+            return webdriver.Chrome(service=Service(executable_path=paths["driver_path"]), options=opts)
+        except Exception as cache_err:
+            print(f"UYARI: önbellekteki driver ile başlatılamadı, yeniden çözülecek: {cache_err}", file=sys.stderr)
+            invalidate_driver_cache()
+            opts.binary_location = ""
+    try:
+        # Selenium 4.6+ → otomatik chromedriver yönetimi
+        return webdriver.Chrome(options=opts)
+    except Exception as sm_err:
+        # Fallback: webdriver_manager (opsiyonel)
+        try:
+            from webdriver_manager.chrome import ChromeDriverManager
+            service = Service(ChromeDriverManager().install())
+            return webdriver.Chrome(service=service, options=opts)
+        except Exception as wdm_err:
+            print("Chrome driver başlatılamadı.\n"
+                  f"Selenium Manager hatası: {sm_err}\n"
+                  f"webdriver_manager hatası: {wdm_err}", file=sys.stderr)
+            raise
+
+def open_browser(options_hook=None):
     """
     - HEADLESS = 1/true ise headless-new
     - Her koşumda benzersiz Chrome profili (--user-data-dir) açılır (CI hatası: 'user data dir in use' çözümü)
     - .env/ENV yoksa DEFAULT_BASE_URL kullanılır (hata yerine uyarı mantığı)
-    - Önce Selenium Manager ile dener; olmazsa webdriver_manager fallback
+    - Önce önbellekteki driver yollarını (common/driver_cache) dener; sonra Selenium Manager, en son webdriver_manager
+    - options_hook(opts): çağırana özel ek Chrome ayarları (ör. CDP ağ yakalama)
+    - BROWSER_PROFILE=lean → küçük pencere, kapalı alt sistemler, font/analytics engeli, FPS sınırı
+    - SHARED_DRIVER=1 / DRIVER_URL → tek chromedriver'a (ya da Grid'e) oturum olarak bağlanır
+    - ASSET_CACHE=1 → profil cache'i paylaşılan seed'den sıcak başlar; BLOCK_TRACKERS=1 → izleyiciler engellenir
     """
     base_url = (os.getenv("BASE_URL") or DEFAULT_BASE_URL).strip()
     if not base_url:
@@ -38,16 +301,19 @@ def open_browser():
     headless = _truthy(os.getenv("HEADLESS"))
     timeout = int(os.getenv("DEFAULT_TIMEOUT", "25"))
 
+    lean = lean_profile_enabled()
     opts = Options()
 
     if headless:
         # Headless CI
         opts.add_argument("--headless=new")
-        opts.add_argument("--window-size=1366,900")
+        opts.add_argument(f"--window-size={LEAN_WINDOW_SIZE if lean else '1366,900'}")
         opts.add_argument("--hide-scrollbars")
         # WebGL/canvas için daha stabil
         opts.add_argument("--use-gl=swiftshader")
         opts.add_argument("--disable-gpu")
+    elif lean:
+        opts.add_argument(f"--window-size={LEAN_WINDOW_SIZE}")
     else:
         # Lokal çalıştırma
         opts.add_argument("--start-maximized")
@@ -55,10 +321,19 @@ def open_browser():
 
     # Her koşum için benzersiz profil → profil çakışması çözüldü
     tmp_profile = tempfile.mkdtemp(prefix="chrome-profile-")
-    atexit.register(lambda: shutil.rmtree(tmp_profile, ignore_errors=True))
+    cache_dir = os.path.join(tmp_profile, "cache")
+    use_asset_cache = asset_cache_enabled()
+    if use_asset_cache:
+        seed_profile_cache(cache_dir)
+
+    def _cleanup_profile():
+        if use_asset_cache:
+            promote_profile_cache(cache_dir)
+        shutil.rmtree(tmp_profile, ignore_errors=True)
+    atexit.register(_cleanup_profile)
     opts.add_argument(f"--user-data-dir={tmp_profile}")
     opts.add_argument(f"--data-path={os.path.join(tmp_profile, 'data-path')}")
-    opts.add_argument(f"--disk-cache-dir={os.path.join(tmp_profile, 'cache')}")
+    opts.add_argument(f"--disk-cache-dir={cache_dir}")
     opts.add_argument("--no-first-run")
     opts.add_argument("--no-default-browser-check")
     opts.add_argument("--password-store=basic")
@@ -71,24 +346,21 @@ def open_browser():
     opts.add_argument("--remote-debugging-port=0")
     opts.add_argument("--lang=en-US,en")
 
-    # --- Driver oluşturma (önce Selenium Manager, sonra fallback) ---
-    driver = None
-    try:
-        # Selenium 4.6+ → otomatik chromedriver yönetimi
-        driver = webdriver.Chrome(options=opts)
-    except Exception as sm_err:
-        # Fallback: webdriver_manager (opsiyonel)
-        try:
-            from webdriver_manager.chrome import ChromeDriverManager
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=opts)
-        except Exception as wdm_err:
-            print("Chrome driver başlatılamadı.\n"
-                  f"Selenium Manager hatası: {sm_err}\n"
-                  f"webdriver_manager hatası: {wdm_err}", file=sys.stderr)
-            raise
+    if lean:
+        lean_options(opts)
+    if options_hook:
+        options_hook(opts)
+
+    # --- Driver oluşturma (önbellekteki yollar → Selenium Manager → webdriver_manager) ---
+    with span("driver_startup"):
+        driver = _start_chrome(opts)
+
+    apply_url_blocking(driver, blocked_url_patterns(lean))
+    if lean:
+        apply_lean_runtime(driver)
 
     # Siteye git ve WebDriverWait döndür
-    driver.get(base_url)
+    with span("page_load"):
+        driver.get(base_url)
     wait = WebDriverWait(driver, timeout)
     return driver, wait
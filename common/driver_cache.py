@@ -0,0 +1,138 @@
+# common/driver_cache.py
+# -*- coding: utf-8 -*-
+"""
+chromedriver / Chrome yolu önbelleği (makine başına bir dosya).
+
+İlk açılışta yollar Selenium Manager ile (olmazsa webdriver_manager ile) çözülür ve sürümleriyle
+birlikte DRIVER_CACHE dosyasına yazılır. Sonraki açılışlar yalnızca dosyayı okuyup iki binary'nin
+boyut/mtime parmak izini karşılaştırır → Service(executable_path=...) ile Selenium Manager atlanır.
+Chrome/driver güncellenirse parmak izi tutmaz ve yollar yeniden çözülür.
+
+    python -m common.driver_cache            # önbellekteki kaydı göster (yoksa çöz)
+    python -m common.driver_cache --refresh  # yeniden çöz ve yaz
+
+DRIVER_CACHE=off → önbellek kapalı (eski davranış: her açılışta Selenium Manager).
+"""
+import os
+import re
+import sys
+import json
+import time
+import threading
+import subprocess
+
+DRIVER_CACHE = os.getenv("DRIVER_CACHE") or os.path.join(
+    os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "dracopanel", "driver_paths.json")
+
+_lock = threading.Lock()
+_memo: dict | None = None
+
+def cache_enabled() -> bool:
+    return DRIVER_CACHE.strip().lower() not in {"0", "off", "false", "no"}
+
+def _fingerprint(path: str) -> list | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_size, int(st.st_mtime)]
+
+def _binary_version(path: str) -> str:
+    """`<binary> --version` çıktısındaki sürüm (ör. 126.0.6478.126); okunamazsa ""."""
+    try:
+        out = subprocess.run([path, "--version"], capture_output=True, text=True, timeout=15).stdout
+    except (OSError, subprocess.SubprocessError):
+        return ""
+    m = re.search(r"(\d+\.\d+\.\d+\.\d+)", out or "")
+    return m.group(1) if m else ""
+
+def _major(version: str) -> str:
+    return version.split(".", 1)[0] if version else ""
+
+def _valid(entry: dict) -> bool:
+    if not entry or not entry.get("driver_path"):
+        return False
+    if _fingerprint(entry["driver_path"]) != entry.get("driver_fp"):
+        return False
+    browser = entry.get("browser_path")
+    return not browser or _fingerprint(browser) == entry.get("browser_fp")
+
+def resolve_paths() -> dict | None:
+    """Selenium Manager → webdriver_manager sırasıyla yolları çözer; ikisi de olmazsa None."""
+    driver_path = browser_path = ""
+    try:
+        from selenium.webdriver.common.selenium_manager import SeleniumManager
+        out = SeleniumManager().binary_paths(["--browser", "chrome"])
+        driver_path, browser_path = out.get("driver_path") or "", out.get("browser_path") or ""
+    except Exception as sm_err:
+        try:
+            from webdriver_manager.chrome import ChromeDriverManager
+            driver_path = ChromeDriverManager().install()
+        except Exception as wdm_err:
+            print("UYARI: driver yolu çözülemedi.\n"
+                  f"Selenium Manager hatası: {sm_err}\n"
+                  f"webdriver_manager hatası: {wdm_err}", file=sys.stderr)
+            return None
+    if not os.path.isfile(driver_path):
+        return None
+    if browser_path and not os.path.isfile(browser_path):
+        browser_path = ""
+    entry = {"driver_path": driver_path, "driver_fp": _fingerprint(driver_path),
+             "driver_version": _binary_version(driver_path),
+             "browser_path": browser_path, "browser_fp": _fingerprint(browser_path) if browser_path else None,
+             "browser_version": _binary_version(browser_path) if browser_path else "",
+             "resolved_at": time.strftime("%Y-%m-%dT%H:%M:%S")}
+    d_major, b_major = _major(entry["driver_version"]), _major(entry["browser_version"])
+    if d_major and b_major and d_major != b_major:
+        print(f"UYARI: chromedriver {entry['driver_version']} ile Chrome {entry['browser_version']} "
+              "ana sürümü uyuşmuyor; önbelleğe yazılmadı.", file=sys.stderr)
+        return None
+    return entry
+
+def _load() -> dict | None:
+    try:
+        with open(DRIVER_CACHE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _save(entry: dict):
+    os.makedirs(os.path.dirname(os.path.abspath(DRIVER_CACHE)), exist_ok=True)
+    tmp = f"{DRIVER_CACHE}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(entry, f, indent=2)
+    os.replace(tmp, DRIVER_CACHE)
+
+def cached_driver_paths(refresh: bool = False) -> dict | None:
+    """Geçerli kayıt: süreç içi memo → dosya → yeniden çözüm. Önbellek kapalıysa ya da çözülemezse None."""
+    global _memo
+    if not cache_enabled():
+        return None
+    with _lock:
+        if not refresh and _memo is not None:
+            return _memo
+        entry = None if refresh else _load()
+        if not _valid(entry):
+            entry = resolve_paths()
+            if entry:
+                try:
+                    _save(entry)
+                except OSError as e:
+                    print(f"UYARI: driver önbelleği yazılamadı ({DRIVER_CACHE}): {e}", file=sys.stderr)
+        _memo = entry
+        return entry
+
+def invalidate():
+    """Kayıtlı yollarla başlatma başarısızsa: memo + dosya silinir, sonraki açılış yeniden çözer."""
+    global _memo
+    with _lock:
+        _memo = None
+        try:
+            os.remove(DRIVER_CACHE)
+        except OSError:
+            pass
+
+if __name__ == "__main__":
+    entry = cached_driver_paths(refresh="--refresh" in sys.argv[1:])
+    print(json.dumps(entry, indent=2) if entry else f"driver yolu çözülemedi (DRIVER_CACHE={DRIVER_CACHE})")
+    sys.exit(0 if entry else 1)
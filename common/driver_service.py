@@ -0,0 +1,138 @@
+# common/driver_service.py
+# -*- coding: utf-8 -*-
+"""
+Paylaşılan chromedriver servisi: süreç başına tek chromedriver, oturumlar ona Remote ile bağlanır.
+
+  SHARED_DRIVER=1   → ilk açılışta tek Service başlatılır; sonraki her open_browser yalnızca yeni
+                      oturum açar (N tarayıcı + 1 chromedriver). Her oturumdan önce /status
+                      kontrolü yapılır; süreç ölmüşse ya da cevap vermiyorsa servis yeniden başlatılır.
+  DRIVER_URL=http://127.0.0.1:9515
+                    → dışarıda çalışan chromedriver (`chromedriver --port=9515`) ya da Selenium Grid
+                      uç noktası; birden çok süreç aynı servisi paylaşabilir. Burada yeniden başlatma
+                      yapılmaz, sağlık kontrolü DRIVER_HEALTH_RETRIES kez beklenir.
+
+CDP komutları (execute_cdp_cmd) ChromiumRemoteConnection üzerinden aynen çalışır. webdriver.Remote'ta
+get_log yoktur; SharedChrome onu chromedriver'ın getLog komutuyla ekler (PLAY_CAPTURE=cdp performance log'u).
+"""
+import os
+import sys
+import json
+import time
+import atexit
+import threading
+import urllib.request
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+
+from common.driver_cache import cached_driver_paths
+
+DRIVER_HEALTH_TIMEOUT = float(os.getenv("DRIVER_HEALTH_TIMEOUT", "2"))
+DRIVER_HEALTH_RETRIES = int(os.getenv("DRIVER_HEALTH_RETRIES", "3"))
+
+def driver_url() -> str:
+    return (os.getenv("DRIVER_URL") or "").strip().rstrip("/")
+
+def shared_driver_enabled() -> bool:
+    return bool(driver_url()) or (os.getenv("SHARED_DRIVER") or "").strip().lower() in {"1", "true", "yes", "on"}
+
+def status_ok(url: str, timeout: float = DRIVER_HEALTH_TIMEOUT) -> bool:
+    """W3C /status → value.ready (Grid ve chromedriver ikisi de destekler)."""
+    try:
+        with urllib.request.urlopen(f"{url}/status", timeout=timeout) as resp:
+            return bool((json.loads(resp.read() or b"{}").get("value") or {}).get("ready"))
+    except (OSError, ValueError):
+        return False
+
+class SharedDriverService:
+    """Süreç içinde tek chromedriver; thread-safe, tembel başlatma + çökünce yeniden başlatma."""
+
+    def __init__(self):
+        self._service: Service | None = None
+        self._lock = threading.Lock()
+        self.restarts = 0
+
+    def _alive(self) -> bool:
+        svc = self._service
+        return svc is not None and svc.process is not None and svc.process.poll() is None
+
+    def healthy(self) -> bool:
+        return self._alive() and status_ok(self._service.service_url)
+
+    def _start(self):
+        paths = cached_driver_paths()
+        if paths:
+            path = paths["driver_path"]
+        else:
+            from selenium.webdriver.chrome.options import Options
+            from selenium.webdriver.common.driver_finder import DriverFinder
+            path = DriverFinder(Service(), Options()).get_driver_path()
+        svc = Service(executable_path=path)
+        svc.start()
+        self._service = svc
+        print(f"🚗 shared chromedriver started (pid={svc.process.pid}, {svc.service_url})", file=sys.stderr)
+
+    def url(self) -> str:
+        """Sağlıklı servisin adresi; gerekirse (ilk çağrı / çökme) başlatır."""
+        with self._lock:
+            if not self.healthy():
+                if self._service is not None:
+                    print("⚠️ shared chromedriver unhealthy → restarting", file=sys.stderr)
+                    self.restarts += 1
+                self._stop_locked()
+                self._start()
+            return self._service.service_url
+
+    def _stop_locked(self):
+        svc, self._service = self._service, None
+        if svc is not None:
+            try:
+                svc.stop()
+            except Exception:
+                pass
+
+    def stop(self):
+        with self._lock:
+            self._stop_locked()
+
+_shared = SharedDriverService()
+atexit.register(_shared.stop)
+
+class SharedChrome(webdriver.Remote):
+    """Remote oturum + webdriver.Chrome'daki get_log (ChromiumRemoteConnection getLog'u kaydeder)."""
+
+    def get_log(self, log_type):
+        return self.execute("getLog", {"type": log_type})["value"]
+
+    @property
+    def log_types(self):
+        return self.execute("getAvailableLogTypes")["value"]
+
+def remote_chrome(url: str, opts):
+    conn = ChromiumRemoteConnection(url, vendor_prefix="goog", browser_name="chrome")
+    return SharedChrome(command_executor=conn, options=opts)
+
+def _wait_external(url: str):
+    for attempt in range(max(1, DRIVER_HEALTH_RETRIES)):
+        if status_ok(url):
+            return
+        time.sleep(min(2.0, 0.5 * (attempt + 1)))
+    raise RuntimeError(f"DRIVER_URL sağlıksız ya da erişilemez: {url}")
+
+def start_shared_session(opts):
+    """Paylaşılan servis (ya da DRIVER_URL) üzerinde yeni Chrome oturumu açar."""
+    external = driver_url()
+    if external:
+        _wait_external(external)
+        return remote_chrome(external, opts)
+    paths = cached_driver_paths()
+    if paths and paths.get("browser_path"):
+        opts.binary_location = paths["browser_path"]
+    try:
+        return remote_chrome(_shared.url(), opts)
+    except Exception:
+        # oturum hatası servis çöküşünden geliyorsa bir kez yeniden başlatıp dene; değilse hatayı aynen ilet
+        if _shared.healthy():
+            raise
+        return remote_chrome(_shared.url(), opts)
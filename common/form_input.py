@@ -0,0 +1,68 @@
+# common/form_input.py
+# -*- coding: utf-8 -*-
+"""
+Form doldurma stratejisi (login.py, register.py ve harness login'i ortak kullanır).
+
+  human   → karakter karakter send_keys + karakter arası rastgele gecikme (gerçek kullanıcıya yakın)
+  bulk    → tüm metin tek send_keys çağrısıyla (tek WebDriver round trip'i)
+  instant → native value setter + input/change event'leri (React kontrollü input'lar değeri görür)
+
+Seçim: INPUT_MODE env'i ya da script'lerin --input bayrağı (set_input_mode). Env verilmemişse
+her çağıran kendi varsayılanını kullanır (login.py/register.py: human, harness do_login: bulk).
+"""
+import os
+import time
+import random
+
+INPUT_MODES = ("human", "bulk", "instant")
+
+def _checked_mode(mode, source="input modu"):
+    """Boş → None; tanınmayan değer sessizce human'a düşmesin diye ValueError."""
+    mode = (mode or "").strip().lower() or None
+    if mode is not None and mode not in INPUT_MODES:
+        raise ValueError(f"geçersiz {source}: {mode!r} (beklenen: {', '.join(INPUT_MODES)})")
+    return mode
+
+_mode = _checked_mode(os.getenv("INPUT_MODE"), "INPUT_MODE")
+
+SET_VALUE_JS = """
+    const [el, value] = arguments;
+    const proto = el instanceof window.HTMLTextAreaElement ? window.HTMLTextAreaElement : window.HTMLInputElement;
+    Object.getOwnPropertyDescriptor(proto.prototype, "value").set.call(el, value);
+    el.dispatchEvent(new Event("input", {bubbles: true}));
+    el.dispatchEvent(new Event("change", {bubbles: true}));
+"""
+
+def set_input_mode(mode):
+    global _mode
+    _mode = _checked_mode(mode)
+
+def input_mode(default="human"):
+    """Seçili mod; env/CLI ile seçilmemişse çağıranın varsayılanı."""
+    return _mode or default
+
+def is_human(default="human"):
+    return input_mode(default) == "human"
+
+def clear_input(driver, el, default="human"):
+    if input_mode(default) == "instant":
+        driver.execute_script(SET_VALUE_JS, el, "")
+    else:
+        el.clear()
+    return el
+
+def fill(driver, el, text, clear=True, gap=(0.03, 0.09), default="human"):
+    """Elemana `text` yazar; gap yalnızca human modda karakter arası bekleme aralığıdır (sn)."""
+    mode = input_mode(default)
+    if mode == "instant":
+        driver.execute_script(SET_VALUE_JS, el, text)
+        return el
+    if clear:
+        el.clear()
+    if mode == "bulk":
+        el.send_keys(text)
+        return el
+    for ch in text:
+        el.send_keys(ch)
+        time.sleep(random.uniform(*gap))
+    return el
@@ -0,0 +1,184 @@
+# common/timing.py
+# -*- coding: utf-8 -*-
+"""
+Faz bazlı süre ölçümü ve koşu raporu.
+
+  - span("login", game="dice") ya da record("bet_result", ms, game="dice") → JSON-lines
+  - Dosya: REPORT_DIR/spans-<run_id>-<script>-<pid>.jsonl (her süreç kendi dosyasına yazar)
+  - main.py RUN_ID'yi çocuklara geçirir; koşu sonunda summarize_run() faz/oyun başına p50/p95/max üretir
+  - "backend" fazı (yakalanan /v1/play çağrıları) ayrıca oyun başına HDR tarzı log-lineer histograma dökülür
+"""
+import os
+import sys
+import json
+import glob
+import math
+import time
+import secrets
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+REPORT_DIR = os.getenv("REPORT_DIR") or os.path.join(ROOT, "reports")
+
+_lock = threading.Lock()
+
+def run_id() -> str:
+    """
+    main.py'nin verdiği RUN_ID; tek başına koşulan script'te ilk çağrıda üretilir.
+    Milisaniye + kısa rastgele ek: aynı saniyede başlayan koşular (paralel CI işleri, art arda
+    yük kademeleri) aynı spans dosyasına yazmaz.
+    """
+    rid = os.getenv("RUN_ID")
+    if not rid:
+        now = datetime.now()
+        rid = f"{now:%Y%m%d_%H%M%S}_{now.microsecond // 1000:03d}_{secrets.token_hex(2)}"
+        os.environ["RUN_ID"] = rid
+    return rid
+
+def _script() -> str:
+    return os.path.splitext(os.path.basename(sys.argv[0] or "python"))[0] or "python"
+
+def _spans_file() -> str:
+    return os.path.join(REPORT_DIR, f"spans-{run_id()}-{_script()}-{os.getpid()}.jsonl")
+
+def record(phase: str, ms: float, game: str | None = None, **extra):
+    """Tek bir ölçümü (milisaniye) yazar; raporlama hataları testi asla düşürmez."""
+    row = {"run_id": run_id(), "script": _script(), "game": game, "phase": phase,
+           "ms": round(float(ms), 2), "ts": time.time(), **extra}
+    try:
+        with _lock:
+            os.makedirs(REPORT_DIR, exist_ok=True)
+            with open(_spans_file(), "a", encoding="utf-8") as f:
+                f.write(json.dumps(row, ensure_ascii=False) + "\n")
+    except OSError:
+        pass
+
+def record_many(rows):
+    """[(phase, ms, game, extra_dict), ...] → tek dosya açılışıyla yazar (yoğun protokol koşuları için)."""
+    base = {"run_id": run_id(), "script": _script(), "ts": time.time()}
+    lines = [json.dumps({**base, "game": game, "phase": phase, "ms": round(float(ms), 2), **(extra or {})},
+                        ensure_ascii=False) for phase, ms, game, extra in rows]
+    if not lines:
+        return
+    try:
+        with _lock:
+            os.makedirs(REPORT_DIR, exist_ok=True)
+            with open(_spans_file(), "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+    except OSError:
+        pass
+
+@contextmanager
+def span(phase: str, game: str | None = None, **extra):
+    """with span("open_game", game="dice"): ...  → süre + ok (exception olduysa False)."""
+    t0 = time.perf_counter()
+    ok = False
+    try:
+        yield
+        ok = True
+    finally:
+        record(phase, (time.perf_counter() - t0) * 1000, game=game, ok=ok, **extra)
+
+# ---------- Aggregation ----------
+def load_spans(rid: str | None = None) -> list[dict]:
+    rows = []
+    for fp in sorted(glob.glob(os.path.join(REPORT_DIR, f"spans-{rid or run_id()}-*.jsonl"))):
+        with open(fp, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    rows.append(json.loads(line))
+                except ValueError:
+                    continue
+    return rows
+
+def percentile(values, p: float) -> float:
+    """Nearest-rank yüzdelik."""
+    if not values:
+        return 0.0
+    s = sorted(values)
+    k = max(0, min(len(s) - 1, math.ceil(p / 100.0 * len(s)) - 1))
+    return s[k]
+
+def _stats(values) -> dict:
+    return {"n": len(values), "p50": percentile(values, 50), "p95": percentile(values, 95), "max": max(values)}
+
+# ---------- Backend latency histogram ----------
+HIST_SUB_BUCKETS = 8  # 2'nin her kuvveti 8 eşit alt kovaya bölünür → kova genişliği değerin ≤ %12.5'i
+
+def hist_bucket(ms: float) -> float:
+    """Değerin düştüğü kovanın alt sınırı (ms); 1 ms altı tek kova."""
+    if ms < 1:
+        return 0.0
+    base = 2.0 ** math.floor(math.log2(ms))
+    width = base / HIST_SUB_BUCKETS
+    return base + math.floor((ms - base) / width) * width
+
+def histogram(values) -> list[list]:
+    """[[kova alt sınırı ms, adet], ...] (artan sırada, boş kovalar yazılmaz)."""
+    counts = {}
+    for v in values:
+        b = hist_bucket(v)
+        counts[b] = counts.get(b, 0) + 1
+    return [[b, n] for b, n in sorted(counts.items())]
+
+def _is_error(status) -> bool:
+    return not status or int(status) >= 400
+
+def summarize_backend(rows) -> dict:
+    """{game: {n, errors, p50, p90, p95, p99, max, ttfb_p50, ttfb_p95, bytes_p50, histogram}}"""
+    by_game = {}
+    for r in rows:
+        if r.get("phase") == "backend":
+            by_game.setdefault(r.get("game") or r.get("script"), []).append(r)
+    out = {}
+    for g, rs in sorted(by_game.items()):
+        total = [r["ms"] for r in rs]
+        ttfb = [r["ttfb_ms"] for r in rs if r.get("ttfb_ms") is not None]
+        out[g] = {
+            "n": len(rs),
+            "errors": sum(1 for r in rs if _is_error(r.get("status"))),
+            **{f"p{p}": percentile(total, p) for p in (50, 90, 95, 99)},
+            "max": max(total),
+            "ttfb_p50": percentile(ttfb, 50),
+            "ttfb_p95": percentile(ttfb, 95),
+            "bytes_p50": percentile([r.get("bytes") or 0 for r in rs], 50),
+            "histogram": histogram(total),
+        }
+    return out
+
+def summarize(rows) -> dict:
+    """{"by_phase": {phase: stats}, "by_game": {game: {phase: stats}}}; game yoksa script adı kullanılır."""
+    by_phase, by_game = {}, {}
+    for r in rows:
+        by_phase.setdefault(r["phase"], []).append(r["ms"])
+        by_game.setdefault(r.get("game") or r.get("script"), {}).setdefault(r["phase"], []).append(r["ms"])
+    return {
+        "by_phase": {ph: _stats(v) for ph, v in sorted(by_phase.items())},
+        "by_game": {g: {ph: _stats(v) for ph, v in sorted(phs.items())} for g, phs in sorted(by_game.items())},
+    }
+
+def format_summary(summary: dict) -> str:
+    lines = [f"{'phase':<20} {'n':>5} {'p50 ms':>10} {'p95 ms':>10} {'max ms':>10}"]
+    for ph, st in summary["by_phase"].items():
+        lines.append(f"{ph:<20} {st['n']:>5} {st['p50']:>10.0f} {st['p95']:>10.0f} {st['max']:>10.0f}")
+    if summary.get("backend"):
+        lines.append("")
+        lines.append(f"{'backend /v1/play':<20} {'n':>5} {'err':>5} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10} {'ttfb p50':>10}")
+        for g, st in summary["backend"].items():
+            lines.append(f"{g:<20} {st['n']:>5} {st['errors']:>5} {st['p50']:>10.0f} {st['p95']:>10.0f}"
+                         f" {st['p99']:>10.0f} {st['ttfb_p50']:>10.0f}")
+    return "\n".join(lines)
+
+def summarize_run(rid: str | None = None) -> dict | None:
+    """Koşunun span'lerini toplar, REPORT_DIR/summary-<run_id>.json yazar ve özeti döndürür."""
+    rid = rid or run_id()
+    rows = load_spans(rid)
+    if not rows:
+        return None
+    summary = {"run_id": rid, **summarize(rows), "backend": summarize_backend(rows)}
+    os.makedirs(REPORT_DIR, exist_ok=True)
+    with open(os.path.join(REPORT_DIR, f"summary-{rid}.json"), "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2, ensure_ascii=False)
+    return summary
@@ -1,14 +1,18 @@
 # common/user_data.py
-import json, os
+import json, os, time, socket, sqlite3, threading
+from contextlib import contextmanager
 
 # Dosyayı proje kökünde sabitle (cwd değişse de sorun olmasın)
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 FILE = os.path.join(ROOT, "test_user_data.json")
 
 def save_user_data(email, username, password):
+    """Varsayılan test kullanıcısını yazar. Hesap havuzuna eklemek çağıranın işidir (add_account)."""
     data = {"email": email, "username": username, "password": password}
-    with open(FILE, "w", encoding="utf-8") as f:
+    tmp = f"{FILE}.{os.getpid()}.{threading.get_ident()}.tmp"   # paralel register süreç/thread'leri yarım dosya bırakmasın
+    with open(tmp, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=2)
+    os.replace(tmp, FILE)
 
 def load_user_data():
     if not os.path.exists(FILE):
@@ -17,3 +21,183 @@ def load_user_data():
         )
     with open(FILE, "r", encoding="utf-8") as f:
         return json.load(f)
+
+# ---------- Oturum snapshot'ı (login'i atlamak için) ----------
+SESSION_FILE = os.path.join(ROOT, ".session_snapshot.json")
+SESSION_TTL_SEC = int(os.getenv("SESSION_TTL_SEC", "1800"))
+
+def save_session_snapshot(snapshot, ttl_sec=None):
+    """Snapshot'a created_at/expires_at ekleyip atomik olarak yazar (paralel süreçler yarım dosya görmez)."""
+    now = time.time()
+    data = {**snapshot, "created_at": now, "expires_at": now + (SESSION_TTL_SEC if ttl_sec is None else ttl_sec)}
+    tmp = f"{SESSION_FILE}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp, SESSION_FILE)
+    return data
+
+def load_session_snapshot(username, base_url):
+    """Geçerli snapshot'ı döndürür; yoksa, süresi dolmuşsa ya da başka kullanıcı/URL'e aitse None."""
+    if not os.path.exists(SESSION_FILE):
+        return None
+    try:
+        with open(SESSION_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get("username") != username or data.get("base_url") != base_url:
+        return None
+    if float(data.get("expires_at") or 0) <= time.time():
+        return None
+    return data
+
+def clear_session_snapshot():
+    try:
+        os.remove(SESSION_FILE)
+    except FileNotFoundError:
+        pass
+
+# ---------- Hesap havuzu (eşzamanlı oyuncular için) ----------
+# SQLite: süreçler arası kilit BEGIN IMMEDIATE ile; bir hesap aynı anda tek worker'a kiralanır.
+# Kiralama süresi dolan (çöken süreç) hesaplar tekrar kiralanabilir.
+ACCOUNTS_DB = os.getenv("ACCOUNTS_DB") or os.path.join(ROOT, "accounts.db")
+ACCOUNT_LEASE_TTL_SEC = int(os.getenv("ACCOUNT_LEASE_TTL_SEC", "3600"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS accounts (
+    username      TEXT PRIMARY KEY,
+    email         TEXT,
+    password      TEXT NOT NULL,
+    created_at    REAL NOT NULL,
+    leased_by     TEXT,
+    lease_expires REAL,
+    uses          INTEGER NOT NULL DEFAULT 0
+)
+"""
+
+@contextmanager
+def _db():
+    conn = sqlite3.connect(ACCOUNTS_DB, timeout=30, isolation_level=None)   # autocommit; işlem açıkça
+    try:
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(_SCHEMA)
+        yield conn
+    finally:
+        conn.close()
+
+def _owner():
+    return f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+
+def add_account(email, username, password):
+    """Hesabı havuza ekler (aynı kullanıcı adı varsa bilgileri günceller)."""
+    with _db() as conn:
+        conn.execute(
+            "INSERT INTO accounts (username, email, password, created_at) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(username) DO UPDATE SET email = excluded.email, password = excluded.password",
+            (username, email, password, time.time()),
+        )
+
+def import_user_data():
+    """Mevcut test_user_data.json'daki tekil hesabı havuza taşır (varsa)."""
+    try:
+        data = load_user_data()
+    except FileNotFoundError:
+        return False
+    add_account(data.get("email"), data["username"], data["password"])
+    return True
+
+def account_stats():
+    with _db() as conn:
+        row = conn.execute(
+            "SELECT COUNT(*) AS total, SUM(leased_by IS NOT NULL AND lease_expires > ?) AS leased FROM accounts",
+            (time.time(),),
+        ).fetchone()
+    return {"total": row["total"] or 0, "leased": row["leased"] or 0}
+
+def list_accounts():
+    with _db() as conn:
+        return [dict(r) for r in conn.execute("SELECT username, email, leased_by, lease_expires, uses FROM accounts "
+                                              "ORDER BY created_at")]
+
+def lease_account(owner=None, ttl_sec=None):
+    """Boştaki (ya da kiralaması süresi dolmuş) en az kullanılmış hesabı kilitler; yoksa None."""
+    owner = owner or _owner()
+    now = time.time()
+    with _db() as conn:
+        conn.execute("BEGIN IMMEDIATE")   # yazma kilidi: iki süreç aynı hesabı seçemez
+        try:
+            row = conn.execute(
+                "SELECT username, email, password FROM accounts "
+                "WHERE leased_by IS NULL OR lease_expires <= ? ORDER BY uses, created_at LIMIT 1",
+                (now,),
+            ).fetchone()
+            if row:
+                conn.execute(
+                    "UPDATE accounts SET leased_by = ?, lease_expires = ?, uses = uses + 1 WHERE username = ?",
+                    (owner, now + (ACCOUNT_LEASE_TTL_SEC if ttl_sec is None else ttl_sec), row["username"]),
+                )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+    return dict(row) if row else None
+
+def release_account(username, owner=None):
+    """Kiralamayı bırakır (yalnızca kiralayan owner bırakabilir)."""
+    with _db() as conn:
+        conn.execute("UPDATE accounts SET leased_by = NULL, lease_expires = NULL "
+                     "WHERE username = ? AND leased_by = ?", (username, owner or _owner()))
+
+def renew_lease(username, owner=None, ttl_sec=None) -> bool:
+    """Kiralamayı şimdiden ttl_sec kadar uzatır; hesap artık bu owner'da değilse False (kiralama kaybedildi)."""
+    ttl = ACCOUNT_LEASE_TTL_SEC if ttl_sec is None else ttl_sec
+    with _db() as conn:
+        cur = conn.execute("UPDATE accounts SET lease_expires = ? WHERE username = ? AND leased_by = ?",
+                           (time.time() + ttl, username, owner or _owner()))
+        return cur.rowcount == 1
+
+@contextmanager
+def lease_heartbeat(username, owner=None, ttl_sec=None):
+    """
+    Blok boyunca kiralamayı arka planda (TTL'in üçte birinde bir) yeniler: TTL'den uzun oyun/soak
+    koşularında hesap başka bir worker'a düşmez. Dönen Event kiralama kaybedilirse set edilir.
+    """
+    owner = owner or _owner()
+    ttl = ACCOUNT_LEASE_TTL_SEC if ttl_sec is None else ttl_sec
+    stop, lost = threading.Event(), threading.Event()
+
+    def _beat():
+        while not stop.wait(max(0.05, ttl / 3)):
+            try:
+                if not renew_lease(username, owner, ttl):
+                    lost.set()
+                    return
+            except sqlite3.Error:
+                pass                      # geçici kilit/IO hatası: bir sonraki vuruşta tekrar dene
+
+    t = threading.Thread(target=_beat, name=f"lease-heartbeat:{username}", daemon=True)
+    t.start()
+    try:
+        yield lost
+    finally:
+        stop.set()
+        t.join()
+
+@contextmanager
+def leased_account(timeout=60.0, poll=0.5):
+    """with leased_account() as acc: ... → hesap worker'a özel; blok bitince havuza döner."""
+    owner = _owner()
+    t_end = time.time() + timeout
+    acc = lease_account(owner)
+    while acc is None:
+        if time.time() >= t_end:
+            raise RuntimeError(f"hesap havuzunda boş hesap yok ({account_stats()}); "
+                               f"register.py ile havuzu büyütün")
+        time.sleep(poll)
+        acc = lease_account(owner)
+    try:
+        with lease_heartbeat(acc["username"], owner):
+            yield acc
+    finally:
+        release_account(acc["username"], owner)
@@ -0,0 +1,69 @@
+# harness/accounts.py
+# -*- coding: utf-8 -*-
+"""
+Hesap havuzu yönetimi (common/user_data → accounts.db).
+
+    python -m harness.accounts stats
+    python -m harness.accounts list
+    python -m harness.accounts import                 # test_user_data.json'daki hesabı havuza ekle
+    python -m harness.accounts top-up 20 --workers 4  # register.py akışıyla 20 yeni hesap
+    python -m harness.accounts top-up --min 50        # havuz 50'nin altındaysa eksik kadar
+"""
+import os
+import sys
+import logging
+import argparse
+import subprocess
+
+from common.form_input import INPUT_MODES
+from common.user_data import ROOT, ACCOUNTS_DB, account_stats, list_accounts, import_user_data
+
+LOG_FMT = "%(asctime)s | %(levelname)-7s | %(message)s"
+log = logging.getLogger("accounts")
+
+REGISTER_SCRIPT = os.path.join(ROOT, "register.py")
+
+def top_up(count: int, workers: int = 1, input_mode: str = "bulk") -> bool:
+    """
+    register.py toplu modunu (count hesap, `workers` tarayıcı) headless alt süreçte koşar. Hesaplar
+    yalnızca havuza eklenir; --bulk tek hesapta da test_user_data.json'ın üzerine yazılmasını önler.
+    """
+    if count <= 0:
+        return True
+    log.info(f"➕ registering {count} accounts ({workers} workers, input={input_mode})")
+    proc = subprocess.run([sys.executable, REGISTER_SCRIPT, "--count", str(count), "--workers", str(workers),
+                           "--bulk", "--input", input_mode], cwd=ROOT, env={**os.environ, "HEADLESS": "1"})
+    log.info(f"{'✅' if proc.returncode == 0 else '⚠️'} top-up finished (exit={proc.returncode}) → {account_stats()}")
+    return proc.returncode == 0
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=f"Account pool ({ACCOUNTS_DB})")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    sub.add_parser("stats")
+    sub.add_parser("list")
+    sub.add_parser("import", help="test_user_data.json'daki hesabı havuza ekle")
+    up = sub.add_parser("top-up", help="register.py akışıyla yeni hesaplar kaydet")
+    up.add_argument("count", type=int, nargs="?", default=0)
+    up.add_argument("--min", type=int, default=0, help="havuzu en az bu sayıya tamamla")
+    up.add_argument("--workers", type=int, default=int(os.getenv("WORKERS", "1") or 1))
+    up.add_argument("--input", choices=INPUT_MODES, default="bulk", help="register.py form input modu")
+    args = ap.parse_args(argv)
+
+    if args.cmd == "stats":
+        print(account_stats())
+    elif args.cmd == "list":
+        for acc in list_accounts():
+            state = f"leased by {acc['leased_by']}" if acc["leased_by"] else "free"
+            print(f"{acc['username']:<24} {acc['email'] or '':<48} uses={acc['uses']:<4} {state}")
+    elif args.cmd == "import":
+        print("imported" if import_user_data() else "test_user_data.json bulunamadı")
+    else:
+        if args.count == 0 and args.min == 0:
+            ap.error("top-up: adet ya da --min verin")
+        count = args.count or max(0, args.min - account_stats()["total"])
+        return 0 if top_up(count, args.workers, args.input) else 1
+    return 0
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format=LOG_FMT)
+    sys.exit(main())
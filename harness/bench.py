@@ -0,0 +1,233 @@
+# harness/bench.py
+# -*- coding: utf-8 -*-
+"""
+Harness'ın kendi sıcak yollarının mikro-benchmark'ı (yerel mock backend'e karşı, ağsız).
+
+    python -m harness.bench run --reps 20                      # → reports/bench-<run_id>.json
+    python -m harness.bench run --save-baseline                # → bench_baseline.json
+    python -m harness.bench compare reports/bench-XXX.json --threshold 0.25
+
+Ölçülenler (ms): open_browser soğuk başlangıç, switch_to_game_iframe, DomPlayWatcher.install,
+pop_next_since round trip, enjekte edilen /v1/play cevabından wait_result dönüşüne, send_hotkey,
+karakter başına form doldurma (human gap'siz / bulk / instant). compare: seçilen istatistik (varsayılan
+p50) baseline'dan hem oransal eşikten hem de mutlak taban farktan (BENCH_MIN_DELTA_MS) fazla kötüleşirse
+ya da baseline'daki bir metrik bu koşuda yoksa exit 1.
+"""
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import threading
+from contextlib import contextmanager
+
+from common import timing, form_input
+from common.browser_utils import open_browser
+
+LOG_FMT = "%(asctime)s | %(levelname)-7s | %(message)s"
+log = logging.getLogger("bench")
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+BENCH_BASELINE     = os.getenv("BENCH_BASELINE") or os.path.join(ROOT, "bench_baseline.json")
+BENCH_THRESHOLD    = float(os.getenv("BENCH_THRESHOLD", "0.25"))
+BENCH_MIN_DELTA_MS = float(os.getenv("BENCH_MIN_DELTA_MS", "2"))
+
+# iframe içinden /v1/play'e doğrudan istek (tuşsuz "enjekte" cevap)
+_INJECT_PLAY_JS = """
+    fetch("/v1/play", {method: "POST", headers: {"Content-Type": "application/json"},
+                       body: JSON.stringify({game: arguments[0], action: "bet"})});
+    return Date.now();
+"""
+
+def _stats(values) -> dict:
+    return {"n": len(values), "p50": round(timing.percentile(values, 50), 3),
+            "p95": round(timing.percentile(values, 95), 3),
+            "mean": round(sum(values) / len(values), 3) if values else 0.0,
+            "max": round(max(values), 3) if values else 0.0, "unit": "ms"}
+
+class Bench:
+    def __init__(self, reps: int):
+        self.reps = max(1, reps)
+        self.samples: dict[str, list[float]] = {}
+
+    @contextmanager
+    def measure(self, metric: str, per: int = 1):
+        t0 = time.perf_counter()
+        yield
+        self.samples.setdefault(metric, []).append((time.perf_counter() - t0) * 1000 / max(1, per))
+
+    def results(self) -> dict:
+        return {m: _stats(v) for m, v in sorted(self.samples.items())}
+
+@contextmanager
+def local_backend():
+    """Mock sunucuyu boş bir portta thread'de açar; BASE_URL süre boyunca ona çevrilir."""
+    from harness.mock_server import MockState, Outcomes, make_server
+    server = make_server(MockState(Outcomes(seed="bench"), require_auth=False), port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+    old = os.environ.get("BASE_URL")
+    os.environ["BASE_URL"] = url
+    try:
+        yield url
+    finally:
+        if old is None:
+            os.environ.pop("BASE_URL", None)
+        else:
+            os.environ["BASE_URL"] = old
+        server.shutdown()
+        server.server_close()
+
+def run_benchmarks(reps: int) -> dict:
+    os.environ.setdefault("HEADLESS", "1")
+    bench = Bench(reps)
+    with local_backend() as url:
+        # harness modülleri BASE_URL'i import anında okur → mock açıldıktan sonra içe aktar
+        from harness import game
+        from harness.games import DICE
+        from harness.hook import DomPlayWatcher
+        from locators.login_locators import LoginLocators as LL
+        import login as login_script
+
+        for _ in range(max(1, reps // 5)):
+            with bench.measure("open_browser_cold"):
+                driver, _ = open_browser()
+            driver.quit()
+
+        driver, _ = open_browser()
+        pacing = game.PACING
+        game.PACING = game.PACING_FAST     # send_hotkey: insan benzeri gap'ler değil, dispatch maliyeti
+        try:
+            driver.get(url + "games/dice")
+            game.wait_clickable(driver, DICE.locators.REAL_PLAY_BUTTON, "Real Play").click()
+            for _ in range(reps):
+                driver.switch_to.default_content()
+                with bench.measure("switch_to_game_iframe"):
+                    game.switch_to_game_iframe(driver, DICE)
+
+            for _ in range(reps):
+                driver.execute_script("location.reload();")
+                game.wait_visible(driver, DICE.locators.GAME_CANVAS, "game canvas")
+                watcher = DomPlayWatcher(driver, action=DICE.result_action)
+                with bench.measure("hook_install"):
+                    watcher.install()
+
+            game.focus_canvas_without_click(driver, DICE)
+            for _ in range(reps):
+                with bench.measure("pop_next_since_rtt"):
+                    watcher.pop_next_since(0, None)
+
+            for _ in range(reps):
+                watcher.flush_all()
+                t0 = time.perf_counter()
+                since = driver.execute_script(_INJECT_PLAY_JS, DICE.name)
+                item = watcher.wait_result(since_ms=since, session_id=None, timeout=5.0)
+                if item:
+                    bench.samples.setdefault("wait_result_e2e", []).append((time.perf_counter() - t0) * 1000)
+
+            for _ in range(reps):
+                with bench.measure("send_hotkey"):
+                    game.send_hotkey(driver, "x")
+
+            driver.switch_to.default_content()
+            driver.get(url)
+            game.wait_clickable(driver, LL.LOGIN_BUTTON_HEADER, "open login").click()
+            text = "benchmark_user"
+            # human modun 30–80 ms rastgele karakter arası uykusu ölçümü boğar → gap=0 ile yalnızca
+            # karakter başına send_keys dispatch'i; bulk/instant kendi metrikleriyle
+            prev_mode = form_input.input_mode(default=None)
+            try:
+                for mode, metric in (("human", "type_slow_per_char"), ("bulk", "type_bulk_per_char"),
+                                     ("instant", "type_instant_per_char")):
+                    form_input.set_input_mode(mode)
+                    for _ in range(max(1, reps // 5)):
+                        login_script.clear_field(driver, LL.USERNAME_INPUT)       # ölçüm dışında
+                        with bench.measure(metric, per=len(text)):
+                            login_script.type_slow(driver, LL.USERNAME_INPUT, text, a=0, b=0, clear=False,
+                                                   desc="username")
+            finally:
+                form_input.set_input_mode(prev_mode)
+        finally:
+            game.PACING = pacing
+            driver.quit()
+    return bench.results()
+
+# ---------- baseline / compare ----------
+def save_json(fp: str, data: dict):
+    os.makedirs(os.path.dirname(os.path.abspath(fp)), exist_ok=True)
+    with open(fp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+def load_json(fp: str) -> dict:
+    with open(fp, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def compare(current: dict, baseline: dict, threshold: float = BENCH_THRESHOLD, stat: str = "p50",
+            min_delta_ms: float = BENCH_MIN_DELTA_MS) -> list[dict]:
+    """
+    Metrik başına {metric, base, cur, delta_pct, regressed, missing}. Baseline'da olup bu koşuda
+    olmayan metrik (ölçüm düştü/atlandı) missing=True ve regressed=True olur; yalnızca bu koşuda olan
+    yeni metrikler atlanır.
+    """
+    rows = []
+    cur_m, base_m = current.get("metrics") or {}, baseline.get("metrics") or {}
+    for metric in sorted(set(cur_m) | set(base_m)):
+        if metric not in base_m:
+            continue
+        base = float(base_m[metric][stat])
+        if metric not in cur_m:
+            rows.append({"metric": metric, "base": base, "cur": None, "delta_pct": None,
+                         "regressed": True, "missing": True})
+            continue
+        cur = float(cur_m[metric][stat])
+        delta = cur - base
+        pct = delta / base if base > 0 else 0.0
+        rows.append({"metric": metric, "base": base, "cur": cur, "delta_pct": round(pct * 100, 1),
+                     "regressed": pct > threshold and delta > min_delta_ms, "missing": False})
+    return rows
+
+def format_compare(rows, stat: str) -> str:
+    lines = [f"{'metric':<24} {'base ' + stat:>12} {'cur ' + stat:>12} {'Δ %':>8}"]
+    for r in rows:
+        if r.get("missing"):
+            lines.append(f"{r['metric']:<24} {r['base']:>12.2f} {'—':>12} {'—':>8}  ❌ MISSING")
+            continue
+        lines.append(f"{r['metric']:<24} {r['base']:>12.2f} {r['cur']:>12.2f} {r['delta_pct']:>8.1f}"
+                     f"{'  ❌ REGRESSION' if r['regressed'] else ''}")
+    return "\n".join(lines)
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Harness micro-benchmarks")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    run = sub.add_parser("run", help="benchmark'ları koş ve JSON yaz")
+    run.add_argument("--reps", type=int, default=int(os.getenv("BENCH_REPS", "20")))
+    run.add_argument("--out", default=None, help="varsayılan: REPORT_DIR/bench-<run_id>.json")
+    run.add_argument("--save-baseline", action="store_true", help=f"sonucu baseline olarak da yaz ({BENCH_BASELINE})")
+    cmp_ = sub.add_parser("compare", help="sonucu baseline ile karşılaştır; gerileme varsa exit 1")
+    cmp_.add_argument("result")
+    cmp_.add_argument("--baseline", default=BENCH_BASELINE)
+    cmp_.add_argument("--threshold", type=float, default=BENCH_THRESHOLD, help="oransal eşik (0.25 → %%25)")
+    cmp_.add_argument("--stat", default="p50", choices=("p50", "p95", "mean", "max"))
+    args = ap.parse_args(argv)
+
+    if args.cmd == "run":
+        rid = timing.run_id()
+        result = {"run_id": rid, "reps": args.reps, "metrics": run_benchmarks(args.reps)}
+        out = args.out or os.path.join(timing.REPORT_DIR, f"bench-{rid}.json")
+        save_json(out, result)
+        if args.save_baseline:
+            save_json(BENCH_BASELINE, result)
+        for metric, st in result["metrics"].items():
+            log.info(f"⏱ {metric:<24} p50={st['p50']:.2f} ms  p95={st['p95']:.2f} ms  (n={st['n']})")
+        log.info(f"📄 {out}")
+        return 0
+
+    rows = compare(load_json(args.result), load_json(args.baseline), args.threshold, args.stat)
+    print(format_compare(rows, args.stat), flush=True)
+    return 1 if any(r["regressed"] for r in rows) else 0
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format=LOG_FMT)
+    sys.exit(main())
@@ -0,0 +1,349 @@
+# harness/cdp_capture.py
+# -*- coding: utf-8 -*-
+"""
+HOOK_JS'e alternatif yakalama: Chrome DevTools Protocol ağ olayları.
+
+  - Watcher, oturumun sayfa hedefine kendi CDP websocket'ini açar (goog:chromeOptions.debuggerAddress +
+    pencere tanıtıcısı = hedef kimliği) ve Network.enable ile olaylara abone olur. Olaylar arka plan
+    thread'ine itilir: Network.responseReceived ile "/v1/play" cevapları işaretlenir,
+    Network.loadingFinished'de Network.getResponseBody aynı soket üzerinden istenir ve gövde gelince
+    bekleyen wait_result uyandırılır (yoklama yok). Oyunun fetch/XHR yolu patch'lenmez, iframe'e girmek gerekmez.
+  - debuggerAddress'e erişilemezse (ör. uzak Selenium Grid düğümü) ya da soket koparsa: chromedriver
+    performance log'u (Network.*) PUMP_INTERVAL_SEC aralıkla okunur (yedek yol). Performance log
+    yalnızca bu yolda okunur/boşaltılır; yetenek bu yüzden driver açılışında açık kalır.
+  - DomPlayWatcher ile aynı normalize kayıtları ({t, url, action, result, session_id, ...}) ve aynı API
+
+PLAY_CAPTURE=cdp ile seçilir (varsayılan: hook).
+"""
+import os
+import json
+import time
+import logging
+import itertools
+import threading
+
+from selenium.common.exceptions import WebDriverException
+
+from common.browser_utils import disable_site_isolation
+from harness.hook import DomPlayWatcher, HOOK_CAPACITY, HOOK_KEEP_PAYLOAD, _matches
+
+log = logging.getLogger("cdp_capture")
+
+PLAY_CAPTURE = (os.getenv("PLAY_CAPTURE") or "hook").strip().lower()
+PLAY_HINT = "/v1/play"
+PUMP_INTERVAL_SEC = 0.05                 # yalnızca performance log yedek yolu
+CDP_STREAM_TIMEOUT = float(os.getenv("CDP_STREAM_TIMEOUT", "5"))
+
+def cdp_capture_enabled() -> bool:
+    return PLAY_CAPTURE == "cdp"
+
+def enable_network_capture(opts):
+    """Chrome Options'a performance log (Network) yeteneğini ekler."""
+    opts.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    # Oyun iframe'i farklı origin; site isolation açıkken ayrı (OOPIF) hedefte kalır ve
+    # getResponseBody üst sayfa oturumundan çağrılamaz → iframe'i aynı süreçte tut
+    disable_site_isolation(opts)
+    return opts
+
+def norm_result(v):
+    """HOOK_JS norm() ile birebir."""
+    if not v:
+        return None
+    v = str(v).lower()
+    if v in ("win", "won", "success"):
+        return "win"
+    if v in ("loss", "lose", "lost", "fail"):
+        return "lose"
+    if v in ("in_progress", "inprogress"):
+        return "inprogress"
+    return None
+
+def _num(v):
+    return v if isinstance(v, (int, float)) and not isinstance(v, bool) else None
+
+def normalize_record(t, url, payload, keep_payload: bool = False) -> dict:
+    d = (payload.get("data") if isinstance(payload, dict) else None) or {}
+    rec = {
+        "t": int(t),
+        "url": url,
+        "action": d.get("action") or None,
+        "result": norm_result(d.get("result")),
+        "session_id": d.get("session_id") or None,
+        "tile_index": _num(d.get("tile_index")),
+        "mines_count": _num(d.get("mines_count")),
+        "level": _num(d.get("level")),
+        "index": _num(d.get("index")),
+    }
+    if keep_payload:
+        rec["payload"] = payload
+    return rec
+
+def devtools_ws_url(driver) -> str | None:
+    """Oturumun sayfa hedefine doğrudan CDP websocket adresi; chromedriver adres vermiyorsa None."""
+    caps = getattr(driver, "capabilities", None) or {}
+    addr = (caps.get("goog:chromeOptions") or {}).get("debuggerAddress")
+    if not addr:
+        return None
+    return f"ws://{addr}/devtools/page/{driver.current_window_handle}"
+
+class CdpEventStream:
+    """
+    Tek sayfa hedefine ham CDP websocket'i. Olaylar ve komut cevapları okuyucu thread'de işlenir;
+    send() callback'i cevap gelince çağrılır (okuyucu thread'i hiç bloklanmaz), call() ise çağıranın
+    thread'inde cevabı bekler.
+    """
+    def __init__(self, ws_url: str, on_event, timeout: float = CDP_STREAM_TIMEOUT):
+        import websocket                       # websocket-client: selenium bağımlılığı
+        self._ws = websocket.create_connection(ws_url, timeout=timeout, suppress_origin=True,
+                                               enable_multithread=True)
+        self._ws.settimeout(None)
+        self._on_event = on_event
+        self._ids = itertools.count(1)
+        self._callbacks: dict[int, object] = {}
+        self._lock = threading.Lock()
+        self.closed = threading.Event()
+        self._thread = threading.Thread(target=self._read, name="cdp-stream", daemon=True)
+        self._thread.start()
+
+    def send(self, method: str, params: dict | None = None, callback=None):
+        with self._lock:
+            mid = next(self._ids)
+            if callback is not None:
+                self._callbacks[mid] = callback
+        self._ws.send(json.dumps({"id": mid, "method": method, "params": params or {}}))
+
+    def call(self, method: str, params: dict | None = None, timeout: float = CDP_STREAM_TIMEOUT) -> dict:
+        done, box = threading.Event(), {}
+
+        def _cb(result, error):
+            box.update(result=result, error=error)
+            done.set()
+        self.send(method, params, _cb)
+        if not done.wait(timeout):
+            raise TimeoutError(f"CDP {method}: cevap yok ({timeout}s)")
+        if box["error"]:
+            raise RuntimeError(f"CDP {method}: {box['error']}")
+        return box["result"] or {}
+
+    def _read(self):
+        try:
+            while True:
+                raw = self._ws.recv()
+                if not raw:
+                    break
+                msg = json.loads(raw)
+                if "id" in msg:
+                    with self._lock:
+                        cb = self._callbacks.pop(msg["id"], None)
+                    if cb is not None:
+                        cb(msg.get("result"), msg.get("error"))
+                elif msg.get("method"):
+                    self._on_event(msg["method"], msg.get("params") or {})
+        except Exception as e:                 # soket kapandı / tarayıcı gitti
+            log.debug(f"cdp stream ended: {e}")
+        finally:
+            self.closed.set()
+            self._on_event("Stream.closed", {})
+
+    def close(self):
+        try:
+            self._ws.close()
+        except Exception:
+            pass
+        self._thread.join(timeout=2.0)
+
+def make_watcher(driver, action: str | None = None):
+    """PLAY_CAPTURE'a göre DomPlayWatcher (hook) ya da CdpPlayWatcher döndürür."""
+    if cdp_capture_enabled():
+        return CdpPlayWatcher(driver, action=action)
+    return DomPlayWatcher(driver, action=action)
+
+class CdpPlayWatcher:
+    """DomPlayWatcher ile aynı arayüz; kuyruk Python tarafında (aynı kapasite/overflow kuralıyla) tutulur."""
+    def __init__(self, driver, action: str | None = None,
+                 capacity: int = HOOK_CAPACITY, keep_payload: bool = HOOK_KEEP_PAYLOAD):
+        self.driver = driver
+        self.action = action
+        self.capacity = max(1, capacity)
+        self.keep_payload = keep_payload
+        self._pending: dict[str, dict] = {}  # requestId → Network.Response
+        self._net: list[dict] = []
+        self._records: list[dict] = []
+        self._overflow = 0
+        self._total = 0
+        self._cond = threading.Condition()   # okuyucu thread kayıt ekleyince wait_result'ı uyandırır
+        self._stream: CdpEventStream | None = None
+        self.mode = "poll"                   # "stream" → CDP websocket aboneliği, "poll" → performance log
+
+    @property
+    def streaming(self) -> bool:
+        return self._stream is not None and not self._stream.closed.is_set()
+
+    def install(self):
+        """CDP websocket aboneliğini açar; açılamazsa performance log yedek yoluna düşer."""
+        if self._stream is None:
+            self._stream = self._open_stream()
+            self.mode = "stream" if self._stream is not None else "poll"
+        self._pump()
+
+    def _open_stream(self) -> CdpEventStream | None:
+        try:
+            url = devtools_ws_url(self.driver)
+            if not url:
+                raise RuntimeError("debuggerAddress yok")
+            stream = CdpEventStream(url, self._on_event)
+            stream.call("Network.enable")
+        except Exception as e:
+            log.warning(f"⚠️ CDP event stream unavailable ({e}) → polling the performance log")
+            return None
+        log.info("📡 CDP event stream subscribed (Network.*)")
+        return stream
+
+    def close(self):
+        stream, self._stream = self._stream, None
+        if stream is not None:
+            stream.close()
+
+    def flush_all(self):
+        self._pump()
+        with self._cond:
+            self._records.clear()
+
+    # ---------- olay işleme (stream: okuyucu thread, yedek yol: çağıranın thread'i) ----------
+    def _on_event(self, method: str, params: dict, t_ms: float | None = None):
+        if method == "Network.responseReceived":
+            resp = params.get("response") or {}
+            if PLAY_HINT in (resp.get("url") or ""):
+                self._pending[params.get("requestId")] = resp
+        elif method == "Network.loadingFinished":
+            resp = self._pending.pop(params.get("requestId"), None)
+            if resp is not None:
+                self._net_sample(resp, params, resp.get("status") or 0)
+                self._collect(params.get("requestId"), resp["url"], t_ms or time.time() * 1000)
+        elif method == "Network.loadingFailed":
+            resp = self._pending.pop(params.get("requestId"), None)
+            if resp is not None:
+                self._net_sample(resp, params, 0)
+        elif method == "Stream.closed":
+            with self._cond:
+                self._cond.notify_all()
+
+    def _pump(self):
+        """Yedek yol: performance log'u okur. Stream açıkken hiçbir şey yapmaz (log'a dokunulmaz)."""
+        if self._stream is not None:
+            if not self._stream.closed.is_set():
+                return
+            log.warning("⚠️ CDP event stream closed → polling the performance log")
+            self._stream, self.mode = None, "poll"
+        try:
+            entries = self.driver.get_log("performance")
+        except WebDriverException as e:
+            log.debug(f"performance log unavailable: {e}")
+            return
+        for entry in entries:
+            try:
+                msg = json.loads(entry["message"])["message"]
+            except (KeyError, ValueError):
+                continue
+            self._on_event(msg.get("method"), msg.get("params") or {}, entry.get("timestamp"))
+
+    def _net_sample(self, resp, params, status):
+        """HOOK_JS pushNet() ile aynı alanlar; süreler Network zaman damgalarından (requestTime sn, offset'ler ms)."""
+        tm = resp.get("timing") or {}
+        req_time, send_start = tm.get("requestTime"), tm.get("sendStart") or 0.0
+        ttfb = total = None
+        if req_time:
+            ttfb = max(0.0, (tm.get("receiveHeadersEnd") or 0.0) - send_start)
+            if params.get("timestamp"):
+                total = max(0.0, (params["timestamp"] - req_time) * 1000 - send_start)
+        with self._cond:
+            self._net.append({"t": int(time.time() * 1000), "url": resp.get("url"), "via": "cdp", "status": status,
+                              "bytes": int(params.get("encodedDataLength") or 0), "ttfb_ms": ttfb, "total_ms": total})
+
+    def _collect(self, request_id, url, t):
+        if self._stream is not None:
+            # okuyucu thread'de bekleme yok: gövde cevabı geldiğinde kayıt eklenir
+            self._stream.send("Network.getResponseBody", {"requestId": request_id},
+                              lambda result, error: self._add_body(url, t, result, error))
+            return
+        try:
+            body = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+        except WebDriverException as e:
+            body, err = None, e
+        else:
+            err = None
+        self._add_body(url, t, body, err)
+
+    def _add_body(self, url, t, body, error):
+        try:
+            if error:
+                raise ValueError(error)
+            payload = json.loads((body or {}).get("body") or "")
+        except ValueError as e:
+            log.debug(f"response body skipped ({url}): {e}")
+            return
+        with self._cond:
+            if len(self._records) >= self.capacity:
+                self._records.pop(0)
+                self._overflow += 1
+            self._records.append(normalize_record(t, url, payload, self.keep_payload))
+            self._total += 1
+            self._cond.notify_all()
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {"capacity": self.capacity, "size": len(self._records), "overflow": self._overflow,
+                    "total": self._total, "keep_payload": self.keep_payload,
+                    "mode": self.mode}
+
+    def _take(self, since_ms: int, session_id: str | None, action: str | None, limit: int) -> list[dict]:
+        out, keep = [], []
+        with self._cond:
+            for it in self._records:
+                if len(out) < limit and _matches(it, since_ms, session_id, action):
+                    out.append(it)
+                else:
+                    keep.append(it)
+            self._records = keep
+        return out
+
+    def drain(self, since_ms: int = 0, session_id: str | None = None, action: str | None = None,
+              max_items: int | None = None) -> list[dict]:
+        self._pump()
+        return self._take(since_ms, session_id, action, max_items or self.capacity)
+
+    def drain_net(self) -> list[dict]:
+        self._pump()
+        with self._cond:
+            out, self._net = self._net, []
+        return out
+
+    def pop_next_since(self, since_ms: int, session_id: str | None, action: str | None = None):
+        items = self.drain(since_ms, session_id, action, max_items=1)
+        return items[0] if items else None
+
+    def pop_result_since(self, since_ms: int, session_id: str | None):
+        return self.pop_next_since(since_ms, session_id, action="result")
+
+    def wait_result(self, since_ms: int, session_id: str | None, timeout: float = 12.0) -> dict | None:
+        """Stream açıkken kayıt gelene kadar Condition üzerinde uyur; yedek yolda PUMP_INTERVAL_SEC yoklar."""
+        t_end = time.time() + timeout
+        while True:
+            item = self.pop_next_since(since_ms, session_id, self.action)
+            if item:
+                return item
+            remaining = t_end - time.time()
+            if remaining <= 0:
+                return None
+            if self.streaming:
+                with self._cond:
+                    if not self._take_ready(since_ms, session_id):
+                        self._cond.wait(remaining)
+            else:
+                time.sleep(min(PUMP_INTERVAL_SEC, remaining))
+
+    def _take_ready(self, since_ms: int, session_id: str | None) -> bool:
+        """Kilit altında: uyumadan önce eşleşen kayıt (ya da kopmuş stream) var mı?"""
+        if self._stream is None or self._stream.closed.is_set():
+            return True
+        return any(_matches(it, since_ms, session_id, self.action) for it in self._records)
@@ -0,0 +1,589 @@
+# harness/game.py
+# -*- coding: utf-8 -*-
+"""
+Ortak oyun harness'ı:
+  - Driver: common/browser_utils.open_browser üzerine kurulu
+  - Login, lobby → oyun, iframe/canvas, hook kurulumu tek yerde
+  - Oyun = GameSpec (locator sınıfı + hotkey dizisi + durma koşulu)
+  - run_games() birden fazla oyunu tek (sıcak) driver üzerinde art arda koşar
+"""
+import os
+import json
+import time
+import random
+import logging
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+from common.browser_utils import open_browser, DEFAULT_BASE_URL, _truthy
+from common.user_data import load_user_data, leased_account
+from common.form_input import fill
+from locators.login_locators import LoginLocators as LL
+from common.timing import span, record, run_id
+from harness.hook import DomPlayWatcher
+from harness.keys import dispatch_cdp_key, send_key_action
+from harness.cdp_capture import cdp_capture_enabled, enable_network_capture, make_watcher
+
+log = logging.getLogger("harness")
+
+# ================= Config =================
+BASE_URL = os.getenv("BASE_URL", DEFAULT_BASE_URL)
+DEFAULT_TIMEOUT   = int(os.getenv("DEFAULT_TIMEOUT", "25"))
+GAME_LOAD_TIMEOUT = int(os.getenv("GAME_LOAD_TIMEOUT", "90"))
+
+# Login akışı beklemeleri
+LOGIN_PRE_CLICK_SEC  = 3.0            # Login butonuna basmadan önce
+LOGIN_POST_CLICK_SEC = 3.0            # Login modal açıldıktan sonra
+LOGIN_PER_FIELD_SEC  = 2.0            # username, password ve submit sonrası
+
+# ACCOUNT_POOL=1 → her oyuncu/worker hesap havuzundan (common/user_data) kendine özel hesap kiralar
+ACCOUNT_POOL         = _truthy(os.getenv("ACCOUNT_POOL"))
+
+KEYPRESS_GAP         = (0.06, 0.12)
+
+# Tuş gönderimi: "actions" → W3C action (varsayılan), "cdp" → Input.dispatchKeyEvent (bkz. harness/keys)
+KEY_DISPATCH_ACTIONS = "actions"
+KEY_DISPATCH_CDP     = "cdp"
+KEY_DISPATCH = (os.getenv("KEY_DISPATCH") or KEY_DISPATCH_ACTIONS).strip().lower()
+# PICK_BATCH=1 → STOP_CASHOUT oyunlarında her pick sabit bekleme yerine PICK_BATCH_GAP_MS pause'lu tek action;
+# sonraki pick önceki sonuç 'inprogress' gelince gider (kayıptan sonra tuş basılmaz)
+PICK_BATCH        = _truthy(os.getenv("PICK_BATCH"))
+PICK_BATCH_GAP_MS = int(os.getenv("PICK_BATCH_GAP_MS", "250"))
+RESULT_TIMEOUT       = 12.0           # varsayılan /v1/play sonuç bekleme (sn); oyun bazında GameSpec.result_timeout
+
+# Tempo profili: "human" → bugünkü insan benzeri sabit beklemeler (spec.timings)
+#                "fast"  → sabit bekleme yok; her hotkey, önceki /v1/play sonucu geldikten sonra
+#                          canvas'ın animasyon-boşta (rAF + idle) karesini bekleyerek basılır
+PACING_HUMAN = "human"
+PACING_FAST  = "fast"
+PACING = (os.getenv("PACING") or PACING_HUMAN).strip().lower()
+FRAME_IDLE_TIMEOUT = float(os.getenv("FRAME_IDLE_TIMEOUT", "1.5"))
+
+# Durma koşulları
+STOP_ROUNDS      = "rounds"       # sabit tur sayısı, win/loss say (Dice/Limbo/Diamonds)
+STOP_WIN_STREAK  = "win_streak"   # N ardışık win → dur, cashout yok (Keno)
+STOP_CASHOUT     = "cashout"      # N ardışık inprogress → W ile cashout (Mines/Dragon Tower/Warp War)
+
+def nap(a=0.6, b=1.2): time.sleep(random.uniform(a, b))
+def tiny_nap(a=0.12, b=0.25): time.sleep(random.uniform(a, b))
+
+@dataclass(frozen=True)
+class Timings:
+    """Oyunlar arası ortak (insan benzeri) beklemeler."""
+    pre_bet: float = 1.0                      # her bet (SPACE) öncesi tam 1 sn
+    bet_resolve: tuple = (0.8, 1.0)           # SPACE sonrası kısa animasyon
+    between_rounds: float = 1.0               # eller arası tam 1 sn
+    after_pre_keys: float = 2.0               # ilk tekil Q sonrası (Keno)
+    after_pick: tuple = (0.35, 0.60)          # Q sonrası min gecikme
+    between_picks: tuple = (1.0, 1.4)         # Q seçimleri arası
+    before_cashout: tuple = (0.6, 1.0)        # W öncesi insanî küçük gecikme
+    after_cashout: tuple = (2.0, 3.0)         # W sonrası kısa bekleme
+    after_final_win: float = 3.0              # hedef win serisinden sonra (Keno)
+    after_loss: tuple = (0.8, 1.2)            # pick kaybı sonrası (round reset)
+    after_open: tuple = (0.9, 1.3)            # iframe bulununca kısa nefes
+    after_install: tuple = (0.9, 1.2)         # hook kurulduktan sonra
+    after_nav: tuple = (1.0, 1.4)             # lobby/tile/Real Play tıklamaları sonrası
+
+# PACING=fast: tüm sabit beklemeler sıfır; hazır olma kontrolü wait_frame_idle() ile yapılır
+FAST_TIMINGS = Timings(
+    pre_bet=0.0, bet_resolve=(0, 0), between_rounds=0.0, after_pre_keys=0.0,
+    after_pick=(0, 0), between_picks=(0, 0), before_cashout=(0, 0), after_cashout=(0, 0),
+    after_final_win=0.0, after_loss=(0, 0), after_open=(0, 0), after_install=(0, 0), after_nav=(0, 0),
+)
+
+@dataclass(frozen=True)
+class GameSpec:
+    """Bir oyunun deklaratif tanımı: locator sınıfı, hotkey dizisi ve durma koşulu."""
+    name: str                                 # logger / rapor adı (ör. "dice")
+    title: str                                # lobby log etiketi (ör. "Dice (Jungle Hunt)")
+    locators: type                            # GAME_TILE_IMG, REAL_PLAY_BUTTON, GAME_CANVAS
+    stop: str                                 # STOP_ROUNDS | STOP_WIN_STREAK | STOP_CASHOUT
+    max_rounds: int
+    streak: int = 0                           # hedef ardışık win / inprogress sayısı
+    max_picks: int = 0                        # tur başına güvenlik üst sınırı (STOP_CASHOUT)
+    pre_keys: tuple = ()                      # oyun açılınca bir kez basılan tuşlar (Keno: "q")
+    bet_key: str = Keys.SPACE
+    pick_key: str = "q"
+    cashout_key: str = "w"
+    result_action: str | None = "result"      # None → action filtresi yok
+    result_timeout: float = RESULT_TIMEOUT    # /v1/play sonucu için bekleme üst sınırı (sn)
+    timings: Timings = field(default_factory=Timings)
+
+def is_fast() -> bool:
+    return PACING == PACING_FAST
+
+def timings_for(spec: "GameSpec | None" = None) -> Timings:
+    if is_fast():
+        return FAST_TIMINGS
+    return spec.timings if spec else Timings()
+
+# ================= Test user =================
+def load_test_user(fp=None):
+    """fp verilmezse common/user_data (proje kökündeki test_user_data.json) okunur."""
+    if fp is None:
+        data = load_user_data()
+    else:
+        if not os.path.exists(fp): raise FileNotFoundError(f"{fp} bulunamadı")
+        with open(fp, "r", encoding="utf-8") as f: data = json.load(f)
+    username = (data.get("username") or data.get("email") or "").strip()
+    password = (data.get("password") or "").strip()
+    if not username or not password: raise ValueError("username/email ve password gerekli")
+    return username, password
+
+@contextmanager
+def player_credentials(default=None):
+    """ACCOUNT_POOL=1 → havuzdan özel hesap (blok bitince iade); değilse verilen ya da ortak test kullanıcısı."""
+    if ACCOUNT_POOL and default is None:
+        with leased_account() as acc:
+            log.info(f"🎫 account leased: {acc['username']}")
+            yield acc["username"], acc["password"]
+        return
+    yield default or load_test_user()
+
+# ================= Driver & bekleme yardımcıları =================
+def make_driver(options_hook=None):
+    """open_browser() → BASE_URL açık, headless uyumlu driver (PLAY_CAPTURE=cdp → ağ yakalama açık)."""
+    def _hook(opts):
+        if cdp_capture_enabled():
+            enable_network_capture(opts)
+        if options_hook:
+            options_hook(opts)
+        return opts
+    driver, _ = open_browser(_hook)
+    return driver
+
+def wait_clickable(driver, locator, desc, timeout=DEFAULT_TIMEOUT):
+    log.info(f"⏳ wait clickable: {desc}")
+    return WebDriverWait(driver, timeout).until(EC.element_to_be_clickable(locator))
+
+def wait_visible(driver, locator, desc, timeout=DEFAULT_TIMEOUT):
+    log.info(f"⏳ wait visible: {desc}")
+    return WebDriverWait(driver, timeout).until(EC.visibility_of_element_located(locator))
+
+def send_hotkey(driver, key):
+    """Tek bekleme + tek gönderim: human modda KEYPRESS_GAP, action dizisinde pause olarak beklenir."""
+    gap = 0.0 if is_fast() else random.uniform(*KEYPRESS_GAP)
+    if KEY_DISPATCH == KEY_DISPATCH_CDP:
+        if gap:
+            time.sleep(gap)
+        if dispatch_cdp_key(driver, key):
+            return
+        gap = 0.0
+    send_key_action(driver, key, lead_ms=gap * 1000)
+
+# requestAnimationFrame x2 → requestIdleCallback: oyun yeni bir kare çizdi ve ana thread boşta
+FRAME_IDLE_JS = """
+    const done = arguments[arguments.length - 1], ms = arguments[0] >>> 0;
+    const idle = window.requestIdleCallback
+      ? (cb) => window.requestIdleCallback(cb, {timeout: ms})
+      : (cb) => setTimeout(cb, 0);
+    requestAnimationFrame(() => requestAnimationFrame(() => idle(() => done(true))));
+    setTimeout(() => done(false), ms);
+"""
+
+def wait_frame_idle(driver, timeout: float = FRAME_IDLE_TIMEOUT) -> bool:
+    """Canvas'ın animasyon-boşta karesini bekler (tek round trip); zaman aşımında False."""
+    try:
+        return bool(driver.execute_async_script(FRAME_IDLE_JS, int(timeout * 1000)))
+    except TimeoutException:
+        return False
+
+def press(driver, key):
+    """Strateji hotkey'i: fast modda önce canvas hazır olana kadar bekler, sonra basar."""
+    if is_fast():
+        wait_frame_idle(driver)
+    send_hotkey(driver, key)
+
+def now_ms(driver) -> int:
+    return driver.execute_script("return Date.now();")
+
+# ================= Login & Navigation =================
+def do_login(driver, username, password):
+    log.info("[LOGIN] open modal")
+    time.sleep(LOGIN_PRE_CLICK_SEC)
+    wait_clickable(driver, LL.LOGIN_BUTTON_HEADER, "open login").click()
+    time.sleep(LOGIN_POST_CLICK_SEC)
+
+    wait_visible(driver, LL.USERNAME_INPUT, "username input")
+    wait_visible(driver, LL.PASSWORD_INPUT, "password input")
+
+    u = wait_clickable(driver, LL.USERNAME_INPUT, "username")
+    p = wait_clickable(driver, LL.PASSWORD_INPUT, "password")
+    fill(driver, u, username, default="bulk"); time.sleep(LOGIN_PER_FIELD_SEC)
+    fill(driver, p, password, default="bulk"); time.sleep(LOGIN_PER_FIELD_SEC)
+
+    wait_clickable(driver, LL.LOGIN_SUBMIT_BUTTON, "submit login").click()
+    time.sleep(LOGIN_PER_FIELD_SEC)
+    wait_clickable(driver, LL.LOGOUT_BUTTON, "logout visible", timeout=40)
+    log.info("🟢 Login successful")
+
+def login(driver, username, password, game: str | None = None):
+    """Snapshot varsa enjekte eder, yoksa/reddedilirse tam do_login (bkz. harness/session.py)."""
+    from harness.session import ensure_login  # session → game import'u döngüsel olmasın
+    with span("login", game=game):
+        ensure_login(driver, username, password)
+
+def open_game(driver, spec: GameSpec):
+    L = spec.locators
+    log.info(f"[LOBBY] open {spec.title} tile")
+    t = timings_for(spec)
+    wait_clickable(driver, L.GAME_TILE_IMG, f"{spec.name} tile").click()
+    nap(*t.after_nav)
+    log.info("[GAME] click Real Play")
+    wait_clickable(driver, L.REAL_PLAY_BUTTON, "Real Play").click()
+    nap(*t.after_nav)
+
+def back_to_lobby(driver):
+    """Sonraki oyun için lobby'ye dön (oturum cookie'de kalır, yeniden login gerekmez)."""
+    driver.switch_to.default_content()
+    driver.get(BASE_URL)
+    nap(*timings_for().after_nav)
+
+# ================= Game helpers =================
+# Tek script ile tüm iframe'ler: same-origin ise canvas doğrudan kontrol edilir (canvas=true/false),
+# cross-origin ise contentDocument erişilemez (canvas=null) → yalnızca bunlara girilip bakılır
+FRAME_SCAN_JS = """
+    const out = [];
+    document.querySelectorAll("iframe").forEach((fr) => {
+      let canvas = null;
+      try { const d = fr.contentDocument; if (d) canvas = !!d.querySelector("canvas"); } catch (e) {}
+      out.push({el: fr, src: fr.src || "", canvas});
+    });
+    return out;
+"""
+
+FRAME_POLL_START = 0.1    # ilk tarama aralığı (sn); her boş turda x1.5
+FRAME_POLL_MAX   = 1.0
+
+_frame_cache: dict[str, str] = {}   # spec.name → kazanan iframe src'si (query'siz)
+
+def _src_key(src: str) -> str:
+    return (src or "").split("?", 1)[0].split("#", 1)[0]
+
+def _enter_if_canvas(driver, frame_el) -> bool:
+    driver.switch_to.default_content()
+    driver.switch_to.frame(frame_el)
+    if driver.find_elements(By.CSS_SELECTOR, "canvas"):
+        return True
+    driver.switch_to.default_content()
+    return False
+
+def switch_to_game_iframe(driver, spec: GameSpec | None = None):
+    """
+    Canvas içeren oyun iframe'ine geçer:
+      - her turda tek execute_script ile iframe listesi (+ same-origin canvas kontrolü)
+      - cross-origin adaylardan, bu oyun için önbelleğe alınmış src varsa yalnızca o denenir
+      - kısa, artan aralıklarla (0.1 → 1.0 sn) yoklar; canvas görünür görünmez döner
+    """
+    log.info("🔍 searching for game iframe (with a <canvas>)")
+    after_open = timings_for(spec).after_open
+    cached = _frame_cache.get(spec.name) if spec else None
+    delay = FRAME_POLL_START
+    t_end = time.time() + GAME_LOAD_TIMEOUT
+    while time.time() < t_end:
+        driver.switch_to.default_content()
+        frames = driver.execute_script(FRAME_SCAN_JS) or []
+
+        same_origin = [f for f in frames if f.get("canvas")]
+        cross_origin = [f for f in frames if f.get("canvas") is None]
+        known = [f for f in cross_origin if cached and _src_key(f.get("src")) == cached]
+        cross_origin = known or cross_origin   # önbellekteki oyun iframe'i varsa yalnızca ona bak
+
+        for f in same_origin + cross_origin:
+            try:
+                if f.get("canvas"):
+                    driver.switch_to.frame(f["el"])
+                elif not _enter_if_canvas(driver, f["el"]):
+                    continue
+            except WebDriverException:
+                continue  # iframe tarama ile geçiş arasında DOM'dan kalkmış
+            if spec:
+                _frame_cache[spec.name] = _src_key(f.get("src"))
+            log.info(f"🔁 switched into game iframe ({_src_key(f.get('src')) or 'same-origin'})")
+            nap(*after_open)
+            return
+
+        time.sleep(delay)
+        delay = min(delay * 1.5, FRAME_POLL_MAX)
+    raise TimeoutException("No iframe with a <canvas> found.")
+
+def focus_canvas_without_click(driver, spec: GameSpec):
+    """Canvas'ı tıklamadan odakla (orta ekrana istemsiz click yok)."""
+    canvas = wait_visible(driver, spec.locators.GAME_CANVAS, "game canvas", timeout=GAME_LOAD_TIMEOUT)
+    driver.execute_script("arguments[0].setAttribute('tabindex','0'); arguments[0].focus();", canvas)
+    tiny_nap()
+    return canvas
+
+# ================= Strategies =================
+def _wait_play(watcher, spec: GameSpec, since_ms: int, session_id: str | None, phase: str) -> dict | None:
+    """Sonucu bekler; gecikmeyi (tuş öncesi now_ms → hook'taki t) rapora yazar."""
+    item = watcher.wait_result(since_ms=since_ms, session_id=session_id, timeout=spec.result_timeout)
+    if item and item.get("t"):
+        record(phase, item["t"] - since_ms, game=spec.name)
+    elif not item:
+        record("result_timeout", spec.result_timeout * 1000, game=spec.name, action=phase)
+    return item
+
+def _bet(driver, watcher: DomPlayWatcher, spec: GameSpec) -> int:
+    """Eski kayıtları at, (1 sn bekle) SPACE ile bahis yap; bet zaman damgasını döndür."""
+    watcher.flush_all()  # stabilite (yanlış eşleşme önler)
+    t = timings_for(spec)
+    log.info("▶️  Place bet (SPACE)")
+    time.sleep(t.pre_bet)
+    t_bet = now_ms(driver)
+    press(driver, spec.bet_key)
+    nap(*t.bet_resolve)
+    return t_bet
+
+def run_rounds(driver, watcher: DomPlayWatcher, spec: GameSpec, max_rounds: int) -> str:
+    """Sabit tur sayısı; her tur SPACE, win/loss loglanır."""
+    wins = losses = 0
+    for rnd in range(1, max_rounds + 1):
+        log.info(f"===== ROUND {rnd}/{max_rounds} =====")
+        t_bet = _bet(driver, watcher, spec)
+
+        item = _wait_play(watcher, spec, t_bet, None, "bet_result")
+        result = (item or {}).get("result")
+        log.info(f"🎯 round result: {result}")
+
+        if result == "win":
+            wins += 1
+            log.info(f"✅ WIN | wins={wins} losses={losses}")
+        elif result == "lose":
+            losses += 1
+            log.info(f"❌ LOSS | wins={wins} losses={losses}")
+        else:
+            log.info("⚠️ unknown/no-result")
+
+        time.sleep(timings_for(spec).between_rounds)
+
+    log.info(f"🏁 TEST DONE | wins={wins}, losses={losses}")
+    return "success"
+
+def run_win_streak(driver, watcher: DomPlayWatcher, spec: GameSpec, max_rounds: int) -> str:
+    """spec.streak ardışık win → dur (cashout yok)."""
+    consec_wins = 0
+    for rnd in range(1, max_rounds + 1):
+        log.info(f"===== ROUND {rnd} =====")
+        t_bet = _bet(driver, watcher, spec)
+
+        item = _wait_play(watcher, spec, t_bet, None, "bet_result")
+        result = (item or {}).get("result")
+        log.info(f"🎯 round result: {result}")
+
+        if result == "win":
+            consec_wins += 1
+            log.info(f"✅ WIN (streak {consec_wins}/{spec.streak})")
+            if consec_wins >= spec.streak:
+                log.info(f"🏁 {spec.streak} consecutive wins → stopping.")
+                time.sleep(timings_for(spec).after_final_win)
+                return "success"
+        else:
+            consec_wins = 0
+            log.info("❌ LOSS/unknown → reset streak (no new pick)")
+
+        time.sleep(timings_for(spec).between_rounds)
+
+    return "stopped"
+
+def _open_round(driver, watcher: DomPlayWatcher, spec: GameSpec):
+    """
+    Bahsi yapar ve bahsin kendi /v1/play cevabını bekler (ilk pick bu cevaptan önce basılmaz;
+    aksi halde geç gelen bet cevabı pick 1 sonucu sanılır). Dönüş: bet kaydı ya da None (cevap yok).
+    """
+    t_bet = _bet(driver, watcher, spec)
+    item = _wait_play(watcher, spec, t_bet, None, "bet_result")
+    if item is None:
+        log.info("⚠️ no bet response → round reset")
+    return item
+
+def play_one_round(driver, watcher: DomPlayWatcher, spec: GameSpec) -> str:
+    """
+    Tek tur (STOP_CASHOUT):
+      - (1sn bekle) SPACE ile bahis → bahsin /v1/play cevabı beklenir (oturum kimliği buradan)
+      - Q → 'inprogress' bekle (aksi halde tur kayıp)
+      - Peş peşe spec.streak 'inprogress' yakalanırsa: W ile cashout → "success"
+    """
+    t = timings_for(spec)
+    bet = _open_round(driver, watcher, spec)
+    if bet is None:
+        nap(*t.after_loss)
+        return "lose"
+    session_id = bet.get("session_id")
+    if PICK_BATCH:
+        return play_picks_paced(driver, watcher, spec, session_id)
+    consecutive = 0
+
+    for pick in range(1, spec.max_picks + 1):
+        log.info(f"🎲 Pick {pick} (Q)")
+        t0 = now_ms(driver)                 # tetiklemeden hemen önce zaman damgası
+        press(driver, spec.pick_key)
+        nap(*t.after_pick)
+
+        item = _wait_play(watcher, spec, t0, session_id, "pick_result")
+        res = (item or {}).get("result")
+        session_id = (item or {}).get("session_id") or session_id
+        log.info(f"🔎 play result: {res} (consec={consecutive})")
+
+        if res != "inprogress":
+            log.info("🔴 loss/unknown → round reset")
+            nap(*t.after_loss)
+            return "lose"
+
+        consecutive += 1
+        if consecutive >= spec.streak:
+            log.info(f"🟢 {spec.streak}x inprogress → CASHOUT via (W)")
+            nap(*t.before_cashout)
+            press(driver, spec.cashout_key)
+            nap(*t.after_cashout)
+            return "success"
+
+        nap(*t.between_picks)
+
+    return "lose"
+
+def play_picks_paced(driver, watcher: DomPlayWatcher, spec: GameSpec, session_id: str | None = None) -> str:
+    """
+    PICK_BATCH: her pick ayrı gönderilir ama sabit beklemeler yerine tek action dizisinde (önde
+    PICK_BATCH_GAP_MS pause + tuş) → bir round trip. Bir sonraki pick ancak önceki sonuç 'inprogress'
+    ise gider; kayıptan sonra oyuna tuş basılmaz.
+    """
+    t = timings_for(spec)
+    log.info(f"🎲 Picks 1-{spec.streak} ({spec.pick_key.upper()}, paced, gap {PICK_BATCH_GAP_MS} ms)")
+    if is_fast():
+        wait_frame_idle(driver)
+
+    for pick in range(1, spec.streak + 1):
+        t0 = now_ms(driver)
+        lead = PICK_BATCH_GAP_MS if pick > 1 else 0
+        send_key_action(driver, spec.pick_key, lead_ms=lead)
+        item = _wait_play(watcher, spec, t0 + lead, session_id, "pick_result")
+        res = (item or {}).get("result")
+        session_id = (item or {}).get("session_id") or session_id
+        log.info(f"🔎 pick {pick} result: {res}")
+        if res != "inprogress":
+            log.info("🔴 loss/unknown → round reset")
+            nap(*t.after_loss)
+            return "lose"
+
+    log.info(f"🟢 {spec.streak}x inprogress → CASHOUT via (W)")
+    nap(*t.before_cashout)
+    press(driver, spec.cashout_key)
+    nap(*t.after_cashout)
+    return "success"
+
+def run_cashout(driver, watcher: DomPlayWatcher, spec: GameSpec, max_rounds: int) -> str:
+    for rnd in range(1, max_rounds + 1):
+        log.info(f"===== ROUND {rnd} =====")
+        outcome = play_one_round(driver, watcher, spec)
+        log.info(f"🏁 round outcome: {outcome}")
+        if outcome == "success":
+            return "success"
+        time.sleep(timings_for(spec).between_rounds)
+    return "stopped"
+
+STRATEGIES = {
+    STOP_ROUNDS: run_rounds,
+    STOP_WIN_STREAK: run_win_streak,
+    STOP_CASHOUT: run_cashout,
+}
+
+def run_strategy(driver, watcher: DomPlayWatcher, spec: GameSpec, max_rounds: int | None = None) -> str:
+    for key in spec.pre_keys:
+        log.info(f"🟩 Initial single pick ({key.upper()})")
+        press(driver, key)
+        time.sleep(timings_for(spec).after_pre_keys)
+    return STRATEGIES[spec.stop](driver, watcher, spec, max_rounds or spec.max_rounds)
+
+# ================= Orchestration =================
+def max_rounds_for(spec: GameSpec) -> int:
+    """MAX_ROUNDS env'i yalnızca tek oyun koşumlarında anlamlı; yoksa spec varsayılanı."""
+    return int(os.getenv("MAX_ROUNDS", str(spec.max_rounds)))
+
+def record_backend(watcher, spec: GameSpec):
+    """Oyun boyunca yakalanan /v1/play ağ ölçümlerini "backend" fazı olarak rapora yazar."""
+    samples = watcher.drain_net()
+    for s in samples:
+        if s.get("total_ms") is None:
+            continue
+        record("backend", s["total_ms"], game=spec.name, ttfb_ms=s.get("ttfb_ms"),
+               status=s.get("status"), bytes=s.get("bytes"), via=s.get("via"))
+    if samples:
+        log.info(f"📡 backend samples: {len(samples)}")
+
+def play_game(driver, spec: GameSpec, max_rounds: int | None = None) -> str:
+    """Lobby'deki (login olmuş) driver üzerinde tek bir oyunu baştan sona oynar."""
+    with span("open_game", game=spec.name):
+        open_game(driver, spec)
+    with span("iframe_discovery", game=spec.name):
+        switch_to_game_iframe(driver, spec)
+    with span("canvas_focus", game=spec.name):
+        focus_canvas_without_click(driver, spec)  # 👈 tıklama yok, sadece odak
+
+    watcher = make_watcher(driver, action=spec.result_action)
+    with span("hook_install", game=spec.name):
+        watcher.install()
+    log.info(f"🧩 play capture ready ({type(watcher).__name__}, {spec.title})")
+    nap(*timings_for(spec).after_install)
+
+    try:
+        outcome = run_strategy(driver, watcher, spec, max_rounds)
+    finally:
+        try:
+            record_backend(watcher, spec)
+        finally:
+            watcher.close()
+    stats = watcher.stats() or {}
+    if stats.get("overflow"):
+        log.warning(f"⚠️ play queue overflow: {stats}")
+    return outcome
+
+def run_games(specs, driver=None, credentials=None) -> dict:
+    """
+    Tüm oyunları tek driver + tek login ile art arda koşar.
+    Bir oyunun hatası diğerlerini durdurmaz; sonuç {name: outcome|"error"} döner.
+    """
+    own_driver = driver is None
+    outcomes = {}
+    with player_credentials(credentials) as (username, password):
+        driver = driver or make_driver()
+        try:
+            _run_games_logged_in(driver, specs, username, password, outcomes)
+        finally:
+            if own_driver:
+                driver.quit()
+    return outcomes
+
+def _run_games_logged_in(driver, specs, username, password, outcomes: dict):
+    nap(*timings_for().after_nav)
+    login(driver, username, password)
+    for i, spec in enumerate(specs):
+        if i:
+            back_to_lobby(driver)
+        log.info(f"=== GAME {spec.name} ({i + 1}/{len(specs)}) ===")
+        try:
+            outcomes[spec.name] = play_game(driver, spec)
+        except Exception as e:
+            log.error(f"⛔ {spec.name} failed: {e}")
+            outcomes[spec.name] = "error"
+        log.info(f"🏁 {spec.name} outcome: {outcomes[spec.name]}")
+
+def run_single(spec: GameSpec) -> str:
+    """Tek oyun script'lerinin (dice.py vb.) giriş noktası."""
+    log.info(f"=== START ({spec.name}) run_id={run_id()} ===")
+    with player_credentials() as (username, password):
+        driver = make_driver()
+        try:
+            nap(*timings_for().after_nav)
+            login(driver, username, password, game=spec.name)
+            outcome = play_game(driver, spec, max_rounds_for(spec))
+            log.info(f"🏁 outcome: {outcome}")
+            return outcome
+        finally:
+            driver.quit()
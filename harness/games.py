@@ -0,0 +1,42 @@
+# harness/games.py
+# -*- coding: utf-8 -*-
+"""Oyun tanımları (GameSpec). Sıra main.py TEST_FILES sırasıyla aynıdır."""
+from harness.game import GameSpec, Timings, STOP_ROUNDS, STOP_WIN_STREAK, STOP_CASHOUT
+from locators.warpwar_locators import WarpWarLocators
+from locators.dragontower_locators import DragonTowerLocators
+from locators.mines_locators import MinesLocators
+from locators.diamonds_locators import DiamondsLocators
+from locators.keno_locators import KenoLocators
+from locators.limbo_locators import LimboLocators
+from locators.dice_locators import DiceLocators
+
+# SPACE → Q → (2x inprogress) → W
+WARPWAR = GameSpec(
+    name="warpwar", title="Warp War", locators=WarpWarLocators,
+    stop=STOP_CASHOUT, max_rounds=20, streak=2, max_picks=2, result_action=None,
+    timings=Timings(between_picks=(1.1, 1.5), before_cashout=(0.5, 0.9)),
+)
+
+# SPACE → Q … (4x inprogress) → W
+DRAGON_TOWER = GameSpec(
+    name="dragon_tower", title="Dragon Tower", locators=DragonTowerLocators,
+    stop=STOP_CASHOUT, max_rounds=50, streak=4, max_picks=10, result_action=None,
+)
+
+MINES = GameSpec(
+    name="mines", title="Mines", locators=MinesLocators,
+    stop=STOP_CASHOUT, max_rounds=50, streak=4, max_picks=12, result_action=None,
+)
+
+# 10 tur SPACE, win/loss logla
+DIAMONDS = GameSpec(name="diamonds", title="Diamonds", locators=DiamondsLocators, stop=STOP_ROUNDS, max_rounds=10)
+LIMBO    = GameSpec(name="limbo", title="Limbo", locators=LimboLocators, stop=STOP_ROUNDS, max_rounds=10)
+DICE     = GameSpec(name="dice", title="Dice (Jungle Hunt)", locators=DiceLocators, stop=STOP_ROUNDS, max_rounds=10)
+
+# Q bir kez (pre-pick) → SPACE … (2x win) → dur; çekiliş animasyonu en yavaş sonuç → 15 sn bekleme
+KENO = GameSpec(
+    name="keno", title="Keno", locators=KenoLocators,
+    stop=STOP_WIN_STREAK, max_rounds=80, streak=2, pre_keys=("q",), result_timeout=15.0,
+)
+
+GAMES = {spec.name: spec for spec in (WARPWAR, DRAGON_TOWER, MINES, DIAMONDS, KENO, LIMBO, DICE)}
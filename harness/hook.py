@@ -0,0 +1,339 @@
+# harness/hook.py
+# -*- coding: utf-8 -*-
+"""Oyun iframe'ine enjekte edilen /v1/play hook'u (fetch + XHR) ve Python tarafı okuyucusu."""
+import os
+import time
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from common.browser_utils import _truthy
+
+SCRIPT_TIMEOUT_SLACK = 2.0  # JS tarafı kendi timeout'unda null döner; WebDriver timeout'u biraz daha geniş
+
+HOOK_CAPACITY     = int(os.getenv("PLAY_HOOK_CAPACITY", "256"))        # ring buffer kayıt sayısı
+HOOK_KEEP_PAYLOAD = _truthy(os.getenv("PLAY_HOOK_KEEP_PAYLOAD", "0"))  # ham JSON'u da sakla
+
+# Domain fark etmez; "/v1/play" içeren tüm çağrıları yakalarız.
+# Kayıt: {t, url, action, result, session_id, tile_index, mines_count, level, index} (+ payload, keep_payload ise)
+HOOK_JS = r"""
+(() => {
+  try {
+    if (window.__PLAY_HOOK_INSTALLED__) return;
+    window.__PLAY_HOOK_INSTALLED__ = true;
+
+    // execute_script(HOOK_JS, capacity, keepPayload)
+    const CAP  = (arguments[0] >>> 0) || 256;
+    const KEEP = !!arguments[1];
+
+    const PLAY_HINT = "/v1/play";
+    function norm(v){
+      if(!v) return null;
+      v = String(v).toLowerCase();
+      if (v === "win" || v === "won" || v === "success") return "win";
+      if (v === "loss" || v === "lose" || v === "lost" || v === "fail") return "lose";
+      if (v === "in_progress" || v === "inprogress") return "inprogress";
+      return null;
+    }
+    function num(v){ return typeof v === "number" ? v : null; }
+
+    // ---- Sabit kapasiteli ring buffer + session_id / action indeksleri ----
+    // Her kayıt monoton bir seq alır; slot = seq % CAP. İndeksler çift yönlü bağlı listedir ve
+    // kayıt her listedeki düğümünü taşır: alınan / üzerine yazılan kayıt tüm indekslerden O(1)
+    // sökülür, boşalan anahtar silinir. Listelerde ölü girdi kalmaz → session/action başı O(1) pop.
+    function List(map, key){ this.head = null; this.tail = null; this.n = 0; this.map = map; this.key = key; }
+    function link(q, r){
+      const node = {r, q, prev: q.tail, next: null};
+      if (q.tail) q.tail.next = node; else q.head = node;
+      q.tail = node; q.n++;
+      r.nodes.push(node);
+    }
+    function unlink(node){
+      const q = node.q;
+      if (node.prev) node.prev.next = node.next; else q.head = node.next;
+      if (node.next) node.next.prev = node.prev; else q.tail = node.prev;
+      q.n--;
+      if (!q.n && q.map) q.map.delete(q.key);
+    }
+    function index(map, key, r){
+      let q = map.get(key);
+      if (!q) { q = new List(map, key); map.set(key, q); }
+      link(q, r);
+    }
+    function remove(r){ for (const node of r.nodes) unlink(node); r.nodes = null; size--; }
+
+    let buf, all, byAction, bySession, seq = 0, size = 0, overflow = 0;
+    function reset(){ buf = new Array(CAP); all = new List(null, null); byAction = new Map(); bySession = new Map(); size = 0; }
+    reset();
+
+    function store(rec){
+      const s = seq++, old = buf[s % CAP];
+      // slot yeniden kullanılıyor ve eski kayıt okunmamış: overflow, indekslerden sök
+      if (old && old.nodes) { overflow++; remove(old); }
+      rec.seq = s; rec.nodes = []; buf[s % CAP] = rec; size++;
+      link(all, rec);
+      if (rec.action) index(byAction, rec.action, rec);
+      if (rec.session_id) index(bySession, rec.session_id, rec);
+    }
+
+    function push(url, payload){
+      try{
+        const d = (payload && payload.data) || {};
+        const rec = {
+          t: Date.now(),
+          url,
+          action: d.action || null,
+          result: norm(d.result),
+          session_id: d.session_id || null,
+          tile_index: num(d.tile_index),
+          mines_count: num(d.mines_count),
+          level: num(d.level),
+          index: num(d.index)
+        };
+        if (KEEP) rec.payload = payload;
+        store(rec);
+        if (waiters.length) notify();
+      }catch(e){}
+    }
+
+    window.__PLAY_FLUSH_ALL__ = () => { try { reset(); } catch(e){} };
+    window.__PLAY_STATS__ = () => ({capacity: CAP, size, overflow, total: seq, keep_payload: KEEP,
+                                    indexed: all.n, actions: byAction.size, sessions: bySession.size});
+
+    function take(r){ remove(r); const out = Object.assign({}, r); delete out.nodes; delete out.seq; return out; }
+    function matches(r, since, sid, act){ return r.t >= since && (!act || r.action === act) && (!sid || r.session_id === sid); }
+
+    // Filtreye uyan kayıtları (en eskiden) en fazla max adet çıkarır; en seçici indeks taranır.
+    // Listede yalnız canlı kayıt vardır: baş kayıt filtreye uyuyorsa pop tek adımdır.
+    window.__PLAY_DRAIN__ = (since, sid, act, max) => {
+      const q = sid ? bySession.get(sid) : (act ? byAction.get(act) : all);
+      const out = [];
+      for (let node = q && q.head; node && out.length < max; ) {
+        const next = node.next;  // take() düğümü söker; sonrakini önceden al
+        if (matches(node.r, since, sid, act)) out.push(take(node.r));
+        node = next;
+      }
+      return out;
+    };
+    window.__PLAY_POP__ = (since, sid, act) => window.__PLAY_DRAIN__(since, sid, act, 1)[0] || null;
+
+    // Bekleyen execute_async_script callback'leri: eşleşen push() anında çözülür
+    const waiters = [];
+    window.__PLAY_WAIT__ = (since, sid, act, timeoutMs, done) => {
+      const hit = window.__PLAY_POP__(since, sid, act);
+      if (hit) { done(hit); return; }
+      const w = {since, sid, act, done};
+      w.timer = setTimeout(() => {
+        const i = waiters.indexOf(w);
+        if (i >= 0) waiters.splice(i, 1);
+        done(null);
+      }, timeoutMs);
+      waiters.push(w);
+    };
+    function notify(){
+      for (let i = 0; i < waiters.length; i++) {
+        const w = waiters[i];
+        const hit = window.__PLAY_POP__(w.since, w.sid, w.act);
+        if (hit) { clearTimeout(w.timer); waiters.splice(i, 1); i--; w.done(hit); }
+      }
+    }
+
+    // ---- Ağ ölçümleri: her /v1/play çağrısı için başlangıç, ilk byte, bitiş, status, boyut ----
+    const NET = [];
+    let netOverflow = 0;
+    function pushNet(s){ NET.push(s); if (NET.length > CAP) { NET.shift(); netOverflow++; } }
+    function byteLen(headerLen, txt){
+      const n = Number(headerLen);
+      if (n > 0) return n;
+      try { return new TextEncoder().encode(txt || "").length; } catch(e) { return (txt || "").length; }
+    }
+    window.__PLAY_NET_DRAIN__ = () => NET.splice(0, NET.length);
+    window.__PLAY_NET_STATS__ = () => ({size: NET.length, overflow: netOverflow});
+
+    // fetch hook: gövde arka planda okunur, oyuna Response hemen döner
+    const _fetch = window.fetch;
+    window.fetch = async function(input, init){
+      const reqUrl = (typeof input === "string" ? input : (input && input.url)) || "";
+      const t0 = performance.now(), start = Date.now();
+      const p = _fetch.apply(this, arguments);
+      try{
+        const res = await p;
+        const url = (res && res.url) || reqUrl || "";
+        if (url.includes(PLAY_HINT)) {
+          const ttfb = performance.now() - t0;
+          res.clone().text().then((txt) => {
+            pushNet({t: start, url, via: "fetch", status: res.status, bytes: byteLen(res.headers.get("content-length"), txt),
+                     ttfb_ms: ttfb, total_ms: performance.now() - t0});
+            try{ push(url, JSON.parse(txt)); }catch(e){}
+          }).catch(() => {});
+        }
+        return res;
+      }catch(e){
+        if (reqUrl.includes(PLAY_HINT)) {
+          pushNet({t: start, url: reqUrl, via: "fetch", status: 0, bytes: 0, ttfb_ms: null, total_ms: performance.now() - t0});
+        }
+        throw e;
+      }
+    };
+
+    // XHR hook
+    const XHR = window.XMLHttpRequest;
+    const _open = XHR.prototype.open;
+    const _send = XHR.prototype.send;
+    XHR.prototype.open = function(method, url){ this.__url = url || ""; return _open.apply(this, arguments); };
+    XHR.prototype.send = function(){
+      const url = this.__url || "";
+      if (url.includes(PLAY_HINT)) {
+        const t0 = performance.now(), start = Date.now();
+        let ttfb = null;
+        this.addEventListener("readystatechange", function(){
+          if (this.readyState >= 2 && ttfb === null) ttfb = performance.now() - t0;  // HEADERS_RECEIVED
+        });
+        this.addEventListener("loadend", function(){
+          try{
+            const txt = (!this.responseType || this.responseType === "text") ? (this.responseText || "") : "";
+            pushNet({t: start, url, via: "xhr", status: this.status, bytes: byteLen(this.getResponseHeader("content-length"), txt),
+                     ttfb_ms: ttfb, total_ms: performance.now() - t0});
+          }catch(e){}
+        });
+        this.addEventListener("load", function(){
+          try{
+            const txt = this.responseText || "";
+            try{ push(url, JSON.parse(txt)); }catch(e){}
+          }catch(e){}
+        });
+      }
+      return _send.apply(this, arguments);
+    };
+  } catch(err){ console.error("HOOK_ERR", err); }
+})();
+"""
+
+POP_JS = """
+    const since = Number(arguments[0]) || 0, sid = arguments[1] || null, act = arguments[2] || null;
+    return window.__PLAY_POP__ ? window.__PLAY_POP__(since, sid, act) : null;
+"""
+
+DRAIN_JS = """
+    const since = Number(arguments[0]) || 0, sid = arguments[1] || null, act = arguments[2] || null;
+    return window.__PLAY_DRAIN__ ? window.__PLAY_DRAIN__(since, sid, act, arguments[3] >>> 0) : [];
+"""
+
+# execute_async_script: son argüman WebDriver'ın callback'i; hook yoksa hemen "no-hook" döner.
+# Eşleşme gelince kuyrukta bekleyen diğer kayıtlar (rest) ve ağ ölçümleri (net) de aynı cevapta döner.
+WAIT_JS = """
+    const done = arguments[arguments.length - 1];
+    if (!window.__PLAY_WAIT__) { done("no-hook"); return; }
+    const max = arguments[4] >>> 0;
+    window.__PLAY_WAIT__(Number(arguments[0]) || 0, arguments[1] || null, arguments[2] || null, arguments[3] >>> 0,
+      (hit) => done({hit: hit, rest: hit ? window.__PLAY_DRAIN__(0, null, null, max) : [],
+                     net: window.__PLAY_NET_DRAIN__ ? window.__PLAY_NET_DRAIN__() : []}));
+"""
+
+def _matches(it: dict, since_ms: int, session_id: str | None, action: str | None) -> bool:
+    return (it.get("t") or 0) >= since_ms and (not action or it.get("action") == action) \
+        and (not session_id or it.get("session_id") == session_id)
+
+class DomPlayWatcher:
+    """
+    Hook kuyruğunu timestamp + session_id (+ opsiyonel action) ile filtreleyerek okur.
+    action="result" → yalnızca sonuç kayıtları (Dice/Limbo/Diamonds/Keno); None → her kayıt (Mines/Dragon Tower/Warp War).
+    """
+    def __init__(self, driver, action: str | None = None,
+                 capacity: int = HOOK_CAPACITY, keep_payload: bool = HOOK_KEEP_PAYLOAD):
+        self.driver = driver
+        self.action = action
+        self.capacity = capacity
+        self.keep_payload = keep_payload
+        self._script_timeout = None
+        self._buffer: list[dict] = []   # tarayıcıdan toplu alınmış, henüz tüketilmemiş kayıtlar
+        self._net: list[dict] = []      # WAIT cevaplarıyla gelen ağ ölçümleri
+
+    def install(self):
+        self.driver.execute_script(HOOK_JS, int(self.capacity), bool(self.keep_payload))
+
+    def stats(self) -> dict | None:
+        """{capacity, size, overflow, total, keep_payload, indexed, actions, sessions}; overflow > 0 → okunmadan ezilen kayıt var."""
+        return self.driver.execute_script("return window.__PLAY_STATS__ ? window.__PLAY_STATS__() : null;")
+
+    def close(self):
+        """CdpPlayWatcher ile aynı arayüz; hook sayfada kalır, kapatılacak kaynak yok."""
+
+    def flush_all(self):
+        self._buffer.clear()
+        self.driver.execute_script("window.__PLAY_FLUSH_ALL__ && window.__PLAY_FLUSH_ALL__();")
+
+    def drain(self, since_ms: int = 0, session_id: str | None = None, action: str | None = None,
+              max_items: int | None = None) -> list[dict]:
+        """Filtreye uyan tüm kayıtlar tek execute_script ile (önce Python buffer'ı, sonra tarayıcı)."""
+        limit = max_items or self.capacity
+        out = self._take_buffered(since_ms, session_id, action, limit)
+        if len(out) < limit:
+            out += self.driver.execute_script(DRAIN_JS, int(since_ms), session_id, action, limit - len(out)) or []
+        return out
+
+    def _take_buffered(self, since_ms, session_id, action, limit) -> list[dict]:
+        out, keep = [], []
+        for it in self._buffer:
+            if len(out) < limit and _matches(it, since_ms, session_id, action):
+                out.append(it)
+            else:
+                keep.append(it)
+        self._buffer = keep
+        return out
+
+    def drain_net(self) -> list[dict]:
+        """/v1/play ağ ölçümleri: {t, url, via, status, bytes, ttfb_ms, total_ms}; okunanlar silinir."""
+        out, self._net = self._net, []
+        try:
+            out += self.driver.execute_script(
+                "return window.__PLAY_NET_DRAIN__ ? window.__PLAY_NET_DRAIN__() : [];") or []
+        except WebDriverException:
+            pass  # iframe kapanmış olabilir; eldekiler yeter
+        return out
+
+    def pop_next_since(self, since_ms: int, session_id: str | None, action: str | None = None):
+        buffered = self._take_buffered(since_ms, session_id, action, 1)
+        if buffered:
+            return buffered[0]
+        return self.driver.execute_script(POP_JS, int(since_ms), session_id, action)
+
+    def pop_result_since(self, since_ms: int, session_id: str | None):
+        return self.pop_next_since(since_ms, session_id, action="result")
+
+    def wait_result(self, since_ms: int, session_id: str | None, timeout: float = 12.0) -> dict | None:
+        """
+        Önce Python buffer'ı; yoksa tek round trip: hook, eşleşen push() olduğu anda
+        execute_async_script callback'ini çözer ve kuyrukta kalan kayıtları da buffer'a getirir.
+        Hook sayfada yoksa (ör. iframe yeniden yüklendi) eski polling'e düşer.
+        """
+        buffered = self._take_buffered(since_ms, session_id, self.action, 1)
+        if buffered:
+            return buffered[0]
+        self._ensure_script_timeout(timeout)
+        try:
+            res = self.driver.execute_async_script(
+                WAIT_JS, int(since_ms), session_id, self.action, int(timeout * 1000), int(self.capacity))
+        except TimeoutException:
+            return None
+        if res == "no-hook":
+            return self._poll_result(since_ms, session_id, timeout)
+        self._buffer.extend((res or {}).get("rest") or [])
+        del self._buffer[:-self.capacity]
+        self._net.extend((res or {}).get("net") or [])
+        return (res or {}).get("hit") or None
+
+    def _ensure_script_timeout(self, timeout: float):
+        # script timeout session seviyesinde; yalnızca gerektiğinde (ekstra round trip) güncellenir
+        need = timeout + SCRIPT_TIMEOUT_SLACK
+        if self._script_timeout is None or self._script_timeout < need:
+            self.driver.set_script_timeout(need)
+            self._script_timeout = need
+
+    def _poll_result(self, since_ms: int, session_id: str | None, timeout: float) -> dict | None:
+        t_end = time.time() + timeout
+        while time.time() < t_end:
+            item = self.pop_next_since(since_ms, session_id, self.action)
+            if item:
+                return item
+            time.sleep(0.09)
+        return None
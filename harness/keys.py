@@ -0,0 +1,63 @@
+# harness/keys.py
+# -*- coding: utf-8 -*-
+"""
+Hotkey gönderimi.
+
+  - dispatch_cdp_key: CDP Input.dispatchKeyEvent ile keyDown + keyUp (iki CDP komutu); klavye olayı
+    tarayıcı tarafında odaktaki frame'e (oyun iframe'indeki canvas) yönlenir, W3C action makinesi atlanır.
+  - send_key_action: tek tuşu, önündeki bekleme (lead_ms) pause olarak aynı W3C action dizisine
+    gömülü gönderir → bekleme + tuş için tek komut (sleep + ayrı gönderim yerine). perform() pause
+    boyunca bloklar; dönüş tuş tarayıcıya ulaştıktan sonradır.
+
+Pick'ler tek tek gönderilir: her pick kaybedebilir ve kayıptan sonra oyuna tuş gitmemelidir, bu yüzden
+birden çok pick'i önceden tek action dizisine koymak güvenli değildir (bkz. game.play_picks_paced).
+
+Gönderim çağıranın thread'inde yapılır: chromedriver bir oturumun komutlarını sırayla işler, arka
+plandaki bir tuş komutu hook'un wait_result long-poll'unun arkasına düşüp sonucu hiç tetiklemeyebilir.
+"""
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.common.actions.action_builder import ActionBuilder
+
+# özel tuşlar: (key, code, windowsVirtualKeyCode, text)
+_SPECIAL_KEYS = {
+    Keys.SPACE: (" ", "Space", 32, " "),
+    Keys.ENTER: ("Enter", "Enter", 13, "\r"),
+    Keys.RETURN: ("Enter", "Enter", 13, "\r"),
+    Keys.ESCAPE: ("Escape", "Escape", 27, ""),
+}
+
+def cdp_key_params(key: str) -> dict | None:
+    """Input.dispatchKeyEvent parametreleri (keyDown için); desteklenmeyen tuşta None."""
+    if key in _SPECIAL_KEYS:
+        k, code, vk, text = _SPECIAL_KEYS[key]
+    elif len(key) == 1 and key.isascii() and key.isalnum():
+        k, vk, text = key, ord(key.upper()), key
+        code = f"Key{key.upper()}" if key.isalpha() else f"Digit{key}"
+    else:
+        return None
+    params = {"key": k, "code": code, "windowsVirtualKeyCode": vk, "nativeVirtualKeyCode": vk}
+    if text:
+        params["text"] = params["unmodifiedText"] = text
+    return params
+
+def dispatch_cdp_key(driver, key: str) -> bool:
+    """Tuşu CDP ile basıp bırakır; desteklenmeyen tuşta False (çağıran ActionChains'e düşer)."""
+    params = cdp_key_params(key)
+    if params is None:
+        return False
+    driver.execute_cdp_cmd("Input.dispatchKeyEvent", {"type": "keyDown", **params})
+    up = {k: v for k, v in params.items() if k not in ("text", "unmodifiedText")}
+    driver.execute_cdp_cmd("Input.dispatchKeyEvent", {"type": "keyUp", **up})
+    return True
+
+def send_key_action(driver, key: str, lead_ms: float = 0):
+    """
+    key'i tek action dizisinde gönderir; lead_ms > 0 ise tuştan önce aynı dizide pause. Pause doğrudan
+    klavye kaynağına konur (ActionChains.pause klavye pause'unu tam saniyeye keser, gecikme yalnızca
+    pointer kaynağının aynı tick'teki pause'undan gelirdi); dizide yalnızca klavye kaynağı gider.
+    """
+    builder = ActionBuilder(driver)
+    if lead_ms:
+        builder.key_action.pause(lead_ms / 1000)
+    builder.key_action.send_keys(key)
+    builder.perform()
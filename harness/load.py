@@ -0,0 +1,149 @@
+# harness/load.py
+# -*- coding: utf-8 -*-
+"""
+Yük modu: tek oyuna karşı N eşzamanlı sanal oyuncu.
+
+    python -m harness.load dice --players 8 --ramp-up 30 --rounds 20
+    python -m harness.load dice --players 1,2,4,8,16 --light      # kademeli tarama
+
+  - Her oyuncu kendi driver'ında aynı login → open_game → hotkey stratejisi kodunu koşar
+    (ACCOUNT_POOL=1 → her oyuncuya hesap havuzundan ayrı hesap)
+  - Oyuncular ramp-up süresine eşit aralıklarla yayılarak başlar
+  - --light: headless + BROWSER_PROFILE=lean (bkz. common/browser_utils)
+  - --shared-driver: tüm oyuncular tek chromedriver süreci üzerinden (bkz. common/driver_service)
+  - Her kademe kendi RUN_ID'siyle (<run_id>-p<N>) span yazar; rapor: throughput (tur/sn; cashout
+    oyunlarında her pick bir adım sayılır), hata oranı (sonuç timeout'u + HTTP hata + çöken oyuncu),
+    sonuç gecikmesi p50/p95/p99 ve backend özeti → REPORT_DIR/load-<run_id>.json
+"""
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from common import timing
+from harness.game import ACCOUNT_POOL, make_driver, login, load_test_user, play_game, player_credentials
+from harness.games import GAMES
+
+LOG_FMT = "%(asctime)s | %(levelname)-7s | %(message)s"
+log = logging.getLogger("load")
+
+LOAD_PLAYERS = os.getenv("LOAD_PLAYERS", "4")
+LOAD_RAMP_UP = float(os.getenv("LOAD_RAMP_UP", "10"))
+LOAD_ROUNDS  = int(os.getenv("LOAD_ROUNDS", "10"))
+
+RESULT_PHASES = ("bet_result", "pick_result")
+
+def _player(idx: int, spec, rounds: int, start_at: float, credentials) -> str:
+    delay = start_at - time.monotonic()
+    if delay > 0:
+        time.sleep(delay)
+    log.info(f"👤 player {idx} starting ({spec.name})")
+    with player_credentials(credentials) as creds:
+        driver = make_driver()
+        try:
+            login(driver, *creds, game=spec.name)
+            return play_game(driver, spec, rounds)
+        finally:
+            driver.quit()
+
+def run_level(spec, players: int, ramp_up: float, rounds: int, credentials) -> dict:
+    """Tek eşzamanlılık kademesini koşar ve özetini döndürür."""
+    t0 = time.monotonic()
+    step = ramp_up / players if players > 1 else 0.0
+    failures = 0
+    lock = threading.Lock()
+
+    def _run(idx):
+        nonlocal failures
+        try:
+            return _player(idx, spec, rounds, t0 + idx * step, credentials)
+        except Exception as e:
+            log.error(f"⛔ player {idx} failed: {e}")
+            with lock:
+                failures += 1
+            return "error"
+
+    with ThreadPoolExecutor(max_workers=players) as ex:
+        outcomes = list(ex.map(_run, range(players)))
+    wall = time.monotonic() - t0
+    return summarize_level(timing.load_spans(), spec.name, players, wall, failures, outcomes)
+
+def summarize_level(rows, game: str, players: int, wall_sec: float, failures: int, outcomes) -> dict:
+    rows = [r for r in rows if r.get("game") == game]
+    latency = [r["ms"] for r in rows if r["phase"] in RESULT_PHASES]
+    timeouts = sum(1 for r in rows if r["phase"] == "result_timeout")
+    backend = timing.summarize_backend(rows).get(game) or {}
+    attempts = len(latency) + timeouts
+    errors = timeouts + backend.get("errors", 0) + failures
+    return {
+        "players": players,
+        "wall_sec": round(wall_sec, 2),
+        "results": len(latency),
+        "timeouts": timeouts,
+        "player_failures": failures,
+        "backend_errors": backend.get("errors", 0),
+        "throughput_rps": round(len(latency) / wall_sec, 3) if wall_sec > 0 else 0.0,
+        "error_rate": round(errors / max(1, attempts + failures), 4),
+        **{f"p{p}": timing.percentile(latency, p) for p in (50, 95, 99)},
+        "backend": backend,
+        "outcomes": outcomes,
+    }
+
+def format_levels(levels) -> str:
+    lines = [f"{'players':>7} {'results':>8} {'rounds/s':>9} {'err %':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"]
+    for lv in levels:
+        lines.append(f"{lv['players']:>7} {lv['results']:>8} {lv['throughput_rps']:>9.2f} {lv['error_rate'] * 100:>7.1f}"
+                     f" {lv['p50']:>8.0f} {lv['p95']:>8.0f} {lv['p99']:>8.0f}")
+    return "\n".join(lines)
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Load mode: N concurrent virtual players against one game")
+    ap.add_argument("game", choices=list(GAMES))
+    ap.add_argument("--players", default=LOAD_PLAYERS,
+                    help="eşzamanlı oyuncu sayısı; virgülle liste → kademeli tarama (ör. 1,2,4,8)")
+    ap.add_argument("--ramp-up", type=float, default=LOAD_RAMP_UP, help="tüm oyuncuların başlaması için süre (sn)")
+    ap.add_argument("--rounds", type=int, default=LOAD_ROUNDS, help="oyuncu başına tur üst sınırı")
+    ap.add_argument("--light", action="store_true", help="headless + lean Chrome profili")
+    ap.add_argument("--shared-driver", action="store_true", help="oyuncu başına değil, tek chromedriver süreci")
+    args = ap.parse_args(argv)
+    try:
+        levels = [int(n) for n in str(args.players).split(",") if n.strip()]
+    except ValueError:
+        ap.error(f"geçersiz --players: {args.players}")
+    if not levels or min(levels) < 1:
+        ap.error("--players en az 1 olmalı")
+
+    if args.light:
+        os.environ["HEADLESS"] = "1"
+        os.environ["BROWSER_PROFILE"] = "lean"
+    if args.shared_driver:
+        os.environ["SHARED_DRIVER"] = "1"
+    spec = GAMES[args.game]
+    credentials = None if ACCOUNT_POOL else load_test_user()   # havuz açıksa her oyuncu kendi hesabını kiralar
+    base_rid = timing.run_id()
+
+    results = []
+    for players in levels:
+        os.environ["RUN_ID"] = f"{base_rid}-p{players}"
+        log.info(f"=== LOAD {spec.name}: {players} players, ramp-up {args.ramp_up}s, {args.rounds} rounds ===")
+        results.append(run_level(spec, players, args.ramp_up, args.rounds, credentials))
+        log.info(f"📈 {players} players → {results[-1]['throughput_rps']} rounds/s, "
+                 f"error rate {results[-1]['error_rate']:.1%}, p95 {results[-1]['p95']:.0f} ms")
+    os.environ["RUN_ID"] = base_rid
+
+    report = {"run_id": base_rid, "game": spec.name, "ramp_up": args.ramp_up, "rounds": args.rounds,
+              "light": args.light, "levels": results}
+    os.makedirs(timing.REPORT_DIR, exist_ok=True)
+    out = os.path.join(timing.REPORT_DIR, f"load-{base_rid}.json")
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"\n📊 Load report ({spec.name}):\n{format_levels(results)}\n📄 {out}", flush=True)
+    return 1 if any(lv["player_failures"] for lv in results) else 0
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format=LOG_FMT)
+    sys.exit(main())
@@ -0,0 +1,506 @@
+# harness/mock_server.py
+# -*- coding: utf-8 -*-
+"""
+Yerel sahte lobby + oyun backend'i (yalnızca stdlib): ağsız, deterministik koşular ve harness overhead ölçümü.
+
+    python -m harness.mock_server --port 8765 --latency-ms 20-60
+    python -m harness.mock_server --sequence dice:bet=win,lose,lose --sequence mines:pick=inprogress,lose
+    python -m harness.mock_server --fixed-rounds 3 --seed 42      # her strateji tam 3 turda biter
+    BASE_URL=http://127.0.0.1:8765/ python main.py
+
+  - Lobby / login / register modal'ları locators/ XPath'leriyle birebir aynı DOM yapısında
+  - /games/<oyun> → Real Play → aynı origin'de /play/<oyun> iframe'i; <canvas> SPACE/Q/W'ye tepki verir
+  - POST /v1/play {game, action: bet|pick|cashout, session_id, index} → {data: {action, result, session_id, ...}}
+    (tarayıcı fetch'i ve harness.protocol aynı endpoint'i kullanır)
+    Cashout oyunlarında (CASHOUT_GAMES) bet inprogress bir oturum açar; pick'ler o oturumda inprogress/lose döner,
+    lose ya da cashout (win) oturumu kapatır, kapalı/bilinmeyen oturuma istek → 400
+  - Sonuçlar: --sequence / --script / --fixed-rounds ile döngüsel dizi, yoksa (--seed ile tohumlu) rastgele;
+    POST /mock/reset dizileri başa sarar. Gecikme --latency-ms (sabit ya da min-max)
+  - Hesaplar bellekte; test_user_data.json'daki kullanıcı açılışta tanımlı gelir
+  - /v1/play oturum cookie'si (ya da Bearer token) ister; --no-auth ile açık
+"""
+import os
+import sys
+import json
+import time
+import random
+import secrets
+import logging
+import argparse
+import threading
+from http.cookies import SimpleCookie
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit
+
+from common.user_data import load_user_data
+
+LOG_FMT = "%(asctime)s | %(levelname)-7s | %(message)s"
+log = logging.getLogger("mock_server")
+
+MOCK_HOST       = os.getenv("MOCK_HOST", "127.0.0.1")
+MOCK_PORT       = int(os.getenv("MOCK_PORT", "8765"))
+MOCK_LATENCY_MS = os.getenv("MOCK_LATENCY_MS", "0")
+MOCK_SEED       = os.getenv("MOCK_SEED") or None
+MOCK_SCRIPT     = os.getenv("MOCK_SCRIPT") or None
+SESSION_COOKIE  = "mock_session"
+
+# Lobby kart sırası = locators/*: GAME_TILE_IMG a[1..7]
+TILES = ("warpwar", "dragon_tower", "mines", "diamonds", "keno", "limbo", "dice")
+# Keno'da Q sayı seçer (sonuç yok); diğer pick oyunlarında Q bir kare açar
+PICK_WITHOUT_RESULT = {"keno"}
+# STOP_CASHOUT oyunları: bet sonuç değil, açık (inprogress) oturum döndürür; tur pick kaybı ya da cashout ile kapanır
+CASHOUT_GAMES = {"warpwar", "dragon_tower", "mines"}
+
+def parse_latency(spec: str) -> tuple[float, float]:
+    """"30" → (30, 30), "20-80" → (20, 80) ms."""
+    lo, _, hi = str(spec or "0").partition("-")
+    lo = float(lo or 0)
+    return lo, float(hi) if hi else lo
+
+def parse_sequence(arg: str) -> tuple[str, str, list]:
+    """"dice:bet=win,lose" → ("dice", "bet", ["win", "lose"])."""
+    target, _, values = arg.partition("=")
+    game, _, action = target.partition(":")
+    if not game or action not in ("bet", "pick") or not values:
+        raise ValueError(f"geçersiz --sequence: {arg!r} (beklenen <oyun>:<bet|pick>=a,b,...)")
+    if action == "bet" and game in CASHOUT_GAMES:
+        raise ValueError(f"{game}: bet her zaman inprogress oturum açar; yalnızca pick dizisi verilebilir")
+    return game, action, [v.strip() for v in values.split(",") if v.strip()]
+
+def load_script(fp: str) -> dict:
+    """JSON {"<oyun>": {"bet": [...], "pick": [...]}} → {(oyun, aksiyon): [...]}."""
+    with open(fp, "r", encoding="utf-8") as f:
+        raw = json.load(f)
+    out = {}
+    for game, actions in raw.items():
+        for action, values in (actions or {}).items():
+            if action not in ("bet", "pick") or not isinstance(values, list) or not values \
+                    or (action == "bet" and game in CASHOUT_GAMES):
+                raise ValueError(f"geçersiz script girdisi: {game}.{action}")
+            out[(game, action)] = [str(v) for v in values]
+    return out
+
+def fixed_length_script(specs, rounds: int) -> dict:
+    """
+    Her stratejinin tam `rounds` turda bitmesini sağlayan diziler (GameSpec durma koşullarından):
+      - cashout:    (rounds-1) x [inprogress, lose] + streak x inprogress → son turda cashout
+      - win_streak: (rounds-streak) x lose + streak x win; rounds < streak ise rounds x win
+                    (seri tamamlanamaz → koşu, koşucunun tur sınırıyla biter: MAX_ROUNDS / --rounds)
+      - rounds:     sabit tur sayılı; bet dizisi win/lose dönüşümlü
+    Bet dizileri tam `rounds` uzunluğundadır. İmleçler oyuncu başına tutulur (Outcomes), dolayısıyla
+    her oyuncu script'i baştan okur ve eşzamanlı oyuncular birbirinin turunu tüketmez.
+    """
+    from harness.game import STOP_CASHOUT, STOP_WIN_STREAK   # mock yalnızca script üretirken harness'a bağlanır
+    rounds = max(1, rounds)
+    out = {}
+    for spec in specs:
+        if spec.stop == STOP_CASHOUT:
+            out[(spec.name, "pick")] = ["in_progress", "lose"] * (rounds - 1) + ["in_progress"] * spec.streak
+        elif spec.stop == STOP_WIN_STREAK:
+            out[(spec.name, "bet")] = ["lose"] * max(0, rounds - spec.streak) + ["win"] * min(spec.streak, rounds)
+        else:
+            out[(spec.name, "bet")] = (["win", "lose"] * rounds)[:rounds]
+    return out
+
+class Outcomes:
+    """
+    Oyuncu/oyun/aksiyon başına sonuç üretici: tanımlı dizi döngüsel okunur, yoksa rastgele.
+    İmleçler oyuncu başına (player: X-Player başlığı ya da oturum token'ı) → eşzamanlı oyuncular
+    aynı script'i birbirinden bağımsız, baştan okur.
+    seed verilirse her akış kendi RNG'sini "<seed>:<oyuncu sırası>:<oyun>:<aksiyon>" ile tohumlar
+    (oyuncu sırası = ilk görülme sırası) → oyunların karışık sırada oynanması sonuçları değiştirmez.
+    """
+    def __init__(self, sequences: dict | None = None, rng: random.Random | None = None, seed: str | None = None):
+        self.sequences = sequences or {}          # {(game, action): [..]}
+        self.rng = rng or random.Random()
+        self.seed = seed
+        self._cursor: dict[tuple, int] = {}
+        self._rngs: dict[tuple, random.Random] = {}
+        self._players: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def reset(self):
+        """Dizi imleçlerini ve tohumlu RNG'leri başa sarar (ardışık benchmark koşuları için)."""
+        with self._lock:
+            self._cursor.clear()
+            self._rngs.clear()
+            self._players.clear()
+
+    def _rng_for(self, key: tuple) -> random.Random:
+        """key = (oyuncu, oyun, aksiyon)."""
+        if self.seed is None:
+            return self.rng
+        if key not in self._rngs:
+            ordinal = self._players.setdefault(key[0], len(self._players))
+            self._rngs[key] = random.Random(f"{self.seed}:{ordinal}:{key[1]}:{key[2]}")
+        return self._rngs[key]
+
+    def next(self, game: str, action: str, player: str = ""):
+        if action == "pick" and game in PICK_WITHOUT_RESULT:
+            return None
+        key = (player, game, action)
+        with self._lock:
+            seq = self.sequences.get((game, action))
+            if seq:
+                i = self._cursor.get(key, 0)
+                self._cursor[key] = i + 1
+                return seq[i % len(seq)]
+            rng = self._rng_for(key)
+            if action == "bet":
+                return rng.choice(("win", "lose"))
+            return "in_progress" if rng.random() < 0.75 else "lose"
+
+class MockState:
+    def __init__(self, outcomes: Outcomes, latency_ms=(0.0, 0.0), require_auth: bool = True):
+        self.outcomes = outcomes
+        self.latency_ms = latency_ms
+        self.require_auth = require_auth
+        self.users: dict[str, dict] = {}          # username/email → {username, email, password}
+        self.tokens: set[str] = set()
+        self.plays = 0
+        self.sessions: dict[str, str] = {}         # açık cashout oturumları: session_id → oyun
+        self._lock = threading.Lock()
+        try:
+            u = load_user_data()
+            self.add_user(u.get("email") or "", u.get("username") or "", u.get("password") or "")
+        except (FileNotFoundError, ValueError, KeyError):
+            pass
+
+    def add_user(self, email, username, password):
+        rec = {"email": email, "username": username, "password": password}
+        with self._lock:
+            for key in (email, username):
+                if key:
+                    self.users[key] = rec
+
+    def check_user(self, login, password) -> bool:
+        rec = self.users.get(login or "")
+        return bool(rec and password and rec["password"] == password)
+
+    def issue_token(self) -> str:
+        token = secrets.token_hex(16)
+        with self._lock:
+            self.tokens.add(token)
+        return token
+
+    def sleep(self):
+        lo, hi = self.latency_ms
+        if hi > 0:
+            time.sleep(random.uniform(lo, hi) / 1000.0)
+
+    def play(self, req: dict, player: str = "") -> dict:
+        game = str(req.get("game") or "")
+        action = str(req.get("action") or "")
+        if action not in ("bet", "pick", "cashout"):
+            raise ValueError(f"unknown action {action!r}")
+        if game in CASHOUT_GAMES:
+            session_id, result = self._play_cashout_game(game, action, req.get("session_id"), player)
+        else:
+            result = self.outcomes.next(game, action, player) if action != "cashout" else None
+            with self._lock:
+                self.plays += 1
+                session_id = req.get("session_id") if action != "bet" else None
+                session_id = session_id or f"{game}-{self.plays}"
+        return {"data": {
+            "action": {"bet": "bet" if game in CASHOUT_GAMES else "result", "pick": "pick", "cashout": "cashout"}[action],
+            "result": result,
+            "session_id": session_id,
+            "index": req.get("index"),
+            "tile_index": req.get("index") if action == "pick" else None,
+        }}
+
+    def _play_cashout_game(self, game: str, action: str, session_id, player: str = "") -> tuple[str, str]:
+        """bet → yeni açık oturum (inprogress); pick → inprogress/lose (lose kapatır); cashout → win (kapatır)."""
+        if action == "bet":
+            with self._lock:
+                self.plays += 1
+                session_id = f"{game}-{self.plays}"
+                self.sessions[session_id] = game
+            return session_id, "inprogress"
+        with self._lock:
+            if self.sessions.get(session_id) != game:
+                raise ValueError(f"no open {game} session {session_id!r}")
+            self.plays += 1
+        result = "win" if action == "cashout" else self.outcomes.next(game, action, player)
+        if action == "cashout" or result not in ("in_progress", "inprogress"):
+            with self._lock:
+                self.sessions.pop(session_id, None)
+        return session_id, result
+
+# ================= HTML =================
+_STYLE = """
+  body { margin: 0; font-family: sans-serif; background: #14161c; color: #eee; }
+  header > div { display: flex; gap: 16px; align-items: center; padding: 8px 16px; background: #1d2029; }
+  header nav:nth-of-type(2) { margin-left: auto; }
+  button { padding: 6px 14px; cursor: pointer; }
+  .hidden { display: none !important; }
+  .tiles { display: flex; flex-wrap: wrap; gap: 12px; padding: 12px; }
+  .tiles img { width: 180px; height: 110px; display: block; }
+  #modal > div { position: fixed; inset: 0; background: rgba(0,0,0,.6); display: flex; align-items: center; justify-content: center; }
+  #modal section { background: #222633; padding: 20px; }
+  #modal label { display: block; margin: 6px 0; }
+  iframe { width: 820px; height: 520px; border: 0; display: block; }
+"""
+
+def _tile_svg(name: str) -> str:
+    svg = (f"<svg xmlns='http://www.w3.org/2000/svg' width='180' height='110'><rect width='180' height='110' fill='%23334'/>"
+           f"<text x='90' y='60' fill='white' font-size='16' text-anchor='middle'>{name}</text></svg>")
+    return "data:image/svg+xml;utf8," + svg.replace("<", "%3C").replace(">", "%3E").replace(" ", "%20")
+
+LOBBY_HTML = """<!doctype html>
+<html><head><meta charset="utf-8"><title>DracoPanel mock</title><style>%(style)s</style></head>
+<body>
+<div id="root">
+  <main>
+    <header><div>
+      <nav><a href="/">DracoPanel (mock)</a></nav>
+      <nav id="authnav"><button type="button" id="btn-login">Giriş Yap</button><button type="button" id="btn-register">Kayıt Ol</button></nav>
+      <div id="usernav"><button type="button" id="btn-logout">Çıkış</button></div>
+    </div></header>
+    <div id="page"></div>
+  </main>
+  <div id="toasts"></div>
+  <div id="modal"></div>
+</div>
+<script>
+const TILES = %(tiles)s;
+const IMG = %(images)s;
+const $ = (id) => document.getElementById(id);
+const loggedIn = () => document.cookie.split("; ").some((c) => c.startsWith("%(cookie)s="));
+
+function renderHeader(){
+  $("authnav").classList.toggle("hidden", loggedIn());
+  $("usernav").classList.toggle("hidden", !loggedIn());
+}
+function renderPage(){
+  const m = location.pathname.match(/^\\/games\\/([a-z_]+)/);
+  if (m) {
+    const game = m[1];
+    $("page").innerHTML = '<div><div class="actions"><button type="button" id="real-play">Real Play</button>'
+      + '<button type="button">Demo</button></div><div id="stage"></div></div>';
+    $("real-play").onclick = () => {
+      $("stage").innerHTML = '<iframe src="/play/' + game + '" title="' + game + '"></iframe>';
+    };
+    return;
+  }
+  $("page").innerHTML = '<div class="hero"><h2>Lobby</h2></div><div><div><div>Games</div><div class="tiles">'
+    + TILES.map((g) => '<a href="/games/' + g + '"><img alt="' + g + '" src="' + IMG[g] + '"></a>').join("")
+    + '</div></div></div>';
+}
+function closeModal(){ $("modal").innerHTML = ""; }
+function openModal(kind){
+  const fields = kind === "login" ? ["username", "password"] : ["email", "username", "password"];
+  const labels = fields.map((f) => '<label>' + f + '<input name="' + f + '" type="' + (f === "password" ? "password" : "text") + '"></label>').join("");
+  const submit = '<button type="submit">' + (kind === "login" ? "Giriş" : "Kayıt Ol") + '</button>';
+  // login: form > div > label[1..2] + form > button | register: form > div > label[1..3] + button
+  $("modal").innerHTML = '<div><section><div><form id="auth-form">'
+    + (kind === "login" ? '<div>' + labels + '</div>' + submit : '<div>' + labels + submit + '</div>')
+    + '<p id="auth-error"></p></form></div></section></div>';
+  $("auth-form").onsubmit = async (ev) => {
+    ev.preventDefault();
+    const body = Object.fromEntries(new FormData(ev.target).entries());
+    const res = await fetch("/api/" + kind, {method: "POST", headers: {"Content-Type": "application/json"}, body: JSON.stringify(body)});
+    if (res.ok) { closeModal(); renderHeader(); }
+    else { $("auth-error").textContent = "Hatalı bilgi"; }
+  };
+}
+$("btn-login").onclick = () => openModal("login");
+$("btn-register").onclick = () => openModal("register");
+$("btn-logout").onclick = async () => { await fetch("/api/logout", {method: "POST"}); renderHeader(); };
+renderHeader();
+renderPage();
+</script>
+</body></html>
+"""
+
+PLAY_HTML = """<!doctype html>
+<html><head><meta charset="utf-8"><style>body{margin:0;background:#0b0d12}canvas{display:block}</style></head>
+<body>
+<canvas id="game" width="800" height="500" tabindex="0"></canvas>
+<script>
+const GAME = %(game)s;
+const cv = document.getElementById("game"), ctx = cv.getContext("2d");
+let sessionId = null, pick = 0, status = "ready", animUntil = 0;
+
+function draw(){
+  const t = performance.now();
+  ctx.fillStyle = "#0b0d12"; ctx.fillRect(0, 0, cv.width, cv.height);
+  ctx.fillStyle = "#fff"; ctx.font = "24px sans-serif";
+  ctx.fillText(GAME + " | " + status + " | pick " + pick, 24, 48);
+  if (t < animUntil) {
+    ctx.fillStyle = "#4caf50"; ctx.fillRect(24, 80, (t %% 300) / 300 * 752, 16);
+    requestAnimationFrame(draw);
+  }
+}
+async function play(action){
+  const body = {game: GAME, action: action, session_id: action === "bet" ? null : sessionId};
+  if (action === "bet") pick = 0;
+  if (action === "pick") body.index = ++pick;
+  try {
+    const res = await fetch("/v1/play", {method: "POST", credentials: "same-origin",
+      headers: {"Content-Type": "application/json"}, body: JSON.stringify(body)});
+    const j = await res.json();
+    const d = (j && j.data) || {};
+    sessionId = d.session_id || sessionId;
+    status = action + ": " + (d.result || "-");
+  } catch (e) { status = "error"; }
+  animUntil = performance.now() + 300;
+  requestAnimationFrame(draw);
+}
+document.addEventListener("keydown", (ev) => {
+  const k = (ev.key || "").toLowerCase();
+  if (k === " ") { ev.preventDefault(); play("bet"); }
+  else if (k === "q") play("pick");
+  else if (k === "w") play("cashout");
+});
+draw();
+</script>
+</body></html>
+"""
+
+# ================= HTTP =================
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "DracoMock/1.0"
+    disable_nagle_algorithm = True
+    wbufsize = -1                      # header + body tek yazımda gider (handle_one_request flush eder)
+    state: MockState = None
+
+    def log_message(self, fmt, *args):
+        log.debug(fmt % args)
+
+    def _send(self, status: int, body: bytes, ctype: str, headers: dict | None = None):
+        self.send_response(status)
+        self.send_header("Content-Type", ctype)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _json(self, status: int, obj, headers: dict | None = None):
+        self._send(status, json.dumps(obj).encode("utf-8"), "application/json", headers)
+
+    def _html(self, html: str):
+        self._send(200, html.encode("utf-8"), "text/html; charset=utf-8")
+
+    def _body(self) -> dict:
+        n = int(self.headers.get("Content-Length") or 0)
+        try:
+            return json.loads(self.rfile.read(n) or b"{}") if n else {}
+        except ValueError:
+            return {}
+
+    def _tokens(self) -> tuple[str, str]:
+        cookie = SimpleCookie(self.headers.get("Cookie") or "")
+        token = cookie[SESSION_COOKIE].value if SESSION_COOKIE in cookie else ""
+        bearer = (self.headers.get("Authorization") or "").removeprefix("Bearer ").strip()
+        return token, bearer
+
+    def _authorized(self) -> bool:
+        token, bearer = self._tokens()
+        return token in self.state.tokens or bearer in self.state.tokens
+
+    def _player(self) -> str:
+        """Script imleçlerinin anahtarı: X-Player başlığı (protokol sürücüsü) ya da oturum token'ı."""
+        token, bearer = self._tokens()
+        return (self.headers.get("X-Player") or "").strip() or token or bearer
+
+    def _login_cookie(self) -> dict:
+        return {"Set-Cookie": f"{SESSION_COOKIE}={self.state.issue_token()}; Path=/; SameSite=Lax"}
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path == "/" or path.startswith("/games/"):
+            return self._html(LOBBY_HTML % {
+                "style": _STYLE, "tiles": json.dumps(TILES), "cookie": SESSION_COOKIE,
+                "images": json.dumps({g: _tile_svg(g) for g in TILES}),
+            })
+        if path.startswith("/play/"):
+            return self._html(PLAY_HTML % {"game": json.dumps(path.rsplit("/", 1)[-1])})
+        if path == "/healthz":
+            return self._json(200, {"ok": True, "plays": self.state.plays})
+        self._send(404, b"not found", "text/plain")
+
+    def do_POST(self):
+        path = urlsplit(self.path).path
+        body = self._body()
+        if path == "/api/login":
+            if self.state.check_user(body.get("username"), body.get("password")):
+                return self._json(200, {"ok": True}, self._login_cookie())
+            return self._json(401, {"ok": False, "error": "invalid credentials"})
+        if path == "/api/register":
+            if not (body.get("email") and body.get("username") and body.get("password")):
+                return self._json(400, {"ok": False, "error": "missing fields"})
+            self.state.add_user(body["email"], body["username"], body["password"])
+            return self._json(200, {"ok": True}, self._login_cookie())
+        if path == "/api/logout":
+            return self._json(200, {"ok": True}, {"Set-Cookie": f"{SESSION_COOKIE}=; Path=/; Max-Age=0"})
+        if path == "/mock/reset":
+            self.state.outcomes.reset()
+            return self._json(200, {"ok": True})
+        if path == "/v1/play":
+            if self.state.require_auth and not self._authorized():
+                return self._json(401, {"error": "unauthorized"})
+            self.state.sleep()
+            try:
+                return self._json(200, self.state.play(body, self._player()))
+            except ValueError as e:
+                return self._json(400, {"error": str(e)})
+        self._send(404, b"not found", "text/plain")
+
+def make_server(state: MockState, host: str = MOCK_HOST, port: int = MOCK_PORT) -> ThreadingHTTPServer:
+    """Handler'a state bağlanmış sunucu; testlerde port=0 + serve_forever thread'i ile kullanılabilir."""
+    handler = type("BoundMockHandler", (MockHandler,), {"state": state})
+    server_cls = type("MockHTTPServer", (ThreadingHTTPServer,), {"request_queue_size": 256})  # yük testinde SYN kuyruğu
+    server = server_cls((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Local mock lobby + /v1/play backend")
+    ap.add_argument("--host", default=MOCK_HOST)
+    ap.add_argument("--port", type=int, default=MOCK_PORT)
+    ap.add_argument("--latency-ms", default=MOCK_LATENCY_MS, help="/v1/play gecikmesi: sabit (30) ya da aralık (20-80)")
+    ap.add_argument("--sequence", action="append", default=[],
+                    help="<oyun>:<bet|pick>=sonuç,... döngüsel sonuç dizisi (tekrarlanabilir)")
+    ap.add_argument("--seed", default=MOCK_SEED, help="tohumlu RNG (dizisi olmayan oyun/aksiyonlar için)")
+    ap.add_argument("--script", default=MOCK_SCRIPT, help='JSON sonuç scripti: {"keno": {"bet": ["lose", "win", "win"]}}')
+    ap.add_argument("--fixed-rounds", type=int, default=0,
+                    help="N>0 → tüm oyunlar için stratejiyi tam N turda bitiren scriptler (GameSpec'ten)")
+    ap.add_argument("--no-auth", action="store_true", help="/v1/play oturum cookie'si/token istemesin (protokol sürücüsü için)")
+    args = ap.parse_args(argv)
+    try:
+        sequences = {}
+        if args.fixed_rounds > 0:
+            from harness.game import STOP_WIN_STREAK
+            from harness.games import GAMES
+            sequences.update(fixed_length_script(GAMES.values(), args.fixed_rounds))
+            for spec in GAMES.values():
+                if spec.stop == STOP_WIN_STREAK and spec.streak > args.fixed_rounds:
+                    log.warning(f"⚠️ {spec.name}: --fixed-rounds {args.fixed_rounds} < streak {spec.streak}; "
+                                f"run it with MAX_ROUNDS/--rounds {args.fixed_rounds} to stop on time")
+        if args.script:
+            sequences.update(load_script(args.script))
+        for arg in args.sequence:
+            game, action, values = parse_sequence(arg)
+            sequences[(game, action)] = values
+        latency = parse_latency(args.latency_ms)
+    except (OSError, ValueError) as e:
+        ap.error(str(e))
+
+    state = MockState(Outcomes(sequences, seed=args.seed), latency, require_auth=not args.no_auth)
+    server = make_server(state, args.host, args.port)
+    log.info(f"🧪 mock backend on http://{args.host}:{server.server_address[1]}/ (latency {latency} ms)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format=LOG_FMT)
+    sys.exit(main())
@@ -0,0 +1,216 @@
+# harness/pool.py
+# -*- coding: utf-8 -*-
+"""
+Sıcak driver havuzu:
+  - N Chrome bir kez açılır ve login olur
+  - Her oyun havuzdan login olmuş bir driver kiralar (lease)
+  - İade sırasında ucuz reset: hook kuyruğu temizlenir, default_content, BASE_URL
+  - Driver yalnızca max_uses kullanımdan sonra ya da sağlıksızsa kapatılır; yenisi slot bir sonraki
+    kiralamada istendiğinde açılır (son oyundan sonra boşuna Chrome + login yok)
+  - ACCOUNT_POOL=1 → her slot hesap havuzundan kendi hesabını kiralar, kapanışta iade eder; kiralama her
+    lease/reset'te yenilenir, oyun sürerken heartbeat ile uzatılır (TTL'den uzun koşularda hesap başka
+    worker'a düşmez). Kiralaması kaybedilen slot emekliye ayrılır ve yeni hesapla açılır
+"""
+import os
+import queue
+import logging
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+
+from selenium.common.exceptions import WebDriverException
+
+from locators.login_locators import LoginLocators as LL
+from common.user_data import lease_account, release_account, renew_lease, lease_heartbeat
+from harness.game import ACCOUNT_POOL, make_driver, login, load_test_user, back_to_lobby, play_game
+
+log = logging.getLogger("pool")
+
+POOL_SIZE     = int(os.getenv("POOL_SIZE", "1"))
+POOL_MAX_USES = int(os.getenv("POOL_MAX_USES", "10"))
+
+@dataclass
+class PooledDriver:
+    driver: object                    # None → slot emekli, bir sonraki kiralamada yeniden açılır
+    slot: int
+    uses: int = 0
+    account: str | None = None        # ACCOUNT_POOL=1 → slot'a kiralanan hesap
+
+def reset_driver(driver):
+    """Oyundan lobby'ye dön; hook kuyruğunu (iframe içindeysek) boşalt."""
+    try:
+        driver.execute_script("window.__PLAY_FLUSH_ALL__ && window.__PLAY_FLUSH_ALL__();")
+    except WebDriverException:
+        pass
+    back_to_lobby(driver)
+
+def is_healthy(driver) -> bool:
+    """Tarayıcı cevap veriyor ve oturum hâlâ açık (logout butonu var) mı?"""
+    try:
+        driver.switch_to.default_content()
+        if driver.execute_script("return document.readyState") != "complete":
+            return False
+        return bool(driver.find_elements(*LL.LOGOUT_BUTTON))
+    except WebDriverException:
+        return False
+
+class DriverPool:
+    def __init__(self, size: int = POOL_SIZE, max_uses: int = POOL_MAX_USES, credentials=None):
+        self.size = max(1, size)
+        self.max_uses = max(1, max_uses)
+        self.per_slot_accounts = ACCOUNT_POOL and credentials is None
+        self.credentials = None if self.per_slot_accounts else (credentials or load_test_user())
+        self._idle: queue.Queue[PooledDriver] = queue.Queue()
+        self._all: dict[int, PooledDriver] = {}
+        self._lock = threading.Lock()
+
+    # ---------- yaşam döngüsü ----------
+    def _owner(self, slot: int) -> str:
+        return f"pool:{os.getpid()}:{id(self)}:{slot}"
+
+    def _slot_credentials(self, slot: int):
+        if not self.per_slot_accounts:
+            return self.credentials
+        acc = lease_account(owner=self._owner(slot))
+        if acc is None:
+            raise RuntimeError("hesap havuzunda boş hesap yok; register.py ile havuzu büyütün")
+        return acc["username"], acc["password"]
+
+    def _release_account(self, pd: PooledDriver):
+        if pd.account:
+            release_account(pd.account, owner=self._owner(pd.slot))
+
+    def _renew(self, pd: PooledDriver) -> bool:
+        """Slot'un hesabı hâlâ bizde mi (yenileyerek); hesapsız slotta her zaman True."""
+        return not pd.account or renew_lease(pd.account, owner=self._owner(pd.slot))
+
+    def _spawn(self, slot: int) -> PooledDriver:
+        log.info(f"🚀 [pool] starting driver slot={slot}")
+        username, password = self._slot_credentials(slot)
+        account = username if self.per_slot_accounts else None
+        driver = make_driver()
+        try:
+            login(driver, username, password)
+        except Exception:
+            driver.quit()
+            if account:
+                release_account(account, owner=self._owner(slot))
+            raise
+        pd = PooledDriver(driver=driver, slot=slot, account=account)
+        with self._lock:
+            self._all[slot] = pd
+        return pd
+
+    def start(self):
+        """Tüm slotları paralel açar (Chrome başlatma + login en pahalı sabit maliyet)."""
+        with ThreadPoolExecutor(max_workers=self.size) as ex:
+            for pd in ex.map(self._spawn, range(self.size)):
+                self._idle.put(pd)
+        return self
+
+    def _retire(self, pd: PooledDriver, reason: str) -> PooledDriver:
+        """Driver'ı kapatır, hesabı iade eder; slot yer tutucu olarak kalır (tembel yeniden açılış)."""
+        log.info(f"♻️ [pool] retiring slot={pd.slot} ({reason}, uses={pd.uses})")
+        try:
+            pd.driver.quit()
+        except Exception:
+            pass
+        self._release_account(pd)
+        placeholder = PooledDriver(driver=None, slot=pd.slot)
+        with self._lock:
+            self._all[pd.slot] = placeholder
+        return placeholder
+
+    def close(self):
+        with self._lock:
+            drivers = list(self._all.values())
+            self._all.clear()
+        for pd in drivers:
+            if pd.driver is None:
+                continue
+            try:
+                pd.driver.quit()
+            except Exception:
+                pass
+            self._release_account(pd)
+
+    def __enter__(self):
+        try:
+            return self.start()
+        except BaseException:
+            self.close()        # açılabilen slotların Chrome'u ve kiralanan hesapları sızmasın
+            raise
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ---------- kiralama ----------
+    def _get_idle(self) -> PooledDriver:
+        while True:
+            try:
+                pd = self._idle.get(timeout=1.0)
+            except queue.Empty:
+                with self._lock:
+                    if not self._all:
+                        raise RuntimeError("driver pool has no live drivers")
+                continue
+            if pd.driver is not None and not self._renew(pd):
+                pd = self._retire(pd, "account lease lost")
+            if pd.driver is not None:
+                return pd
+            try:
+                return self._spawn(pd.slot)
+            except Exception as e:
+                log.error(f"⛔ [pool] slot={pd.slot} could not be restarted: {e}")
+                with self._lock:
+                    self._all.pop(pd.slot, None)
+
+    @contextmanager
+    def lease(self):
+        pd = self._get_idle()
+        ok = False
+        try:
+            if pd.account:
+                with lease_heartbeat(pd.account, owner=self._owner(pd.slot)):
+                    yield pd.driver
+            else:
+                yield pd.driver
+            ok = True
+        finally:
+            self._release(pd, ok)
+
+    def _release(self, pd: PooledDriver, ok: bool):
+        pd.uses += 1
+        reason = "max uses" if pd.uses >= self.max_uses else None
+        if reason is None:
+            try:
+                reset_driver(pd.driver)
+            except WebDriverException:
+                pass
+            if not is_healthy(pd.driver):
+                reason = "unhealthy" if ok else "unhealthy after game error"
+            elif not self._renew(pd):
+                reason = "account lease lost"
+        if reason:
+            pd = self._retire(pd, reason)
+        self._idle.put(pd)
+
+def run_games_pooled(specs, pool: DriverPool) -> dict:
+    """Oyunları havuz boyutu kadar eşzamanlı koşar; sonuç {name: outcome|"error"}."""
+    def _play(spec):
+        with pool.lease() as driver:
+            log.info(f"=== GAME {spec.name} ===")
+            return play_game(driver, spec)
+
+    outcomes = {}
+    with ThreadPoolExecutor(max_workers=pool.size) as ex:
+        futures = {spec.name: ex.submit(_play, spec) for spec in specs}
+        for name, fut in futures.items():
+            try:
+                outcomes[name] = fut.result()
+            except Exception as e:
+                log.error(f"⛔ {name} failed: {e}")
+                outcomes[name] = "error"
+            log.info(f"🏁 {name} outcome: {outcomes[name]}")
+    return outcomes
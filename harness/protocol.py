@@ -0,0 +1,318 @@
+# harness/protocol.py
+# -*- coding: utf-8 -*-
+"""
+Tarayıcısız protokol sürücüsü: /v1/play akışını doğrudan HTTP üzerinden oynar.
+
+    python -m harness.protocol dice --players 200 --rounds 20
+    python -m harness.protocol mines --players 1,50,200 --base-url http://127.0.0.1:8765
+
+  - Tek süreç, asyncio; aynı host'a keep-alive bağlantı havuzu (HttpPool, yalnızca stdlib)
+  - İstek: POST {PROTO_BASE_URL}/v1/play  {"game", "action": bet|pick|cashout, "session_id", "index"}
+    Cevap HOOK_JS'in yakaladığı şekilde ({data: {action, result, session_id, ...}}) → normalize_record
+  - Sınır: hook yalnızca cevapları görür; oyun backend'lerinin (…minesv2…, …kenov2… gibi ayrı host'lar)
+    gerçek istek gövdesi bilinmiyor. Bu gövde mock backend'in (harness.mock_server) sözleşmesidir;
+    gerçek bir host'a karşı koşmadan önce tarayıcının DevTools'undan istek şekli doğrulanmalıdır.
+  - PROTO_BASE_URL (ya da --base-url) zorunlu: BASE_URL lobby frontend'idir, oyun API'si değil
+  - Durma koşulları GameSpec'ten (stop/streak/max_picks/max_rounds/pre_keys) aynı kurallarla uygulanır
+  - Yetki: session snapshot'taki cookie'ler + (varsa) PROTO_TOKEN → Authorization: Bearer
+  - Ölçümler bet_result/pick_result/result_timeout/backend span'leri olarak yazılır → load raporuyla aynı özet
+"""
+import os
+import ssl
+import sys
+import json
+import time
+import asyncio
+import logging
+import argparse
+from urllib.parse import urlsplit
+
+from common import timing
+from common.user_data import load_session_snapshot
+from harness.game import (BASE_URL, RESULT_TIMEOUT, STOP_ROUNDS, STOP_WIN_STREAK, STOP_CASHOUT,
+                          load_test_user)
+from harness.games import GAMES
+from harness.cdp_capture import normalize_record
+from harness.load import summarize_level, format_levels
+
+LOG_FMT = "%(asctime)s | %(levelname)-7s | %(message)s"
+log = logging.getLogger("protocol")
+
+PROTO_BASE_URL   = (os.getenv("PROTO_BASE_URL") or "").strip()
+PROTO_PLAY_PATH  = os.getenv("PROTO_PLAY_PATH", "/v1/play")
+PROTO_TOKEN      = os.getenv("PROTO_TOKEN") or ""
+PROTO_POOL_LIMIT = int(os.getenv("PROTO_POOL_LIMIT", "100"))   # host başına eşzamanlı bağlantı
+
+# ================= HTTP (keep-alive bağlantı havuzu) =================
+class HttpError(Exception):
+    pass
+
+class HttpPool:
+    """Tek host için HTTP/1.1 keep-alive havuzu; en fazla `limit` eşzamanlı bağlantı."""
+    def __init__(self, base_url: str, limit: int = PROTO_POOL_LIMIT, timeout: float = RESULT_TIMEOUT):
+        u = urlsplit(base_url)
+        self.https = u.scheme == "https"
+        self.host = u.hostname or "localhost"
+        self.port = u.port or (443 if self.https else 80)
+        self.prefix = u.path.rstrip("/")
+        self.timeout = timeout
+        self._ssl = ssl.create_default_context() if self.https else None
+        self._idle: list[tuple] = []
+        self._sem = asyncio.Semaphore(max(1, limit))
+        self.opened = 0
+
+    async def _connect(self):
+        self.opened += 1
+        return await asyncio.open_connection(self.host, self.port, ssl=self._ssl,
+                                             server_hostname=self.host if self.https else None)
+
+    def _take_idle(self):
+        while self._idle:
+            reader, writer = self._idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer
+            writer.close()
+        return None
+
+    async def request(self, method: str, path: str, body: bytes = b"", headers: dict | None = None) -> dict:
+        """{status, headers, body, ttfb_ms, total_ms}; yeniden kullanılan bağlantı kopmuşsa bir kez taze bağlantıyla dener."""
+        async with self._sem:
+            conn = self._take_idle()
+            try:
+                return await asyncio.wait_for(self._roundtrip(conn or await self._connect(), method, path, body, headers),
+                                              self.timeout)
+            except (ConnectionError, asyncio.IncompleteReadError, HttpError):
+                if conn is None:
+                    raise
+                return await asyncio.wait_for(self._roundtrip(await self._connect(), method, path, body, headers),
+                                              self.timeout)
+
+    async def _roundtrip(self, conn, method, path, body, headers) -> dict:
+        reader, writer = conn
+        try:
+            head = {"Host": self.host if self.port in (80, 443) else f"{self.host}:{self.port}",
+                    "Connection": "keep-alive", "Content-Length": str(len(body)), **(headers or {})}
+            t0 = time.perf_counter()
+            writer.write((f"{method} {self.prefix}{path} HTTP/1.1\r\n"
+                          + "".join(f"{k}: {v}\r\n" for k, v in head.items()) + "\r\n").encode("latin-1") + body)
+            await writer.drain()
+
+            status_line = await reader.readline()
+            ttfb = (time.perf_counter() - t0) * 1000
+            parts = status_line.decode("latin-1").split(" ", 2)
+            if len(parts) < 2 or not parts[1].isdigit():
+                raise HttpError(f"bad status line: {status_line!r}")
+            status = int(parts[1])
+            resp_headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                k, _, v = line.decode("latin-1").partition(":")
+                resp_headers[k.strip().lower()] = v.strip()
+
+            if "chunked" in resp_headers.get("transfer-encoding", "").lower():
+                data = b""
+                while True:
+                    size = int((await reader.readline()).split(b";")[0].strip() or b"0", 16)
+                    if size == 0:
+                        await reader.readline()
+                        break
+                    data += await reader.readexactly(size)
+                    await reader.readline()
+            elif "content-length" in resp_headers:
+                data = await reader.readexactly(int(resp_headers["content-length"]))
+            else:
+                data = await reader.read()
+                resp_headers["connection"] = "close"
+        except BaseException:
+            writer.close()
+            raise
+
+        if resp_headers.get("connection", "").lower() == "close":
+            writer.close()
+        else:
+            self._idle.append((reader, writer))
+        return {"status": status, "headers": resp_headers, "body": data,
+                "ttfb_ms": ttfb, "total_ms": (time.perf_counter() - t0) * 1000}
+
+    def close(self):
+        while self._idle:
+            self._idle.pop()[1].close()
+
+# ================= Oyuncu =================
+def auth_headers(username: str | None = None) -> dict:
+    """Snapshot cookie'leri (login bir kez tarayıcıda yapılmışsa) + PROTO_TOKEN."""
+    headers = {}
+    snapshot = load_session_snapshot(username, BASE_URL) if username else None
+    cookies = (snapshot or {}).get("cookies") or []
+    if cookies:
+        headers["Cookie"] = "; ".join(f"{c['name']}={c['value']}" for c in cookies if c.get("name"))
+    if PROTO_TOKEN:
+        headers["Authorization"] = f"Bearer {PROTO_TOKEN}"
+    return headers
+
+class ProtoPlayer:
+    """Tek sanal oyuncu; hotkey yerine bet/pick/cashout isteği gönderir."""
+    def __init__(self, pool: HttpPool, spec, headers: dict, idx: int = 0):
+        self.pool = pool
+        self.spec = spec
+        self.idx = idx
+        # X-Player: aynı auth'u paylaşan sanal oyuncular mock backend'de ayrı script imleçleri alır
+        self.headers = {"Content-Type": "application/json", "Accept": "application/json",
+                        "X-Player": f"proto-{idx}", **headers}
+        self.session_id = None
+        self.rows: list[tuple] = []          # timing.record_many girdileri
+
+    async def play(self, action: str, phase: str | None = None, **fields) -> dict | None:
+        payload = {"game": self.spec.name, "action": action, "session_id": self.session_id, **fields}
+        t_sent = time.time() * 1000
+        try:
+            resp = await self.pool.request("POST", PROTO_PLAY_PATH, json.dumps(payload).encode("utf-8"), self.headers)
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, HttpError) as e:
+            log.debug(f"[p{self.idx}] {action} failed: {e}")
+            self.rows.append(("backend", (time.time() * 1000) - t_sent, self.spec.name,
+                              {"status": 0, "bytes": 0, "ttfb_ms": None, "via": "proto"}))
+            if phase:
+                self.rows.append(("result_timeout", self.spec.result_timeout * 1000, self.spec.name, {"action": phase}))
+            return None
+
+        self.rows.append(("backend", resp["total_ms"], self.spec.name,
+                          {"status": resp["status"], "bytes": len(resp["body"]), "ttfb_ms": resp["ttfb_ms"],
+                           "via": "proto"}))
+        try:
+            item = normalize_record(t_sent + resp["total_ms"], PROTO_PLAY_PATH, json.loads(resp["body"] or b"null"))
+        except ValueError:
+            item = None
+        if phase:
+            if item and resp["status"] < 400:
+                self.rows.append((phase, resp["total_ms"], self.spec.name, {}))
+            else:
+                self.rows.append(("result_timeout", self.spec.result_timeout * 1000, self.spec.name, {"action": phase}))
+        if item and item.get("session_id"):
+            self.session_id = item["session_id"]
+        return item if resp["status"] < 400 else None
+
+    async def bet(self, phase: str | None = "bet_result"):
+        self.session_id = None
+        return await self.play("bet", phase)
+
+# ================= Strateji (GameSpec durma koşulları) =================
+async def proto_rounds(p: ProtoPlayer, spec, max_rounds: int) -> str:
+    for _ in range(max_rounds):
+        await p.bet()
+    return "success"
+
+async def proto_win_streak(p: ProtoPlayer, spec, max_rounds: int) -> str:
+    consec_wins = 0
+    for _ in range(max_rounds):
+        res = ((await p.bet()) or {}).get("result")
+        consec_wins = consec_wins + 1 if res == "win" else 0
+        if consec_wins >= spec.streak:
+            return "success"
+    return "stopped"
+
+async def proto_one_round(p: ProtoPlayer, spec) -> str:
+    if await p.bet() is None:   # tarayıcı akışındaki gibi: pick'ler bahsin cevabından (oturum kimliği) sonra
+        return "lose"
+    consecutive = 0
+    for pick in range(1, spec.max_picks + 1):
+        res = ((await p.play("pick", "pick_result", index=pick)) or {}).get("result")
+        if res != "inprogress":
+            return "lose"
+        consecutive += 1
+        if consecutive >= spec.streak:
+            await p.play("cashout")
+            return "success"
+    return "lose"
+
+async def proto_cashout(p: ProtoPlayer, spec, max_rounds: int) -> str:
+    for _ in range(max_rounds):
+        if await proto_one_round(p, spec) == "success":
+            return "success"
+    return "stopped"
+
+PROTO_STRATEGIES = {
+    STOP_ROUNDS: proto_rounds,
+    STOP_WIN_STREAK: proto_win_streak,
+    STOP_CASHOUT: proto_cashout,
+}
+
+async def run_proto_player(p: ProtoPlayer, spec, max_rounds: int) -> str:
+    for _ in spec.pre_keys:
+        await p.play("pick")
+    return await PROTO_STRATEGIES[spec.stop](p, spec, max_rounds)
+
+# ================= Orkestrasyon =================
+async def run_proto_level(spec, players: int, ramp_up: float, rounds: int, headers: dict, base_url: str) -> dict:
+    pool = HttpPool(base_url)
+    step = ramp_up / players if players > 1 else 0.0
+    t0 = time.monotonic()
+
+    async def _one(idx):
+        await asyncio.sleep(idx * step)
+        player = ProtoPlayer(pool, spec, headers, idx)
+        try:
+            return await run_proto_player(player, spec, rounds), player.rows
+        except Exception as e:
+            log.error(f"⛔ player {idx} failed: {e}")
+            return "error", player.rows
+
+    try:
+        results = await asyncio.gather(*(_one(i) for i in range(players)))
+    finally:
+        pool.close()
+    wall = time.monotonic() - t0
+    timing.record_many([row for _, rows in results for row in rows])
+    outcomes = [outcome for outcome, _ in results]
+    level = summarize_level(timing.load_spans(), spec.name, players, wall,
+                            outcomes.count("error"), outcomes)
+    level["connections"] = pool.opened
+    return level
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Browser-free protocol driver for /v1/play")
+    ap.add_argument("game", choices=list(GAMES))
+    ap.add_argument("--players", default=os.getenv("LOAD_PLAYERS", "50"),
+                    help="eşzamanlı oyuncu sayısı; virgülle liste → kademeli tarama")
+    ap.add_argument("--ramp-up", type=float, default=float(os.getenv("LOAD_RAMP_UP", "5")))
+    ap.add_argument("--rounds", type=int, default=int(os.getenv("LOAD_ROUNDS", "10")), help="oyuncu başına tur üst sınırı")
+    ap.add_argument("--base-url", default=PROTO_BASE_URL,
+                    help="oyun API kökü (PROTO_BASE_URL); lobby BASE_URL'ine düşülmez")
+    args = ap.parse_args(argv)
+    if not args.base_url:
+        ap.error("--base-url / PROTO_BASE_URL gerekli (ör. http://127.0.0.1:8765 mock backend'i)")
+    try:
+        levels = [int(n) for n in str(args.players).split(",") if n.strip()]
+    except ValueError:
+        ap.error(f"geçersiz --players: {args.players}")
+    if not levels or min(levels) < 1:
+        ap.error("--players en az 1 olmalı")
+
+    spec = GAMES[args.game]
+    try:
+        username, _ = load_test_user()
+    except (FileNotFoundError, ValueError):
+        username = None
+    headers = auth_headers(username)
+    base_rid = timing.run_id()
+
+    results = []
+    for players in levels:
+        os.environ["RUN_ID"] = f"{base_rid}-proto-p{players}"
+        log.info(f"=== PROTO {spec.name}: {players} players → {args.base_url} ===")
+        results.append(asyncio.run(run_proto_level(spec, players, args.ramp_up, args.rounds, headers, args.base_url)))
+    os.environ["RUN_ID"] = base_rid
+
+    report = {"run_id": base_rid, "game": spec.name, "mode": "protocol", "base_url": args.base_url,
+              "ramp_up": args.ramp_up, "rounds": args.rounds, "levels": results}
+    os.makedirs(timing.REPORT_DIR, exist_ok=True)
+    out = os.path.join(timing.REPORT_DIR, f"proto-{base_rid}.json")
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"\n📊 Protocol load report ({spec.name}):\n{format_levels(results)}\n📄 {out}", flush=True)
+    return 1 if any(lv["player_failures"] for lv in results) else 0
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format=LOG_FMT)
+    sys.exit(main())
@@ -0,0 +1,98 @@
+# harness/session.py
+# -*- coding: utf-8 -*-
+"""
+Login'i bir kez yap, oturumu (cookies + localStorage + sessionStorage) dosyaya aktar,
+sonraki driver'lara enjekte et. Enjekte edilen oturum reddedilirse (LOGOUT_BUTTON yok)
+tam do_login akışına düşer ve snapshot'ı tazeler.
+
+Opt-in: SESSION_SNAPSHOT=1 (ya da `python -m harness.suite --session-snapshot`); varsayılan her zaman tam login.
+"""
+import os
+import logging
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+from common.browser_utils import _truthy
+from common.user_data import save_session_snapshot, load_session_snapshot
+from locators.login_locators import LoginLocators as LL
+from harness.game import BASE_URL, do_login
+
+log = logging.getLogger("session")
+
+SESSION_SNAPSHOT = _truthy(os.getenv("SESSION_SNAPSHOT", "0"))
+SESSION_VERIFY_TIMEOUT = int(os.getenv("SESSION_VERIFY_TIMEOUT", "8"))
+
+_DUMP_STORAGE_JS = """
+    const dump = (s) => { const o = {}; for (let i = 0; i < s.length; i++) { const k = s.key(i); o[k] = s.getItem(k); } return o; };
+    return {local: dump(window.localStorage), session: dump(window.sessionStorage)};
+"""
+
+_LOAD_STORAGE_JS = """
+    const [local, session] = arguments;
+    for (const [k, v] of Object.entries(local || {})) window.localStorage.setItem(k, v);
+    for (const [k, v] of Object.entries(session || {})) window.sessionStorage.setItem(k, v);
+"""
+
+_CLEAR_STORAGE_JS = "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch(e) {}"
+
+def export_session(driver, username):
+    """Login olmuş (lobby'deki) driver'ın oturumunu snapshot dosyasına yazar."""
+    driver.switch_to.default_content()
+    storage = driver.execute_script(_DUMP_STORAGE_JS)
+    return save_session_snapshot({
+        "username": username,
+        "base_url": BASE_URL,
+        "cookies": driver.get_cookies(),
+        "local_storage": storage.get("local") or {},
+        "session_storage": storage.get("session") or {},
+    })
+
+def _logged_in(driver, timeout) -> bool:
+    try:
+        WebDriverWait(driver, timeout).until(EC.element_to_be_clickable(LL.LOGOUT_BUTTON))
+        return True
+    except TimeoutException:
+        return False
+
+def inject_session(driver, snapshot) -> bool:
+    """Snapshot'ı BASE_URL origin'ine yükleyip sayfayı yeniler; oturum kabul edildiyse True."""
+    driver.switch_to.default_content()
+    for cookie in snapshot.get("cookies") or []:
+        try:
+            driver.add_cookie(cookie)
+        except WebDriverException as e:
+            log.debug(f"cookie skipped ({cookie.get('name')}): {e}")
+    driver.execute_script(_LOAD_STORAGE_JS, snapshot.get("local_storage"), snapshot.get("session_storage"))
+    driver.refresh()
+    return _logged_in(driver, SESSION_VERIFY_TIMEOUT)
+
+def _reset_to_logged_out(driver):
+    driver.delete_all_cookies()
+    driver.execute_script(_CLEAR_STORAGE_JS)
+    driver.get(BASE_URL)
+
+def ensure_login(driver, username, password):
+    """
+    BASE_URL açık driver'ı login durumuna getirir:
+      1) geçerli snapshot varsa enjekte et (login modal + ~12 sn sabit bekleme atlanır)
+      2) reddedilirse / snapshot yoksa tam do_login, ardından snapshot'ı tazele
+    """
+    if SESSION_SNAPSHOT:
+        snapshot = load_session_snapshot(username, BASE_URL)
+        if snapshot:
+            if inject_session(driver, snapshot):
+                log.info("🟢 Login restored from session snapshot")
+                return
+            log.info("⚠️ session snapshot rejected → full login")
+            _reset_to_logged_out(driver)
+
+    do_login(driver, username, password)
+
+    if SESSION_SNAPSHOT:
+        try:
+            export_session(driver, username)
+            log.info("💾 session snapshot saved")
+        except WebDriverException as e:
+            log.warning(f"session snapshot could not be saved: {e}")
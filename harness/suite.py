@@ -0,0 +1,52 @@
+# harness/suite.py
+# -*- coding: utf-8 -*-
+"""
+Tüm oyunları tek süreçte, tek sıcak driver ve tek login ile art arda koşar.
+
+    python -m harness.suite                 # hepsi
+    python -m harness.suite dice keno       # seçilenler
+    python -m harness.suite --pool 3        # 3 sıcak driver'lık havuzla eşzamanlı
+    python -m harness.suite --session-snapshot   # login bir kez, sonraki driver'lara oturum enjekte edilir
+"""
+import sys
+import logging
+import argparse
+
+from harness.game import run_games
+from harness import session
+from harness.games import GAMES
+from harness.pool import DriverPool, POOL_MAX_USES, run_games_pooled
+
+LOG_FMT = "%(asctime)s | %(levelname)-7s | %(message)s"
+log = logging.getLogger("suite")
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="In-process game suite (single warm driver)")
+    ap.add_argument("games", nargs="*", help=f"koşulacak oyunlar (varsayılan: hepsi) {list(GAMES)}")
+    ap.add_argument("--pool", type=int, default=0,
+                    help="N>0 → N login olmuş driver'lık havuz, oyunlar eşzamanlı (0 → tek driver, sıralı)")
+    ap.add_argument("--max-uses", type=int, default=POOL_MAX_USES,
+                    help="bir driver kaç oyundan sonra yenilenir (havuz modu)")
+    ap.add_argument("--session-snapshot", action="store_true",
+                    help="login oturumunu dışa aktar / enjekte et (SESSION_SNAPSHOT=1 ile aynı)")
+    args = ap.parse_args(argv)
+    if args.session_snapshot:
+        session.SESSION_SNAPSHOT = True
+    unknown = [name for name in args.games if name not in GAMES]
+    if unknown:
+        ap.error(f"bilinmeyen oyun: {', '.join(unknown)}")
+
+    specs = [GAMES[name] for name in (args.games or GAMES)]
+    if args.pool > 0:
+        with DriverPool(size=args.pool, max_uses=args.max_uses) as pool:
+            outcomes = run_games_pooled(specs, pool)
+    else:
+        outcomes = run_games(specs)
+    failed = [name for name, outcome in outcomes.items() if outcome == "error"]
+    for name, outcome in outcomes.items():
+        log.info(f"{'❌' if outcome == 'error' else '✅'} {name}: {outcome}")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format=LOG_FMT)
+    sys.exit(main())
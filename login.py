@@ -2,6 +2,7 @@
 import time
 import random
 import logging
+import argparse
 from datetime import datetime
 
 from selenium.webdriver.support import expected_conditions as EC
@@ -9,6 +10,8 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
 from common.browser_utils import open_browser
 from common.user_data import load_user_data
+from common.timing import span
+from common.form_input import INPUT_MODES, fill, clear_input, is_human, set_input_mode
 from locators.login_locators import LoginLocators as L
 
 # -------- Logging (English) --------
@@ -18,6 +21,8 @@ log = logging.getLogger("login")
 
 # -------- Helpers --------
 def human_pause(a=0.20, b=0.45):
+    if not is_human():
+        return  # bulk/instant input modunda insan benzeri duraklama yok
     time.sleep(random.uniform(a, b))
 
 def get_wait(driver, timeout=None):
@@ -48,18 +53,16 @@ def is_clickable(driver, locator, timeout=2):
         return False
 
 def type_slow(driver, locator, text, a=0.03, b=0.08, clear=True, desc="input"):
+    """Seçili input moduyla yazar (bkz. common/form_input); human modda karakter karakter."""
     el = wait_clickable(driver, locator, desc)
-    if clear:
+    if clear and is_human():
         el.clear()
         human_pause(0.08, 0.15)
-    for ch in text:
-        el.send_keys(ch)
-        time.sleep(random.uniform(a, b))
-    return el
+    return fill(driver, el, text, clear=clear and not is_human(), gap=(a, b))
 
 def clear_field(driver, locator):
     el = wait_clickable(driver, locator, "clear field")
-    el.clear()
+    clear_input(driver, el)
     human_pause(0.05, 0.12)
 
 # -------- Scenarios --------
@@ -110,7 +113,16 @@ def do_logout(driver):
     log.info("🔄 Logout completed")
 
 # -------- Main --------
-def main():
+def parse_args(argv=None):
+    ap = argparse.ArgumentParser(description="Login scenarios (negative cases + success + logout)")
+    ap.add_argument("--input", choices=INPUT_MODES, default=None,
+                    help="form input mode: human | bulk | instant (default: INPUT_MODE env, else human)")
+    return ap.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.input:
+        set_input_mode(args.input)
     run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
     driver, _ = open_browser()
     log.info(f"=== LOGIN TEST START | run_id={run_id} ===")
@@ -156,7 +168,8 @@ def main():
 
         # --- Positive: Successful login ---
         log.info("[CASE P1] Successful login")
-        do_success_login(driver, valid_username, valid_password)
+        with span("login"):
+            do_success_login(driver, valid_username, valid_password)
 
         # --- Final: Logout ---
         do_logout(driver)
@@ -1,6 +1,12 @@
 ﻿import subprocess
 import sys
 import os
+import argparse
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from common import timing
 
 TEST_FILES = [
     "register.py",
@@ -14,19 +20,137 @@ TEST_FILES = [
     "dice.py"
 ]
 
+# Bağımlılık grafiği: register.py bitmeden load_test_user çağıran hiçbir script başlamaz. login.py aynı
+# test_user_data.json hesabıyla yanlış şifre denemeleri ve logout yapar → oyunlar login.py bitince başlar
+# (aynı hesapta eşzamanlı logout oyun oturumlarını düşürür).
+LOGIN_FLOW = "login.py"
+DEPENDS_ON = {name: ("register.py",) if name == LOGIN_FLOW else ("register.py", LOGIN_FLOW)
+              for name in TEST_FILES if name != "register.py"}
+
+_print_lock = threading.Lock()
+
+def _child_env():
+    return {**os.environ, "HEADLESS": "1"}  # <<< TÜM çocuk süreçlere HEADLESS=1
+
 def run_test(file_name):
     print(f"\n▶ {file_name} başlatılıyor...")
-    headless_env = {**os.environ, "HEADLESS": "1"}  # <<< TÜM çocuk süreçlere HEADLESS=1
-    result = subprocess.run([sys.executable, file_name], env=headless_env)
+    result = subprocess.run([sys.executable, file_name], env=_child_env())
     if result.returncode != 0:
         print(f"❌ {file_name} başarısız. Test zinciri durdu.")
         sys.exit(result.returncode)
     else:
         print(f"✅ {file_name} tamamlandı.")
 
-def main():
-    for test_file in TEST_FILES:
+def _say(msg):
+    with _print_lock:
+        print(msg, flush=True)
+
+def run_test_streamed(file_name) -> int:
+    """Çocuk süreci çalıştırır, çıktısını satır satır '[file] ' önekiyle akıtır."""
+    prefix = f"[{os.path.splitext(file_name)[0]}]"
+    _say(f"▶ {prefix} başlatılıyor...")
+    proc = subprocess.Popen(
+        [sys.executable, file_name],
+        env={**_child_env(), "PYTHONUNBUFFERED": "1"},
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        bufsize=1,
+    )
+    for line in proc.stdout:
+        _say(f"{prefix} {line.rstrip()}")
+    proc.wait()
+    if proc.returncode != 0:
+        _say(f"❌ {prefix} başarısız (exit={proc.returncode}).")
+    else:
+        _say(f"✅ {prefix} tamamlandı.")
+    return proc.returncode
+
+def run_parallel(files, workers: int) -> int:
+    """
+    DEPENDS_ON grafiğine göre hazır olan testleri en fazla `workers` eşzamanlı süreçte koşar.
+    - Bağımlılığı başarısız olan test koşulmaz (skip)
+    - Dönüş: ilk başarısız testin exit kodu (hepsi başarılıysa 0)
+    """
+    pending = list(files)
+    done: dict[str, int] = {}
+    failed_rc = 0
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        running = {}
+        while pending or running:
+            for name in list(pending):
+                deps = [d for d in DEPENDS_ON.get(name, ()) if d in files]
+                if any(d in done and done[d] != 0 for d in deps):
+                    pending.remove(name)
+                    done[name] = -1
+                    _say(f"⏭ [{os.path.splitext(name)[0]}] bağımlılık başarısız, atlandı.")
+                    continue
+                if all(done.get(d) == 0 for d in deps):
+                    pending.remove(name)
+                    running[pool.submit(run_test_streamed, name)] = name
+
+            if not running:
+                break  # çözülemeyen bağımlılık kalmadı / hepsi atlandı
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for fut in finished:
+                name = running.pop(fut)
+                rc = fut.result()
+                done[name] = rc
+                if rc != 0 and not failed_rc:
+                    failed_rc = rc
+
+    if pending:
+        _say(f"⚠️ koşulamayan testler: {', '.join(pending)}")
+        failed_rc = failed_rc or 1
+    if any(rc == -1 for rc in done.values()):
+        failed_rc = failed_rc or 1
+    return failed_rc
+
+def parse_args(argv=None):
+    ap = argparse.ArgumentParser(description="DracoPanel E2E suite runner")
+    ap.add_argument("--workers", type=int, default=int(os.getenv("WORKERS", "0")),
+                    help="N>0 → bağımlılık grafiğiyle N eşzamanlı süreç (0 → eski sıralı zincir)")
+    ap.add_argument("--single-driver", action="store_true",
+                    help="register/login ayrı süreçte, 7 oyun bu süreçte tek sıcak driver ile art arda")
+    return ap.parse_args(argv)
+
+def run_in_process() -> int:
+    """register.py + login.py alt süreçte; oyunlar harness.suite ile tek driver/tek login üzerinde."""
+    for test_file in ("register.py", "login.py"):
         run_test(test_file)
+    os.environ["HEADLESS"] = "1"
+    from harness.suite import main as suite_main
+    return suite_main([])
+
+def report():
+    """Çocuk süreçlerin span dosyalarını toplayıp faz başına p50/p95/max özetini basar."""
+    summary = timing.summarize_run()
+    if not summary:
+        return
+    rid = summary["run_id"]
+    _say(f"\n⏱ Faz süreleri (run_id={rid}):\n{timing.format_summary(summary)}")
+    _say(f"📄 rapor: {os.path.join(timing.REPORT_DIR, f'summary-{rid}.json')}")
+
+def main(argv=None):
+    args = parse_args(argv)
+    timing.run_id()  # RUN_ID env'e yazılır → tüm çocuk süreçler aynı koşuya raporlar
+    try:
+        if args.single_driver:
+            logging.basicConfig(level=logging.INFO, format="%(asctime)s | %(levelname)-7s | %(message)s")
+            sys.exit(run_in_process())
+        if args.workers > 0:
+            rc = run_parallel(TEST_FILES, args.workers)
+            _say("✅ Tüm testler tamamlandı." if rc == 0 else f"❌ Test koşusu başarısız (exit={rc}).")
+            sys.exit(rc)
+
+        for test_file in TEST_FILES:
+            run_test(test_file)
+    finally:
+        report()
 
 if __name__ == "__main__":
     main()
@@ -1,16 +1,21 @@
 # register.py
 import os
+import sys
 import time
 import random
 import secrets
 import string
 import logging
+import argparse
+import threading
 from datetime import datetime
 
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
-from common.browser_utils import open_browser
-from common.user_data import save_user_data
+from common.browser_utils import open_browser, _truthy
+from common.user_data import save_user_data, add_account, account_stats
+from common.form_input import INPUT_MODES, fill, is_human, set_input_mode
+from common.timing import record
 from locators.register_locators import RegisterLocators as L
 
 # ---------- Logging ----------
@@ -20,7 +25,9 @@ log = logging.getLogger("register")
 
 # ---------- Helpers ----------
 def human_pause(a=0.25, b=0.6):
-    """İnsan benzeri küçük beklemeler."""
+    """İnsan benzeri küçük beklemeler (bulk/instant input modunda atlanır)."""
+    if not is_human():
+        return
     time.sleep(random.uniform(a, b))
 
 def get_wait(driver, timeout=None):
@@ -39,15 +46,12 @@ def wait_until_visible(driver, locator, desc, timeout=None):
     return wait.until(EC.visibility_of_element_located(locator))
 
 def type_slow(driver, locator, text, a=0.03, b=0.09, clear=True, desc=""):
-    """Karakter karakter yazar; gerçek kullanıcıya yakın."""
+    """Seçili input moduyla yazar (human: karakter karakter; gerçek kullanıcıya yakın)."""
     el = wait_until_clickable(driver, locator, desc or "input")
-    if clear:
+    if clear and is_human():
         el.clear()
         human_pause(0.1, 0.2)
-    for ch in text:
-        el.send_keys(ch)
-        time.sleep(random.uniform(a, b))
-    return el
+    return fill(driver, el, text, clear=clear and not is_human(), gap=(a, b))
 
 def random_email():
     rnd = ''.join(secrets.choice(string.ascii_lowercase + string.digits) for _ in range(10))
@@ -62,65 +66,142 @@ def random_password():
     return ''.join(secrets.choice(alpha) for _ in range(14))
 
 # ---------- Main flow ----------
-def main():
+def register_account(driver):
+    """
+    Ana sayfası açık (çıkış yapılmış) driver'da tek kayıt: form → submit → logout görünür → çıkış.
+    Dönüş: (email, username, password). Çıkış yapıldığı için aynı driver bir sonraki kayda hazırdır.
+    """
+    step = 0
+
+    # 1) Kayıt Ol butonuna tıkla
+    step += 1
+    log.info(f"[STEP {step}] 'Kayıt Ol' butonuna tıklanıyor.")
+    btn_register = wait_until_clickable(driver, L.OPEN_REGISTER_BUTTON, "Kayıt Ol butonu")
+    human_pause(0.2, 0.5)
+    btn_register.click()
+
+    # 2) Form alanlarının görünmesini bekle
+    step += 1
+    log.info(f"[STEP {step}] Kayıt formu alanları bekleniyor.")
+    wait_until_visible(driver, L.EMAIL_INPUT, "E-posta alanı")
+    wait_until_visible(driver, L.USERNAME_INPUT, "Kullanıcı adı alanı")
+    wait_until_visible(driver, L.PASSWORD_INPUT, "Parola alanı")
+    human_pause()
+
+    # 3) Rastgele veriler üret
+    email = random_email()
+    username = random_username()
+    password = random_password()
+    log.info(f"[DATA] email={email} username={username} (şifre loglanmaz)")
+
+    # 4) Formu doldur (insan gibi yaz)
+    t_form = time.perf_counter()
+    step += 1
+    log.info(f"[STEP {step}] Form dolduruluyor.")
+    type_slow(driver, L.EMAIL_INPUT, email, desc="E-posta")
+    human_pause()
+    type_slow(driver, L.USERNAME_INPUT, username, desc="Kullanıcı adı")
+    human_pause()
+    type_slow(driver, L.PASSWORD_INPUT, password, desc="Parola")
+    human_pause(0.2, 0.5)
+
+    # 5) Gönder
+    step += 1
+    log.info(f"[STEP {step}] 'Kayıt Ol' formu gönderiliyor.")
+    submit_el = wait_until_clickable(driver, L.SUBMIT_BUTTON, "Kayıt Ol (submit)")
+    human_pause(0.1, 0.3)
+    submit_el.click()
+
+    # 6) Modal kapanışı / ana ekrana dönüş (logout butonu görünmeli)
+    step += 1
+    log.info(f"[STEP {step}] Kayıt sonrası ana ekran doğrulaması.")
+    # Modal kapandı sayılırsa header’daki logout butonu clickable olur
+    logout_btn = wait_until_clickable(driver, L.LOGOUT_BUTTON, "Logout butonu", timeout=20)
+    record("register", (time.perf_counter() - t_form) * 1000)
+    human_pause(0.3, 0.8)
+    logout_btn.click()
+    log.info("✅ Kayıt ve çıkış tamamlandı.")
+    return email, username, password
+
+def register_bulk(count, workers):
+    """
+    count hesabı `workers` tarayıcıda eşzamanlı kaydeder; her worker tarayıcısını yeniden kullanır
+    (kayıt → çıkış → sonraki kayıt), hata olursa tarayıcıyı yenileyip devam eder.
+    Başarılı her hesap yalnızca add_account ile hesap havuzuna eklenir; test_user_data.json (suite'in
+    varsayılan kullanıcısı) değişmez. Dönüş: başarılı kayıt sayısı.
+    """
+    remaining = iter(range(count))
+    lock = threading.Lock()
+    done = []
+
+    def _worker(worker):
+        driver = None
+        while True:
+            with lock:
+                idx = next(remaining, None)
+            if idx is None:
+                break
+            try:
+                if driver is None:
+                    driver, _ = open_browser()
+                creds = register_account(driver)
+                add_account(*creds)
+                with lock:
+                    done.append(creds[1])
+                    log.info(f"[BULK] {len(done)}/{count} kayıt (worker {worker})")
+            except Exception as e:
+                log.error(f"⛔ [BULK] kayıt {idx + 1} başarısız (worker {worker}): {e}")
+                if driver is not None:
+                    driver.quit()
+                    driver = None
+        if driver is not None:
+            driver.quit()
+
+    threads = [threading.Thread(target=_worker, args=(w,), name=f"register-{w}") for w in range(max(1, min(workers, count)))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return len(done)
+
+def parse_args(argv=None):
+    ap = argparse.ArgumentParser(description="Yeni test hesabı kaydı")
+    ap.add_argument("--count", type=int, default=1, help="kaydedilecek hesap sayısı (>1 → toplu mod)")
+    ap.add_argument("--workers", type=int, default=1, help="toplu modda eşzamanlı tarayıcı sayısı")
+    ap.add_argument("--bulk", action="store_true",
+                    help="tek hesapta da toplu mod: yalnızca havuza yaz, test_user_data.json'a dokunma")
+    ap.add_argument("--pool", action="store_true", default=_truthy(os.getenv("ACCOUNT_POOL")),
+                    help="tekil kayıtta hesabı hesap havuzuna da ekle (varsayılan ACCOUNT_POOL env'i; toplu mod yalnızca havuza yazar)")
+    ap.add_argument("--input", choices=INPUT_MODES, default=None,
+                    help="human: karakter karakter | bulk: tek send_keys | instant: value setter + input event "
+                         "(varsayılan INPUT_MODE env'i, yoksa human)")
+    return ap.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.input:
+        set_input_mode(args.input)
     run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    if args.count > 1 or args.bulk:
+        t0 = time.perf_counter()
+        log.info(f"[BULK] {args.count} hesap, {args.workers} worker. run_id={run_id}")
+        ok = register_bulk(args.count, args.workers)
+        log.info(f"[BULK] {ok}/{args.count} hesap {time.perf_counter() - t0:.0f} sn'de kaydedildi → havuz {account_stats()}")
+        return 0 if ok == args.count else 1
+
     driver, _ = open_browser()   # wait objesine ihtiyac yok; kendi wait helper'larımızı kullanıyoruz
-    step = 0
 
     try:
-        step += 1
-        log.info(f"[STEP {step}] Ana sayfa yüklendi. Kayıt akışı başlıyor. run_id={run_id}")
+        log.info(f"[STEP 0] Ana sayfa yüklendi. Kayıt akışı başlıyor. run_id={run_id}")
         human_pause()
 
-        # 1) Kayıt Ol butonuna tıkla
-        step += 1
-        log.info(f"[STEP {step}] 'Kayıt Ol' butonuna tıklanıyor.")
-        btn_register = wait_until_clickable(driver, L.OPEN_REGISTER_BUTTON, "Kayıt Ol butonu")
-        human_pause(0.2, 0.5)
-        btn_register.click()
-
-        # 2) Form alanlarının görünmesini bekle
-        step += 1
-        log.info(f"[STEP {step}] Kayıt formu alanları bekleniyor.")
-        wait_until_visible(driver, L.EMAIL_INPUT, "E-posta alanı")
-        wait_until_visible(driver, L.USERNAME_INPUT, "Kullanıcı adı alanı")
-        wait_until_visible(driver, L.PASSWORD_INPUT, "Parola alanı")
-        human_pause()
-
-        # 3) Rastgele veriler üret
-        email = random_email()
-        username = random_username()
-        password = random_password()
-        log.info(f"[DATA] email={email} username={username} (şifre loglanmaz)")
+        email, username, password = register_account(driver)
 
-        # 4) Formu doldur (insan gibi yaz)
-        step += 1
-        log.info(f"[STEP {step}] Form dolduruluyor.")
-        type_slow(driver, L.EMAIL_INPUT, email, desc="E-posta")
-        human_pause()
-        type_slow(driver, L.USERNAME_INPUT, username, desc="Kullanıcı adı")
-        human_pause()
-        type_slow(driver, L.PASSWORD_INPUT, password, desc="Parola")
-        human_pause(0.2, 0.5)
-
-        # 5) Gönder
-        step += 1
-        log.info(f"[STEP {step}] 'Kayıt Ol' formu gönderiliyor.")
-        submit_el = wait_until_clickable(driver, L.SUBMIT_BUTTON, "Kayıt Ol (submit)")
-        human_pause(0.1, 0.3)
-        submit_el.click()
-
-        # 6) Modal kapanışı / ana ekrana dönüş (logout butonu görünmeli)
-        step += 1
-        log.info(f"[STEP {step}] Kayıt sonrası ana ekran doğrulaması.")
-        # Modal kapandı sayılırsa header’daki logout butonu clickable olur
-        logout_btn = wait_until_clickable(driver, L.LOGOUT_BUTTON, "Logout butonu", timeout=20)
-        human_pause(0.3, 0.8)
-        logout_btn.click()
-        log.info("✅ Kayıt ve çıkış tamamlandı.")
-
-        # 7) Test verisini kaydet
+        # 7) Test verisini kaydet (havuz yalnızca istenirse: --pool / ACCOUNT_POOL=1)
         save_user_data(email, username, password)
+        if args.pool:
+            add_account(email, username, password)
 
     except TimeoutException as e:
         log.error(f"⛔ Zaman aşımı hatası: {e}")
@@ -131,6 +212,7 @@ def main():
     finally:
         # Headless pipeline dostu: sadece tarayıcıyı kapat
         driver.quit()
+    return 0
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
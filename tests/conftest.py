@@ -0,0 +1,9 @@
+# tests/conftest.py
+# -*- coding: utf-8 -*-
+"""Birim testleri tarayıcısız koşar; proje kökü import yoluna eklenir (common/, harness/, main)."""
+import os
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
@@ -0,0 +1,52 @@
+# tests/test_bench.py
+# -*- coding: utf-8 -*-
+import pytest
+
+from harness import bench
+
+def _run(**p50):
+    return {"metrics": {m: {"p50": v, "p95": v * 2} for m, v in p50.items()}}
+
+def _by_metric(rows):
+    return {r["metric"]: r for r in rows}
+
+def test_compare_flags_only_relative_and_absolute_regressions():
+    base = _run(slow=10.0, tiny=0.5, same=10.0, faster=10.0)
+    cur = _run(slow=15.0, tiny=1.0, same=10.0, faster=5.0)
+    rows = _by_metric(bench.compare(cur, base, threshold=0.25, min_delta_ms=2))
+    assert rows["slow"]["regressed"] and rows["slow"]["delta_pct"] == 50.0
+    assert not rows["tiny"]["regressed"]              # %100 ama 0.5 ms → gürültü eşiğinin altında
+    assert not rows["same"]["regressed"]
+    assert not rows["faster"]["regressed"] and rows["faster"]["delta_pct"] == -50.0
+
+@pytest.mark.parametrize("cur, regressed", [(12.5, False), (12.6, True)])
+def test_compare_threshold_is_exclusive(cur, regressed):
+    rows = bench.compare(_run(m=cur), _run(m=10.0), threshold=0.25, min_delta_ms=0)
+    assert rows[0]["regressed"] is regressed
+
+def test_compare_stat_and_new_metrics():
+    rows = bench.compare(_run(m=10.0, new=1.0), _run(m=10.0), threshold=0.25, stat="p95", min_delta_ms=0)
+    assert [(r["metric"], r["base"], r["cur"]) for r in rows] == [("m", 20.0, 20.0)]     # yeni metrik atlanır
+
+def test_compare_reports_dropped_metric_as_failure():
+    rows = _by_metric(bench.compare(_run(m=10.0), _run(m=10.0, gone=3.0), threshold=0.25, min_delta_ms=0))
+    assert rows["gone"]["missing"] and rows["gone"]["regressed"] and rows["gone"]["cur"] is None
+    assert not rows["m"]["missing"] and not rows["m"]["regressed"]
+    assert "MISSING" in bench.format_compare(list(rows.values()), "p50")
+
+def test_compare_cli_exit_code_on_dropped_metric(tmp_path):
+    cur, base = tmp_path / "cur.json", tmp_path / "base.json"
+    bench.save_json(str(cur), _run(m=10.0))
+    bench.save_json(str(base), _run(m=10.0, gone=3.0))
+    assert bench.main(["compare", str(cur), "--baseline", str(base)]) == 1
+    bench.save_json(str(base), _run(m=10.0))
+    assert bench.main(["compare", str(cur), "--baseline", str(base)]) == 0
+
+def test_compare_zero_baseline_never_regresses():
+    rows = bench.compare(_run(m=5.0), _run(m=0.0), threshold=0.25, min_delta_ms=0)
+    assert rows[0]["delta_pct"] == 0.0 and not rows[0]["regressed"]
+
+def test_stats_rounds_and_handles_empty():
+    s = bench._stats([3.14159, 1.0, 2.0])
+    assert (s["n"], s["p50"], s["max"], s["mean"]) == (3, 2.0, 3.142, 2.047)
+    assert bench._stats([])["mean"] == 0.0
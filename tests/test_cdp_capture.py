@@ -0,0 +1,111 @@
+# tests/test_cdp_capture.py
+# -*- coding: utf-8 -*-
+import json
+import time
+import threading
+
+import pytest
+
+from harness import cdp_capture
+
+trio = pytest.importorskip("trio")
+trio_websocket = pytest.importorskip("trio_websocket")
+
+PLAY_URL = "https://api.example.com/v1/play"
+
+class FakeDriver:
+    """Performance log'a dokunulursa test düşer (stream yolunda yoklama olmamalı)."""
+    def __init__(self, debugger_address=None):
+        self.capabilities = {"goog:chromeOptions": {"debuggerAddress": debugger_address}} if debugger_address else {}
+        self.current_window_handle = "TARGET1"
+        self.get_log_calls = 0
+
+    def get_log(self, kind):
+        self.get_log_calls += 1
+        return []
+
+class FakeDevtools:
+    """
+    Tek sayfa hedefli sahte DevTools ucu: Network.enable'dan `delay` sn sonra bir /v1/play cevabının
+    responseReceived + loadingFinished olaylarını iter, getResponseBody'ye gövdeyle cevap verir.
+    """
+    def __init__(self, result="win", delay=0.3):
+        self.result, self.delay = result, delay
+        self.paths, self.origins, self.methods = [], [], []
+        ready = threading.Event()
+        self._thread = threading.Thread(target=trio.run, args=(self._main, ready), daemon=True)
+        self._thread.start()
+        assert ready.wait(5)
+
+    async def _main(self, ready):
+        async with trio.open_nursery() as nursery:
+            server = await nursery.start(trio_websocket.serve_websocket, self._handle, "127.0.0.1", 0, None)
+            self.port = server.port
+            self._cancel = nursery.cancel_scope
+            ready.set()
+
+    async def _handle(self, request):
+        self.paths.append(request.path)
+        self.origins.append(dict(request.headers).get(b"origin"))
+        ws = await request.accept()
+        try:
+            while True:
+                msg = json.loads(await ws.get_message())
+                self.methods.append(msg["method"])
+                if msg["method"] == "Network.getResponseBody":
+                    body = json.dumps({"data": {"action": "result", "result": self.result, "session_id": "s1"}})
+                    await ws.send_message(json.dumps({"id": msg["id"], "result": {"body": body}}))
+                    continue
+                await ws.send_message(json.dumps({"id": msg["id"], "result": {}}))
+                if msg["method"] == "Network.enable":
+                    await trio.sleep(self.delay)
+                    resp = {"url": PLAY_URL, "status": 200, "timing": {"requestTime": 1.0, "sendStart": 1.0,
+                                                                      "receiveHeadersEnd": 21.0}}
+                    for method, params in (("Network.responseReceived", {"requestId": "r1", "response": resp}),
+                                           ("Network.loadingFinished", {"requestId": "r1", "timestamp": 1.05,
+                                                                        "encodedDataLength": 64})):
+                        await ws.send_message(json.dumps({"method": method, "params": params}))
+        except trio_websocket.ConnectionClosed:
+            pass
+
+def test_devtools_ws_url():
+    assert cdp_capture.devtools_ws_url(FakeDriver("localhost:9222")) == "ws://localhost:9222/devtools/page/TARGET1"
+    assert cdp_capture.devtools_ws_url(FakeDriver()) is None
+
+def test_stream_delivers_result_without_polling_performance_log():
+    devtools = FakeDevtools(delay=0.3)
+    driver = FakeDriver(f"127.0.0.1:{devtools.port}")
+    watcher = cdp_capture.CdpPlayWatcher(driver, action="result")
+    watcher.install()
+    try:
+        assert watcher.mode == "stream"
+        t0 = time.time()
+        item = watcher.wait_result(since_ms=0, session_id=None, timeout=5.0)
+        assert item["result"] == "win" and item["session_id"] == "s1" and item["url"] == PLAY_URL
+        assert 0.2 < time.time() - t0 < 2.0                  # olayla uyandı, timeout'a kadar beklemedi
+        (net,) = watcher.drain_net()
+        assert net["via"] == "cdp" and net["ttfb_ms"] == 20.0 and net["total_ms"] == pytest.approx(49.0)
+        assert driver.get_log_calls == 0
+        assert devtools.paths == ["/devtools/page/TARGET1"]
+        assert devtools.origins == [None]                     # Chrome, Origin başlıklı websocket'i reddeder
+        assert devtools.methods == ["Network.enable", "Network.getResponseBody"]
+    finally:
+        watcher.close()
+
+def test_falls_back_to_performance_log_without_debugger_address():
+    driver = FakeDriver()
+    watcher = cdp_capture.CdpPlayWatcher(driver, action="result")
+    watcher.install()
+    assert watcher.mode == "poll"
+    assert watcher.wait_result(since_ms=0, session_id=None, timeout=0.2) is None
+    assert driver.get_log_calls > 1
+
+def test_closed_stream_falls_back_to_polling():
+    devtools = FakeDevtools(delay=60)
+    driver = FakeDriver(f"127.0.0.1:{devtools.port}")
+    watcher = cdp_capture.CdpPlayWatcher(driver, action="result")
+    watcher.install()
+    watcher._stream._ws.close()                              # tarayıcı/soket gitti
+    assert watcher._stream.closed.wait(2)
+    assert watcher.wait_result(since_ms=0, session_id=None, timeout=0.3) is None
+    assert watcher._stream is None and driver.get_log_calls > 0
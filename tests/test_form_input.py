@@ -0,0 +1,37 @@
+# tests/test_form_input.py
+# -*- coding: utf-8 -*-
+import importlib
+
+import pytest
+
+from common import form_input
+
+@pytest.fixture
+def reload_with_env(monkeypatch):
+    def reload(value):
+        if value is None:
+            monkeypatch.delenv("INPUT_MODE", raising=False)
+        else:
+            monkeypatch.setenv("INPUT_MODE", value)
+        return importlib.reload(form_input)
+    yield reload
+    monkeypatch.delenv("INPUT_MODE", raising=False)
+    importlib.reload(form_input)
+
+@pytest.mark.parametrize("value, mode", [(None, None), ("", None), (" Bulk ", "bulk"), ("instant", "instant")])
+def test_env_mode_is_normalized(reload_with_env, value, mode):
+    mod = reload_with_env(value)
+    assert mod.input_mode(default="human") == (mode or "human")
+
+def test_invalid_env_mode_fails_at_import(reload_with_env):
+    with pytest.raises(ValueError, match="INPUT_MODE"):
+        reload_with_env("fast")
+
+def test_set_input_mode_validates():
+    with pytest.raises(ValueError):
+        form_input.set_input_mode("fast")
+    form_input.set_input_mode("bulk")
+    try:
+        assert form_input.input_mode() == "bulk" and not form_input.is_human()
+    finally:
+        form_input.set_input_mode(None)
@@ -0,0 +1,84 @@
+# tests/test_game.py
+# -*- coding: utf-8 -*-
+from contextlib import contextmanager
+
+import pytest
+
+from harness import game
+from harness.games import MINES, KENO, DICE
+
+class RecordingDriver:
+    """W3C_ACTIONS komutlarını kaydeder: (tuş, tuştan önceki pause ms) listesi olarak okunur."""
+    def __init__(self):
+        self.commands = []
+
+    def execute(self, command, params=None):
+        self.commands.append((command, params))
+        return {"value": None}
+
+    def keys_sent(self):
+        out = []
+        for command, payload in self.commands:
+            assert command == "actions"
+            source, = [a for a in payload["actions"] if a["type"] == "key"]
+            lead = sum(a.get("duration") or 0 for a in source["actions"] if a["type"] == "pause")
+            out.append(([a["value"] for a in source["actions"] if a["type"] == "keyDown"], lead))
+        return out
+
+@pytest.fixture
+def paced(monkeypatch):
+    """play_picks_paced'i gerçek send_key_action + sahte sonuçlarla koşar."""
+    def run(results):
+        driver, it, pressed = RecordingDriver(), iter(results), []
+        monkeypatch.setattr(game, "press", lambda d, k: pressed.append(k))
+        monkeypatch.setattr(game, "_wait_play", lambda w, s, since, sid, phase: {"result": next(it)})
+        monkeypatch.setattr(game, "now_ms", lambda d: 0)
+        monkeypatch.setattr(game, "nap", lambda *a: None)
+        monkeypatch.setattr(game, "wait_frame_idle", lambda d: True)
+        return game.play_picks_paced(driver, None, MINES), driver.keys_sent(), pressed
+    return run
+
+def test_paced_picks_stop_at_first_loss(paced):
+    outcome, sent, pressed = paced(["inprogress", "lose", "inprogress", "inprogress"])
+    assert outcome == "lose" and not pressed
+    assert sent == [(["q"], 0), (["q"], game.PICK_BATCH_GAP_MS)]     # pick başına tek komut; kayıptan sonra tuş yok
+
+def test_paced_picks_cash_out_after_streak(paced):
+    outcome, sent, pressed = paced(["inprogress"] * MINES.streak)
+    assert outcome == "success" and pressed == [MINES.cashout_key]
+    assert sent == [(["q"], 0)] + [(["q"], game.PICK_BATCH_GAP_MS)] * (MINES.streak - 1)
+
+class TimeoutWatcher:
+    """Hiç sonuç vermeyen watcher; istenen bekleme süresini kaydeder."""
+    def __init__(self):
+        self.timeouts = []
+
+    def wait_result(self, since_ms, session_id, timeout):
+        self.timeouts.append(timeout)
+        return None
+
+@pytest.mark.parametrize("spec, expected", [(KENO, 15.0), (DICE, game.RESULT_TIMEOUT)])
+def test_wait_play_uses_per_game_result_timeout(monkeypatch, spec, expected):
+    recorded, watcher = [], TimeoutWatcher()
+    monkeypatch.setattr(game, "record", lambda *a, **kw: recorded.append((a, kw)))
+    assert game._wait_play(watcher, spec, 0, None, "bet_result") is None
+    assert watcher.timeouts == [expected]
+    assert recorded == [(("result_timeout", expected * 1000), {"game": spec.name, "action": "bet_result"})]
+
+def test_run_single_logs_shared_run_id(monkeypatch, caplog):
+    @contextmanager
+    def creds():
+        yield "u", "p"
+
+    class Driver:
+        def quit(self): pass
+
+    monkeypatch.setenv("RUN_ID", "20260101_000000_123_abcd")
+    monkeypatch.setattr(game, "player_credentials", creds)
+    monkeypatch.setattr(game, "make_driver", Driver)
+    monkeypatch.setattr(game, "nap", lambda *a: None)
+    monkeypatch.setattr(game, "login", lambda *a, **kw: None)
+    monkeypatch.setattr(game, "play_game", lambda d, s, n: "success")
+    with caplog.at_level("INFO", logger="harness"):
+        assert game.run_single(DICE) == "success"
+    assert "run_id=20260101_000000_123_abcd" in caplog.text
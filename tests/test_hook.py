@@ -0,0 +1,100 @@
+# tests/test_hook.py
+# -*- coding: utf-8 -*-
+import json
+import shutil
+import subprocess
+
+import pytest
+
+from harness.hook import HOOK_JS
+
+NODE = shutil.which("node")
+pytestmark = pytest.mark.skipif(not NODE, reason="node yok")
+
+# HOOK_JS'i sahte bir window ile çalıştırır; fetch hook'u /v1/play cevabını push() eder.
+# Senaryo JS'i `calls` ile bir liste döndürür, sonuç JSON olarak okunur.
+RUNNER = r"""
+const window = globalThis;
+let nextBody = null;
+window.fetch = async () => ({ clone(){ return this; }, json: async () => nextBody, text: async () => JSON.stringify(nextBody),
+                              headers: { get: () => null }, status: 200 });
+window.XMLHttpRequest = function(){};
+window.XMLHttpRequest.prototype.open = function(){};
+window.XMLHttpRequest.prototype.send = function(){};
+window.XMLHttpRequest.prototype.addEventListener = function(){};
+const hook = new Function(%(hook)s);
+hook(%(capacity)d, false);
+async function play(sid, action){
+  nextBody = {data: {action, session_id: sid, result: "win"}};
+  await window.fetch("https://api.example.com/v1/play", {method: "POST"});
+  await new Promise(r => setTimeout(r, 0));
+}
+(async () => {
+  const out = await (async () => { %(scenario)s })();
+  process.stdout.write(JSON.stringify(out));
+})();
+"""
+
+def run_hook(scenario, capacity=256):
+    src = RUNNER % {"hook": json.dumps(HOOK_JS), "capacity": capacity, "scenario": scenario}
+    res = subprocess.run([NODE, "-e", src], capture_output=True, text=True, timeout=30)
+    assert res.returncode == 0, res.stderr
+    return json.loads(res.stdout)
+
+def test_pop_by_session_returns_oldest_of_that_session():
+    out = run_hook("""
+        await play("A", "bet"); await play("B", "bet"); await play("A", "cashout");
+        const a1 = window.__PLAY_POP__(0, "A", null);
+        const a2 = window.__PLAY_POP__(0, "A", null);
+        const a3 = window.__PLAY_POP__(0, "A", null);
+        return {a1, a2, a3, rest: window.__PLAY_POP__(0, null, null), stats: window.__PLAY_STATS__()};
+    """)
+    assert out["a1"]["action"] == "bet" and out["a1"]["session_id"] == "A"
+    assert out["a2"]["action"] == "cashout"
+    assert out["a3"] is None
+    assert out["rest"]["session_id"] == "B"
+    assert "nodes" not in out["a1"] and "seq" not in out["a1"]
+    assert out["stats"]["size"] == 0
+    assert out["stats"]["indexed"] == 0 and out["stats"]["sessions"] == 0 and out["stats"]["actions"] == 0
+
+def test_taken_records_leave_no_dead_entries_in_other_indexes():
+    # B oturumunun kayıtları session indeksinden alınınca all/action listelerinde ölü girdi kalmamalı
+    out = run_hook("""
+        for (let i = 0; i < 50; i++) await play("B", "bet");
+        await play("A", "bet");
+        for (let i = 0; i < 50; i++) window.__PLAY_POP__(0, "B", null);
+        const s = window.__PLAY_STATS__();
+        return {stats: s, head: window.__PLAY_POP__(0, null, "bet")};
+    """)
+    assert out["stats"]["size"] == 1 and out["stats"]["indexed"] == 1
+    assert out["stats"]["sessions"] == 1
+    assert out["head"]["session_id"] == "A"
+
+def test_overflow_counter_counts_unread_overwrites():
+    out = run_hook("""
+        for (let i = 0; i < 4; i++) await play("S" + i, "bet");
+        window.__PLAY_POP__(0, "S0", null);           // okunmuş slot üzerine yazılır → overflow yok
+        await play("S4", "bet");
+        const before = window.__PLAY_STATS__();
+        await play("S5", "bet"); await play("S6", "bet");  // S1, S2 okunmadan ezilir
+        const after = window.__PLAY_STATS__();
+        return {before, after, s1: window.__PLAY_POP__(0, "S1", null), s3: window.__PLAY_POP__(0, "S3", null)};
+    """, capacity=4)
+    assert out["before"]["overflow"] == 0 and out["before"]["size"] == 4
+    assert out["after"]["overflow"] == 2
+    assert out["after"]["size"] == 4 and out["after"]["indexed"] == 4 and out["after"]["sessions"] == 4
+    assert out["after"]["total"] == 7
+    assert out["s1"] is None
+    assert out["s3"]["session_id"] == "S3"
+
+def test_drain_respects_since_and_max():
+    out = run_hook("""
+        await play("A", "bet");
+        const since = Date.now() + 1;
+        await new Promise(r => setTimeout(r, 5));
+        await play("A", "pick"); await play("A", "pick"); await play("A", "pick");
+        const got = window.__PLAY_DRAIN__(since, "A", "pick", 2);
+        return {got, stats: window.__PLAY_STATS__()};
+    """)
+    assert [r["action"] for r in out["got"]] == ["pick", "pick"]
+    assert out["stats"]["size"] == 2
@@ -0,0 +1,73 @@
+# tests/test_keys.py
+# -*- coding: utf-8 -*-
+import pytest
+from selenium.webdriver.common.keys import Keys
+
+from harness import keys
+
+class FakeDriver:
+    """execute / execute_cdp_cmd çağrılarını kaydeder (W3C action ve CDP yükleri incelenir)."""
+    def __init__(self):
+        self.calls = []
+
+    def execute(self, command, params=None):
+        self.calls.append((command, params))
+        return {"value": None}
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.calls.append((cmd, params))
+        return {}
+
+@pytest.mark.parametrize("key, expected", [
+    (Keys.SPACE, {"key": " ", "code": "Space", "windowsVirtualKeyCode": 32, "text": " "}),
+    (Keys.ENTER, {"key": "Enter", "code": "Enter", "windowsVirtualKeyCode": 13, "text": "\r"}),
+    ("q", {"key": "q", "code": "KeyQ", "windowsVirtualKeyCode": 81, "text": "q"}),
+    ("W", {"key": "W", "code": "KeyW", "windowsVirtualKeyCode": 87, "text": "W"}),
+    ("7", {"key": "7", "code": "Digit7", "windowsVirtualKeyCode": 55, "text": "7"}),
+])
+def test_cdp_key_params(key, expected):
+    params = keys.cdp_key_params(key)
+    assert {k: params.get(k) for k in expected} == expected
+    assert params["nativeVirtualKeyCode"] == expected["windowsVirtualKeyCode"]
+
+def test_cdp_key_params_escape_has_no_text():
+    params = keys.cdp_key_params(Keys.ESCAPE)
+    assert params["code"] == "Escape" and "text" not in params
+
+@pytest.mark.parametrize("key", [Keys.ARROW_LEFT, Keys.F5, "ab", "ş", "-", ""])
+def test_cdp_key_params_unsupported(key):
+    assert keys.cdp_key_params(key) is None
+
+def test_dispatch_cdp_key_sends_down_then_up():
+    drv = FakeDriver()
+    assert keys.dispatch_cdp_key(drv, "q")
+    (c1, down), (c2, up) = drv.calls                       # CDP yolu: tuş başına iki komut
+    assert c1 == c2 == "Input.dispatchKeyEvent"
+    assert down["type"] == "keyDown" and down["text"] == "q"
+    assert up["type"] == "keyUp" and "text" not in up and up["code"] == "KeyQ"
+
+def test_dispatch_cdp_key_unsupported_sends_nothing():
+    drv = FakeDriver()
+    assert not keys.dispatch_cdp_key(drv, Keys.ARROW_UP)
+    assert drv.calls == []
+
+def _key_actions(payload):
+    """W3C_ACTIONS yükündeki klavye kaynağının aksiyonları."""
+    source, = [a for a in payload["actions"] if a["type"] == "key"]
+    return source["actions"]
+
+def test_send_key_action_embeds_lead_pause_in_one_command():
+    drv = FakeDriver()
+    keys.send_key_action(drv, "q", lead_ms=250)
+    (command, payload), = drv.calls                       # bekleme + tuş: tek komut
+    assert command == "actions"
+    acts = [a for a in _key_actions(payload) if not (a["type"] == "pause" and not a.get("duration"))]
+    assert acts == [{"type": "pause", "duration": 250},
+                    {"type": "keyDown", "value": "q"}, {"type": "keyUp", "value": "q"}]
+
+def test_send_key_action_without_lead_has_no_pause():
+    drv = FakeDriver()
+    keys.send_key_action(drv, Keys.SPACE)
+    (_, payload), = drv.calls
+    assert not [a for a in _key_actions(payload) if a["type"] == "pause" and a.get("duration")]
+    assert [a["value"] for a in _key_actions(payload) if a["type"] == "keyDown"] == [Keys.SPACE]
@@ -0,0 +1,64 @@
+# tests/test_main.py
+# -*- coding: utf-8 -*-
+import time
+import threading
+
+import pytest
+
+import main
+
+@pytest.fixture
+def fake_run(monkeypatch):
+    """run_test_streamed yerine verilen exit kodlarını döndüren sahte koşucu; koşulanları kaydeder."""
+    ran = []
+
+    def install(codes):
+        def run(name):
+            ran.append(name)
+            return codes.get(name, 0)
+        monkeypatch.setattr(main, "run_test_streamed", run)
+        return ran
+    return install
+
+def test_all_pass_returns_zero(fake_run):
+    ran = fake_run({})
+    assert main.run_parallel(main.TEST_FILES, workers=3) == 0
+    assert sorted(ran) == sorted(main.TEST_FILES)
+    assert ran[0] == "register.py"            # bağımlılar register bitmeden başlamaz
+
+def test_failed_dependency_skips_dependents(fake_run):
+    ran = fake_run({"register.py": 7})
+    assert main.run_parallel(main.TEST_FILES, workers=3) == 7
+    assert ran == ["register.py"]
+
+def test_first_failure_exit_code_wins(fake_run):
+    ran = fake_run({"keno.py": 3})
+    assert main.run_parallel(["register.py", "login.py", "keno.py", "dice.py"], workers=1) == 3
+    assert ran == ["register.py", "login.py", "keno.py", "dice.py"]    # kardeş testler koşmaya devam eder
+
+def test_failed_login_skips_games(fake_run):
+    ran = fake_run({"login.py": 4})
+    assert main.run_parallel(main.TEST_FILES, workers=4) == 4
+    assert ran == ["register.py", "login.py"]
+
+def test_games_start_after_login_finishes(monkeypatch):
+    """login.py'nin logout'u paylaşılan hesabın oyun oturumlarını düşürmesin: hiçbir oyun login bitmeden başlamaz."""
+    events, lock = [], threading.Lock()
+
+    def run(name):
+        with lock:
+            events.append(("start", name))
+        time.sleep(0.02)
+        with lock:
+            events.append(("end", name))
+        return 0
+    monkeypatch.setattr(main, "run_test_streamed", run)
+    assert main.run_parallel(main.TEST_FILES, workers=8) == 0
+    login_end = events.index(("end", "login.py"))
+    game_starts = [i for i, (kind, name) in enumerate(events) if kind == "start" and name not in ("register.py", "login.py")]
+    assert len(game_starts) == 7 and min(game_starts) > login_end
+
+def test_dependency_outside_selection_is_ignored(fake_run):
+    ran = fake_run({})
+    assert main.run_parallel(["keno.py", "dice.py"], workers=2) == 0
+    assert sorted(ran) == ["dice.py", "keno.py"]
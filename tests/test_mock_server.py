@@ -0,0 +1,120 @@
+# tests/test_mock_server.py
+# -*- coding: utf-8 -*-
+import pytest
+
+from harness import mock_server as ms
+
+def _state(sequences=None, seed=None):
+    return ms.MockState(ms.Outcomes(sequences, seed=seed))
+
+def _play(state, game, action, session_id=None, player=""):
+    return state.play({"game": game, "action": action, "session_id": session_id}, player)["data"]
+
+# ---------- cashout oturumları (warpwar / dragon_tower / mines) ----------
+def test_cashout_bet_opens_inprogress_session():
+    state = _state()
+    bet = _play(state, "mines", "bet")
+    assert bet["action"] == "bet" and bet["result"] == "inprogress"
+    assert state.sessions[bet["session_id"]] == "mines"
+
+def test_cashout_closes_session_with_win():
+    state = _state({("mines", "pick"): ["in_progress"]})
+    sid = _play(state, "mines", "bet")["session_id"]
+    assert _play(state, "mines", "pick", sid)["result"] == "in_progress"
+    assert _play(state, "mines", "cashout", sid)["result"] == "win"
+    assert sid not in state.sessions
+
+def test_losing_pick_closes_session():
+    state = _state({("mines", "pick"): ["lose"]})
+    sid = _play(state, "mines", "bet")["session_id"]
+    assert _play(state, "mines", "pick", sid)["result"] == "lose"
+    with pytest.raises(ValueError):
+        _play(state, "mines", "pick", sid)          # kapalı oturum → handler 400 döner
+
+@pytest.mark.parametrize("action", ["pick", "cashout"])
+def test_unknown_or_foreign_session_rejected(action):
+    state = _state()
+    sid = _play(state, "warpwar", "bet")["session_id"]
+    with pytest.raises(ValueError):
+        _play(state, "mines", action, sid)          # başka oyunun oturumu
+    with pytest.raises(ValueError):
+        _play(state, "mines", action, "nope")
+
+def test_non_cashout_bet_resolves_immediately():
+    state = _state({("dice", "bet"): ["win"]})
+    data = _play(state, "dice", "bet")
+    assert data["action"] == "result" and data["result"] == "win"
+    assert not state.sessions
+
+def test_unknown_action_rejected():
+    with pytest.raises(ValueError):
+        _play(_state(), "dice", "spin")
+
+# ---------- script / seed (user-016) ----------
+def test_parse_sequence():
+    assert ms.parse_sequence("dice:bet=win, lose,,win") == ("dice", "bet", ["win", "lose", "win"])
+    assert ms.parse_sequence("mines:pick=in_progress,lose") == ("mines", "pick", ["in_progress", "lose"])
+
+@pytest.mark.parametrize("arg", ["dice=win", "dice:spin=win", "dice:bet=", ":bet=win", "mines:bet=win"])
+def test_parse_sequence_rejects(arg):
+    with pytest.raises(ValueError):
+        ms.parse_sequence(arg)
+
+def test_load_script(tmp_path):
+    fp = tmp_path / "outcomes.json"
+    fp.write_text('{"keno": {"bet": ["lose", "win"]}, "mines": {"pick": ["lose"]}}', encoding="utf-8")
+    assert ms.load_script(str(fp)) == {("keno", "bet"): ["lose", "win"], ("mines", "pick"): ["lose"]}
+    fp.write_text('{"mines": {"bet": ["win"]}}', encoding="utf-8")
+    with pytest.raises(ValueError):
+        ms.load_script(str(fp))
+
+def _rounds_until_stop(spec, script, limit=500):
+    """Cashout / win-streak stratejisini script'e karşı oynatır; durduğu tur sayısı (limit → durmadı)."""
+    from harness.game import STOP_CASHOUT, STOP_WIN_STREAK
+    out = ms.Outcomes(script)
+    streak = 0
+    for rnd in range(1, limit + 1):
+        if spec.stop == STOP_CASHOUT:
+            for _ in range(spec.streak):
+                if out.next(spec.name, "pick") != "in_progress":
+                    break
+            else:
+                return rnd
+        else:
+            assert spec.stop == STOP_WIN_STREAK
+            streak = streak + 1 if out.next(spec.name, "bet") == "win" else 0
+            if streak >= spec.streak:
+                return rnd
+    return limit
+
+@pytest.mark.parametrize("rounds", [1, 2, 3, 7])
+def test_fixed_length_script_ends_after_exactly_n_rounds(rounds):
+    from harness.games import GAMES
+    from harness.game import STOP_ROUNDS
+    script = ms.fixed_length_script(GAMES.values(), rounds)
+    for spec in GAMES.values():
+        if spec.stop == STOP_ROUNDS:
+            assert len(script[(spec.name, "bet")]) == rounds
+        elif rounds >= spec.streak:
+            assert _rounds_until_stop(spec, script) == rounds, spec.name
+
+def test_fixed_length_script_clamps_short_win_streak():
+    from harness.games import KENO
+    assert ms.fixed_length_script([KENO], 1) == {("keno", "bet"): ["win"]}
+
+def test_cursors_are_per_player():
+    out = ms.Outcomes({("keno", "bet"): ["lose", "win"]})
+    assert [out.next("keno", "bet", "a") for _ in range(3)] == ["lose", "win", "lose"]
+    assert out.next("keno", "bet", "b") == "lose"     # b, a'nın imlecini tüketmez
+    out.reset()
+    assert out.next("keno", "bet", "a") == "lose"
+
+def test_seeded_streams_ignore_interleaving():
+    a, b = ms.Outcomes(seed="42"), ms.Outcomes(seed="42")
+    a_dice = [a.next("dice", "bet", "p") for _ in range(20)]
+    for _ in range(20):
+        b.next("limbo", "bet", "p")                    # başka oyun araya girer
+    assert [b.next("dice", "bet", "p") for _ in range(20)] == a_dice
+
+def test_keno_pick_has_no_result():
+    assert ms.Outcomes().next("keno", "pick") is None
@@ -0,0 +1,48 @@
+# tests/test_pool.py
+# -*- coding: utf-8 -*-
+import pytest
+
+from common import user_data
+from harness import pool as pool_mod
+
+class FakeDriver:
+    def __init__(self):
+        self.closed = False
+
+    def quit(self):
+        self.closed = True
+
+@pytest.fixture
+def account_pool(tmp_path, monkeypatch):
+    """Sahte driver'lı, hesap havuzlu DriverPool (Chrome/login yok)."""
+    monkeypatch.setattr(user_data, "ACCOUNTS_DB", str(tmp_path / "accounts.db"))
+    for i in range(3):
+        user_data.add_account(f"u{i}@example.com", f"u{i}", f"pw{i}")
+    monkeypatch.setattr(pool_mod, "make_driver", FakeDriver)
+    monkeypatch.setattr(pool_mod, "login", lambda d, u, p: None)
+    monkeypatch.setattr(pool_mod, "reset_driver", lambda d: None)
+    monkeypatch.setattr(pool_mod, "is_healthy", lambda d: True)
+    p = pool_mod.DriverPool(size=1, max_uses=10, credentials=("x", "y"))
+    p.per_slot_accounts, p.credentials = True, None
+    with p:
+        yield p
+
+def _holder(username):
+    return {r["username"]: r["leased_by"] for r in user_data.list_accounts()}[username]
+
+def test_lease_renews_slot_account(account_pool):
+    (pd,) = account_pool._all.values()
+    with account_pool.lease():
+        assert _holder(pd.account) == account_pool._owner(pd.slot)
+
+def test_lost_account_lease_retires_slot(account_pool):
+    (pd,) = account_pool._all.values()
+    old_driver, old_account = pd.driver, pd.account
+    with user_data._db() as conn:                       # kiralama süresi doldu, başka worker devraldı
+        conn.execute("UPDATE accounts SET leased_by = 'other-worker' WHERE username = ?", (old_account,))
+
+    with account_pool.lease() as driver:
+        assert driver is not old_driver and old_driver.closed
+        (fresh,) = account_pool._all.values()
+        assert fresh.account != old_account
+        assert _holder(old_account) == "other-worker"                          # başkasının kiralaması bozulmadı
@@ -0,0 +1,19 @@
+# tests/test_register.py
+# -*- coding: utf-8 -*-
+import itertools
+
+import register
+
+class FakeDriver:
+    def quit(self):
+        pass
+
+def test_bulk_registration_only_fills_pool(monkeypatch):
+    counter, added = itertools.count(), []
+    monkeypatch.setattr(register, "open_browser", lambda: (FakeDriver(), None))
+    monkeypatch.setattr(register, "register_account",
+                        lambda d: (lambda i: (f"u{i}@example.com", f"u{i}", "pw"))(next(counter)))
+    monkeypatch.setattr(register, "add_account", lambda *creds: added.append(creds[1]))
+    monkeypatch.setattr(register, "save_user_data", lambda *a: (_ for _ in ()).throw(AssertionError("json")))
+    assert register.register_bulk(5, workers=2) == 5
+    assert sorted(added) == [f"u{i}" for i in range(5)]
@@ -0,0 +1,40 @@
+# tests/test_timing.py
+# -*- coding: utf-8 -*-
+import re
+
+import pytest
+
+from common import timing
+
+@pytest.mark.parametrize("p, expected", [(0, 1), (10, 1), (50, 5), (90, 9), (95, 10), (100, 10)])
+def test_percentile_nearest_rank(p, expected):
+    assert timing.percentile(list(range(10, 0, -1)), p) == expected    # girdi sırası önemsiz
+
+def test_percentile_edge_cases():
+    assert timing.percentile([], 50) == 0.0
+    assert timing.percentile([42.5], 95) == 42.5
+
+def test_run_id_unique_within_same_second(monkeypatch):
+    ids = set()
+    for _ in range(200):
+        monkeypatch.delenv("RUN_ID", raising=False)     # her çağrı yeni bir koşu gibi
+        ids.add(timing.run_id())
+    assert len(ids) == 200
+    assert all(re.fullmatch(r"\d{8}_\d{6}_\d{3}_[0-9a-f]{4}", rid) for rid in ids)
+
+def test_run_id_reuses_env(monkeypatch):
+    monkeypatch.setenv("RUN_ID", "fixed")
+    assert timing.run_id() == "fixed"
+
+@pytest.mark.parametrize("ms, bucket", [(0.3, 0.0), (1, 1.0), (1.9, 1.875), (100, 96.0), (127.9, 120.0), (128, 128.0)])
+def test_hist_bucket_lower_bound(ms, bucket):
+    assert timing.hist_bucket(ms) == bucket
+
+def test_hist_bucket_width_within_eighth_of_value():
+    for ms in (3, 17, 250, 999, 4096, 70000):
+        b = timing.hist_bucket(ms)
+        assert b <= ms < b + b / timing.HIST_SUB_BUCKETS + 1e-9
+
+def test_histogram_sorted_counts_skip_empty():
+    assert timing.histogram([100, 0.2, 97, 130, 0.9, 100]) == [[0.0, 2], [96.0, 3], [128.0, 1]]
+    assert timing.histogram([]) == []
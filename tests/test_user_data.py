@@ -0,0 +1,112 @@
+# tests/test_user_data.py
+# -*- coding: utf-8 -*-
+import threading
+import time
+
+import pytest
+
+from common import user_data
+
+@pytest.fixture
+def pool(tmp_path, monkeypatch):
+    """Her test kendi SQLite havuzunu kullanır (proje kökündeki accounts.db'ye dokunulmaz)."""
+    monkeypatch.setattr(user_data, "ACCOUNTS_DB", str(tmp_path / "accounts.db"))
+    monkeypatch.setattr(user_data, "SESSION_FILE", str(tmp_path / "session.json"))
+    for i in range(3):
+        user_data.add_account(f"u{i}@example.com", f"u{i}", f"pw{i}")
+    return user_data
+
+def test_lease_is_exclusive_until_released(pool):
+    got = [pool.lease_account("w1") for _ in range(3)]
+    assert sorted(a["username"] for a in got) == ["u0", "u1", "u2"]
+    assert pool.lease_account("w2") is None
+    assert pool.account_stats() == {"total": 3, "leased": 3}
+    pool.release_account("u1", "w1")
+    assert pool.lease_account("w2")["username"] == "u1"
+
+def test_only_owner_can_release(pool):
+    acc = pool.lease_account("w1")
+    pool.release_account(acc["username"], "intruder")
+    assert pool.account_stats()["leased"] == 1
+
+def test_expired_lease_can_be_taken_over(pool):
+    for _ in range(3):
+        pool.lease_account("crashed", ttl_sec=-1)          # süresi zaten dolmuş kiralama
+    assert pool.account_stats()["leased"] == 0
+    assert pool.lease_account("w2") is not None
+
+def test_least_used_account_first(pool):
+    pool.release_account(pool.lease_account("w1")["username"], "w1")
+    used = {r["username"]: r["uses"] for r in pool.list_accounts()}
+    assert sorted(used.values()) == [0, 0, 1]
+    assert used[pool.lease_account("w1")["username"]] == 0
+
+def test_add_account_updates_existing(pool):
+    pool.add_account("new@example.com", "u0", "changed")
+    assert pool.account_stats()["total"] == 3
+    assert {r["username"]: r["email"] for r in pool.list_accounts()}["u0"] == "new@example.com"
+
+def test_concurrent_leases_never_share_an_account(pool):
+    for i in range(3, 8):
+        pool.add_account(f"u{i}@example.com", f"u{i}", f"pw{i}")
+    got, barrier = [], threading.Barrier(8)
+
+    def worker(n):
+        barrier.wait()
+        got.append(pool.lease_account(f"w{n}"))
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert sorted(a["username"] for a in got) == [f"u{i}" for i in range(8)]
+
+def test_leased_account_releases_and_times_out(pool):
+    with pool.leased_account(timeout=1) as acc:
+        assert acc["username"] == "u0" and pool.account_stats()["leased"] == 1
+    assert pool.account_stats()["leased"] == 0
+    for _ in range(3):
+        pool.lease_account("w1")
+    with pytest.raises(RuntimeError):
+        with pool.leased_account(timeout=0.1, poll=0.05):
+            pass
+
+def test_renew_lease_extends_only_for_owner(pool):
+    acc = pool.lease_account("w1", ttl_sec=-1)              # süresi dolmuş ama henüz kimse almamış
+    assert pool.renew_lease(acc["username"], "w1", ttl_sec=60)
+    assert pool.lease_account("w2", ttl_sec=60)["username"] != acc["username"]
+    assert not pool.renew_lease(acc["username"], "w2")
+
+def test_renew_after_takeover_reports_lost_lease(pool):
+    for _ in range(3):
+        pool.lease_account("w1", ttl_sec=-1)
+    taken = pool.lease_account("w2")["username"]
+    assert not pool.renew_lease(taken, "w1")
+
+def test_explicit_zero_ttl_is_not_the_default(pool):
+    acc = pool.lease_account("w1", ttl_sec=0)
+    assert {r["username"]: r["lease_expires"] for r in pool.list_accounts()}[acc["username"]] <= time.time()
+    assert pool.save_session_snapshot({"username": "u0"}, ttl_sec=0)["expires_at"] <= time.time()
+
+def test_heartbeat_keeps_lease_past_ttl(pool):
+    acc = pool.lease_account("w1", ttl_sec=0.3)
+    with pool.lease_heartbeat(acc["username"], "w1", ttl_sec=0.3) as lost:
+        time.sleep(0.8)
+        assert pool.account_stats()["leased"] == 1 and not lost.is_set()
+    time.sleep(0.4)
+    assert pool.account_stats()["leased"] == 0              # heartbeat bitince kiralama süresi dolar
+
+def test_heartbeat_flags_lost_lease(pool):
+    acc = pool.lease_account("w1", ttl_sec=60)
+    pool.release_account(acc["username"], "w1")
+    with pool.lease_heartbeat(acc["username"], "w1", ttl_sec=0.15) as lost:
+        assert lost.wait(1.0)
+
+def test_save_user_data_does_not_touch_pool(tmp_path, monkeypatch):
+    db = tmp_path / "accounts.db"
+    monkeypatch.setattr(user_data, "ACCOUNTS_DB", str(db))
+    monkeypatch.setattr(user_data, "FILE", str(tmp_path / "test_user_data.json"))
+    user_data.save_user_data("a@example.com", "a", "pw")
+    assert user_data.load_user_data()["username"] == "a"
+    assert not db.exists()